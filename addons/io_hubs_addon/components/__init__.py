@@ -1,4 +1,4 @@
-from . import (handlers, gizmos, components_registry, ui, operators, utils)
+from . import (handlers, gizmos, components_registry, component_index, migration_fingerprint, ui, operators, utils)
 
 
 def register():
@@ -6,6 +6,8 @@ def register():
     handlers.register()
     gizmos.register()
     components_registry.register()
+    component_index.register()
+    migration_fingerprint.register()
     operators.register()
     ui.register()
 
@@ -13,6 +15,8 @@ def register():
 def unregister():
     ui.unregister()
     operators.unregister()
+    migration_fingerprint.unregister()
+    component_index.unregister()
     components_registry.unregister()
     gizmos.unregister()
     handlers.unregister()
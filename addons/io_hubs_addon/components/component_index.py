@@ -0,0 +1,209 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Scene wide index of the component hosts: component name -> host keys.  It is updated by add_component and
+# remove_component, and rebuilt with a single scan of the blend data the first time it is queried after it has been
+# invalidated: on file load, undo and redo, any other change of the undo stack (duplicating, deleting, linking...) and
+# whenever the number of data-blocks that can host components changes.
+# Hosts are stored by name rather than by reference because undo invalidates the Python references to the blend data.
+
+__index = {}
+__is_valid = False
+__data_signature = None
+
+
+def get_host_kind(host):
+    if isinstance(host, (bpy.types.Bone, bpy.types.EditBone)):
+        return 'BONE'
+    elif isinstance(host, bpy.types.Object):
+        return 'OBJECT'
+    elif isinstance(host, bpy.types.Scene):
+        return 'SCENE'
+    return 'MATERIAL'
+
+
+def get_host_key(host):
+    id_data = host.id_data
+    library = id_data.library.filepath if id_data.library else None
+    bone_name = host.name if isinstance(host, (bpy.types.Bone, bpy.types.EditBone)) else None
+    return (get_host_kind(host), id_data.name, library, bone_name)
+
+
+def get_id_collection(kind):
+    if kind == 'OBJECT':
+        return bpy.data.objects
+    elif kind == 'SCENE':
+        return bpy.data.scenes
+    elif kind == 'MATERIAL':
+        return bpy.data.materials
+    return bpy.data.armatures
+
+
+def get_armature_bones(armature):
+    return armature.edit_bones if armature.is_editmode else armature.bones
+
+
+def resolve_host(key):
+    kind, name, library, bone_name = key
+    id_data = get_id_collection(kind).get((name, library))
+    if id_data is None or kind != 'BONE':
+        return id_data
+    return get_armature_bones(id_data).get(bone_name)
+
+
+def get_data_signature():
+    return (len(bpy.data.scenes), len(bpy.data.objects), len(bpy.data.materials), len(bpy.data.armatures),
+            len(bpy.data.libraries))
+
+
+def iter_hosts():
+    yield from bpy.data.scenes
+    yield from bpy.data.objects
+    yield from bpy.data.materials
+    for armature in bpy.data.armatures:
+        yield from get_armature_bones(armature)
+
+
+def rebuild_component_index():
+    global __index
+    global __is_valid
+    global __data_signature
+    __index = {}
+    for host in iter_hosts():
+        component_items = host.hubs_component_list.items
+        if component_items:
+            host_key = get_host_key(host)
+            for component_item in component_items:
+                __index.setdefault(component_item.name, {})[host_key] = None
+
+    __is_valid = True
+    __data_signature = get_data_signature()
+
+
+def ensure_component_index():
+    global __is_valid
+    global __data_signature
+    if not __is_valid or get_data_signature() != __data_signature:
+        rebuild_component_index()
+
+
+def invalidate_component_index():
+    global __is_valid
+    __is_valid = False
+
+
+def add_component_host(component_name, host):
+    global __index
+    global __is_valid
+    if __is_valid:
+        __index.setdefault(component_name, {})[get_host_key(host)] = None
+
+
+def remove_component_host(component_name, host):
+    global __index
+    global __is_valid
+    if __is_valid:
+        __index.get(component_name, {}).pop(get_host_key(host), None)
+
+
+def resolve_component_hosts(component_name):
+    '''Returns the hosts of the component, None if one of them can't be found anymore (e.g. it has been renamed)'''
+    global __index
+    host_keys = __index.get(component_name, {})
+    hosts = []
+    for host_key in list(host_keys):
+        host = resolve_host(host_key)
+        if host is None:
+            return None
+        if component_name in host.hubs_component_list.items:
+            hosts.append(host)
+        else:
+            # The component has been removed without going through remove_component
+            del host_keys[host_key]
+    return hosts
+
+
+def get_component_hosts(component_name):
+    '''Returns the scenes, objects, materials and bones that host the component'''
+    ensure_component_index()
+    hosts = resolve_component_hosts(component_name)
+    if hosts is None:
+        rebuild_component_index()
+        hosts = resolve_component_hosts(component_name) or []
+    return hosts
+
+
+def get_hosts_with_components():
+    '''Returns every scene, object, material and bone that hosts at least one component'''
+    global __index
+    ensure_component_index()
+    hosts = {}
+    for component_name in list(__index):
+        for host in get_component_hosts(component_name):
+            hosts.setdefault(get_host_key(host), host)
+    return list(hosts.values())
+
+
+def find_object(ob, objects):
+    '''Returns the index of the object in a view layer, scene or blend data object collection, -1 if it isn't in it.
+    The object is matched by reference: lookups by name return the first object with that name and linked objects can
+    share the name of a local one.'''
+    index = objects.find(ob.name)
+    if index < 0 or objects[index] == ob:
+        return index
+    return next((i for i, other in enumerate(objects) if other == ob), -1)
+
+
+def is_object_in(ob, objects):
+    return find_object(ob, objects) >= 0
+
+
+def is_object_in_view_layer(ob, view_layer):
+    '''Visible and hidden objects are found in the object hash of the view layer, by reference.  Objects that are
+    disabled in viewports or in a hidden collection look like the ones that aren't in the view layer, they are looked up
+    in its object list.'''
+    if ob.visible_get(view_layer=view_layer) or ob.hide_get(view_layer=view_layer):
+        return True
+    return is_object_in(ob, view_layer.objects)
+
+
+def get_host_objects(hosts, view_layer=None):
+    '''Returns the host objects, only the ones in the view layer if there is one, sorted by name.  Only the hosts are
+    checked so the cost doesn't depend on the number of objects in the file.'''
+    objects = [host for host in hosts if isinstance(host, bpy.types.Object)]
+    if view_layer is not None:
+        objects = [ob for ob in objects if is_object_in_view_layer(ob, view_layer)]
+    objects.sort(key=lambda ob: (ob.library is not None, ob.name_full))
+    return objects
+
+
+@persistent
+def load_post(dummy):
+    invalidate_component_index()
+
+
+@persistent
+def undo_redo_post(dummy):
+    invalidate_component_index()
+
+
+def register():
+    invalidate_component_index()
+
+    if load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(load_post)
+    if undo_redo_post not in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.append(undo_redo_post)
+    if undo_redo_post not in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.append(undo_redo_post)
+
+
+def unregister():
+    if load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post)
+    if undo_redo_post in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(undo_redo_post)
+    if undo_redo_post in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(undo_redo_post)
+
+    invalidate_component_index()
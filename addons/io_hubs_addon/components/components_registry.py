@@ -1,10 +1,11 @@
-from .types import NodeType
+from .types import NodeType, GatherKind
 import bpy
-from bpy.props import BoolProperty, StringProperty, CollectionProperty, PointerProperty
+from bpy.props import BoolProperty, StringProperty, CollectionProperty, PointerProperty, IntVectorProperty
 from bpy.types import PropertyGroup
 
 import importlib
 import inspect
+import json
 import os
 from os.path import join, isfile, isdir, dirname, realpath
 
@@ -22,6 +23,20 @@ class HubsComponentList(PropertyGroup):
     items: CollectionProperty(type=HubsComponentName)
 
 
+class HubsComponentStub(PropertyGroup):
+    # Placeholder type of the component pointers until the component module is loaded.  It keeps the internal
+    # properties so the stored component data can be read the same way.
+    instance_version: IntVectorProperty(size=3)
+
+
+# Manifest of the component definitions so they don't need to be imported when the add-on is registered.  It is
+# regenerated whenever a definition module or the add-on version changes.
+COMPONENT_MANIFEST_FILE_NAME = "component_manifest.json"
+COMPONENT_MANIFEST_VERSION = 2
+# Seconds after registration at which the remaining components are loaded in interactive sessions
+COMPONENT_LOADING_DELAY = 1.0
+
+
 def get_components_in_dir(dir):
     components = []
     for f in os.listdir(dir):
@@ -34,64 +49,188 @@ def get_components_in_dir(dir):
     return sorted(components)
 
 
-def get_component_definitions():
-    components_dir = join(dirname(realpath(__file__)), "definitions")
-    component_module_names = get_components_in_dir(components_dir)
-    return [
-        importlib.import_module(".definitions." + name, package=__package__)
-        for name in component_module_names
-    ]
+def get_definitions_dir():
+    return join(dirname(realpath(__file__)), "definitions")
 
 
-def register_component(component_class):
-    print("Registering component: " + component_class.get_name())
-    bpy.utils.register_class(component_class)
+def get_component_module_names():
+    return get_components_in_dir(get_definitions_dir())
+
+
+def import_component_module(module_name):
+    return importlib.import_module(".definitions." + module_name, package=__package__)
 
-    component_id = component_class.get_id()
-    if component_class.get_node_type() == NodeType.SCENE:
+
+def get_component_definitions():
+    return [import_component_module(name) for name in get_component_module_names()]
+
+
+def get_module_component_classes(module):
+    return [member for _, member in inspect.getmembers(module)
+            if inspect.isclass(member) and issubclass(member, HubsComponent) and module.__name__ == member.__module__]
+
+
+def get_manifest_path():
+    from ..utils import get_prefs_dir_path
+    return join(get_prefs_dir_path(), COMPONENT_MANIFEST_FILE_NAME)
+
+
+def get_manifest_signature(module_names):
+    '''Identifies the definition modules the manifest was generated from'''
+    from .. import bl_info
+    definitions_dir = get_definitions_dir()
+    modules = []
+    for module_name in module_names:
+        stat = os.stat(join(definitions_dir, *module_name.split('.')) + ".py")
+        modules.append([module_name, stat.st_mtime_ns, stat.st_size])
+    return {
+        'version': COMPONENT_MANIFEST_VERSION,
+        'addon_version': list(bl_info['version']),
+        'modules': modules
+    }
+
+
+def get_manifest_entry(module_name, component_class):
+    return {
+        'module': module_name,
+        'name': component_class.get_name(),
+        'id': component_class.get_id(),
+        'node_type': component_class.get_node_type().value,
+        'version': list(component_class.get_definition_version()),
+        'panel_types': [panel_type.value for panel_type in component_class.get_panel_type()]
+    }
+
+
+def load_component_manifest(signature):
+    '''Returns the cached manifest entries, None if there is no manifest or it is out of date'''
+    try:
+        with open(get_manifest_path(), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('signature') != signature:
+        return None
+    return manifest.get('components')
+
+
+def write_component_manifest(signature, entries):
+    try:
+        with open(get_manifest_path(), 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'components': entries}, f)
+    except OSError as e:
+        print(f"Warning: Couldn't write the component manifest: {e}")
+
+
+def is_lazy_loading_enabled():
+    from ..preferences import get_addon_pref
+    try:
+        return get_addon_pref(bpy.context).lazy_component_loading
+    except (KeyError, AttributeError):
+        return True
+
+
+SCALAR_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING'}
+POINTER_GATHER_KINDS = {
+    'Object': GatherKind.NODE,
+    'Material': GatherKind.MATERIAL,
+    'Image': GatherKind.IMAGE,
+    'Texture': GatherKind.TEXTURE,
+}
+
+
+def compile_gather_plan(component_class):
+    '''Precomputes how each of the component properties is exported so the property definitions don't need to be inspected on every gather.
+    Returns an ordered tuple of (property name, gather kind) pairs.'''
+    plan = []
+    for key in component_class.get_properties():
+        property_definition = component_class.bl_rna.properties[key]
+        is_array = getattr(property_definition, 'is_array', None)
+
+        if is_array:
+            subtype = property_definition.subtype
+            if subtype == 'COLOR':
+                kind = GatherKind.COLOR_LINEAR
+            elif subtype.startswith('COLOR'):
+                kind = GatherKind.COLOR_GAMMA
+            elif getattr(property_definition, 'unit', None) == 'NONE' and subtype == 'NONE':
+                kind = GatherKind.VEC_ARRAY
+            else:
+                kind = GatherKind.VEC_XYZ
+
+        elif property_definition.bl_rna.identifier == 'PointerProperty':
+            kind = POINTER_GATHER_KINDS.get(property_definition.fixed_type.identifier, GatherKind.JSON)
+
+        elif property_definition.type in SCALAR_PROPERTY_TYPES or (
+                property_definition.type == 'ENUM' and not property_definition.is_enum_flag):
+            kind = GatherKind.SCALAR
+
+        else:
+            kind = GatherKind.JSON
+
+        plan.append((key, kind))
+
+    return tuple(plan)
+
+
+def set_component_pointers(component_id, node_type, property_group):
+    if node_type == NodeType.SCENE:
         setattr(
             bpy.types.Scene,
             component_id,
-            PointerProperty(type=component_class)
+            PointerProperty(type=property_group)
         )
-    elif component_class.get_node_type() == NodeType.NODE:
+    elif node_type == NodeType.NODE:
         setattr(
             bpy.types.Object,
             component_id,
-            PointerProperty(type=component_class)
+            PointerProperty(type=property_group)
         )
         setattr(
             bpy.types.Bone,
             component_id,
-            PointerProperty(type=component_class)
+            PointerProperty(type=property_group)
         )
         setattr(
             bpy.types.EditBone,
             component_id,
-            PointerProperty(type=component_class)
+            PointerProperty(type=property_group)
         )
-    elif component_class.get_node_type() == NodeType.MATERIAL:
+    elif node_type == NodeType.MATERIAL:
         setattr(
             bpy.types.Material,
             component_id,
-            PointerProperty(type=component_class)
+            PointerProperty(type=property_group)
         )
 
-    from ..io.gltf_exporter import glTF2ExportUserExtension
-    glTF2ExportUserExtension.add_excluded_property(component_class.get_id())
-
 
-def unregister_component(component_class):
-    component_id = component_class.get_id()
-    if component_class.get_node_type() == NodeType.SCENE:
+def del_component_pointers(component_id, node_type):
+    if node_type == NodeType.SCENE:
         delattr(bpy.types.Scene, component_id)
-    elif component_class.get_node_type() == NodeType.NODE:
+    elif node_type == NodeType.NODE:
         delattr(bpy.types.Object, component_id)
         delattr(bpy.types.Bone, component_id)
         delattr(bpy.types.EditBone, component_id)
-    elif component_class.get_node_type() == NodeType.MATERIAL:
+    elif node_type == NodeType.MATERIAL:
         delattr(bpy.types.Material, component_id)
 
+
+def register_component(component_class):
+    print("Registering component: " + component_class.get_name())
+    bpy.utils.register_class(component_class)
+
+    set_component_pointers(component_class.get_id(), component_class.get_node_type(), component_class)
+
+    __gather_plans[component_class] = compile_gather_plan(component_class)
+
+    from ..io.gltf_exporter import glTF2ExportUserExtension
+    glTF2ExportUserExtension.add_excluded_property(component_class.get_id())
+
+
+def unregister_component(component_class):
+    del_component_pointers(component_class.get_id(), component_class.get_node_type())
+
+    __gather_plans.pop(component_class, None)
     bpy.utils.unregister_class(component_class)
 
     from ..io.gltf_exporter import glTF2ExportUserExtension
@@ -100,46 +239,150 @@ def unregister_component(component_class):
     print("Component unregistered: " + component_class.get_name())
 
 
+def register_component_stub(entry):
+    set_component_pointers(entry['id'], NodeType(entry['node_type']), HubsComponentStub)
+
+    from ..io.gltf_exporter import glTF2ExportUserExtension
+    glTF2ExportUserExtension.add_excluded_property(entry['id'])
+
+
+def unregister_component_stub(entry):
+    del_component_pointers(entry['id'], NodeType(entry['node_type']))
+
+    from ..io.gltf_exporter import glTF2ExportUserExtension
+    glTF2ExportUserExtension.remove_excluded_property(entry['id'])
+
+
+def load_component_module(module_name):
+    '''Imports a definitions module and registers its components in place of their stubs'''
+    global __components_registry
+    global __pending_components
+    global __loaded_modules
+    if module_name in __loaded_modules:
+        return []
+    __loaded_modules.append(module_name)
+
+    module = import_component_module(module_name)
+    if hasattr(module, 'register_module'):
+        module.register_module()
+
+    component_classes = get_module_component_classes(module)
+    for component_class in component_classes:
+        # The real pointers replace the stub ones, the stored component data is kept
+        __pending_components.pop(component_class.get_name(), None)
+        register_component(component_class)
+        __components_registry[component_class.get_name()] = component_class
+    return component_classes
+
+
+def load_pending_components():
+    global __components_registry
+    global __pending_components
+    if not __pending_components:
+        return
+    for entry in list(__pending_components.values()):
+        load_component_module(entry['module'])
+    # Keep the order of the definitions directory, regardless of the order the components were first used in
+    __components_registry = dict(
+        sorted(__components_registry.items(), key=lambda item: item[1].__module__))
+
+
 def load_components_registry():
-    """Recurse in the components directory to build the components registry"""
+    """Registers the components from the cached manifest or, if it is out of date, recurses in the components directory to build the components registry"""
     global __components_registry
+    global __pending_components
+    global __loaded_modules
     __components_registry = {}
-    for module in get_component_definitions():
-        for _, member in inspect.getmembers(module):
-            if inspect.isclass(member) and issubclass(member, HubsComponent) and module.__name__ == member.__module__:
-                if hasattr(module, 'register_module'):
-                    module.register_module()
-                register_component(member)
-                __components_registry[member.get_name()] = member
+    __pending_components = {}
+    __loaded_modules = []
+
+    module_names = get_component_module_names()
+    signature = get_manifest_signature(module_names)
+    entries = load_component_manifest(signature) if is_lazy_loading_enabled() else None
+    if entries is not None:
+        # Only the component pointers are registered, the definitions are imported when they are first used
+        for entry in entries:
+            register_component_stub(entry)
+            __pending_components[entry['name']] = entry
+
+        # The components also add operators and menus, they are loaded once the interface is up.  The timer is
+        # persistent so loading a file before it runs (e.g. when opening a file from the command line) doesn't cancel it
+        if not bpy.app.background:
+            bpy.app.timers.register(load_pending_components, first_interval=COMPONENT_LOADING_DELAY, persistent=True)
+        return
+
+    entries = []
+    for module_name in module_names:
+        for component_class in load_component_module(module_name):
+            entries.append(get_manifest_entry(module_name, component_class))
+    write_component_manifest(signature, entries)
 
 
 def unload_components_registry():
-    """Recurse in the components directory to unload the registered components"""
+    """Unregisters the loaded components and the stubs of the pending ones"""
     global __components_registry
+    global __pending_components
+    global __loaded_modules
+    if bpy.app.timers.is_registered(load_pending_components):
+        bpy.app.timers.unregister(load_pending_components)
+
     for _, component_class in __components_registry.items():
         unregister_component(component_class)
-    for module in get_component_definitions():
+    for module_name in __loaded_modules:
+        module = import_component_module(module_name)
         if hasattr(module, 'unregister_module'):
             module.unregister_module()
 
+    for entry in __pending_components.values():
+        unregister_component_stub(entry)
+
+    __pending_components = {}
+    __loaded_modules = []
+
 
 __components_registry = {}
+__pending_components = {}
+__loaded_modules = []
+__gather_plans = {}
 
 
 def get_components_registry():
     global __components_registry
+    load_pending_components()
     return __components_registry
 
 
+def get_component_versions():
+    '''Returns the definition version of every component by name, without loading the pending definitions'''
+    global __components_registry
+    global __pending_components
+    versions = {name: tuple(entry['version']) for name, entry in __pending_components.items()}
+    versions.update((name, tuple(component_class.get_definition_version()))
+                    for name, component_class in __components_registry.items())
+    return versions
+
+
+def get_gather_plan(component_class):
+    global __gather_plans
+    plan = __gather_plans.get(component_class)
+    if plan is None:
+        plan = compile_gather_plan(component_class)
+        __gather_plans[component_class] = plan
+    return plan
+
+
 def get_component_by_name(component_name):
     global __components_registry
-    return next(
-        (component_class for _, component_class in __components_registry.items()
-         if component_class.get_name() == component_name),
-        None)
+    global __pending_components
+    component_class = __components_registry.get(component_name)
+    if component_class is None and component_name in __pending_components:
+        load_component_module(__pending_components[component_name]['module'])
+        component_class = __components_registry.get(component_name)
+    return component_class
 
 
 def register():
+    bpy.utils.register_class(HubsComponentStub)
     load_components_registry()
 
     bpy.utils.register_class(HubsComponentName)
@@ -174,6 +417,7 @@ def unregister():
     glTF2ExportUserExtension.remove_excluded_property("hubs_component_list")
 
     unload_components_registry()
+    bpy.utils.unregister_class(HubsComponentStub)
 
     global __components_registry
     del __components_registry
@@ -1,5 +1,4 @@
-from ..models import directional_light
-from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
+from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos, load_gizmo_shape
 from bpy.props import FloatVectorProperty, FloatProperty, BoolProperty, IntVectorProperty
 from ..hubs_component import HubsComponent
 from ..types import Category, NodeType, PanelType
@@ -58,7 +57,7 @@ class DirectionalLight(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", directional_light.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("directional_light"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
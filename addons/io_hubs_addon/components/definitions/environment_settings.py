@@ -132,6 +132,7 @@ class EnvironmentSettings(HubsComponent):
 
     def gather(self, export_settings, object):
         from ...io.utils import gather_texture_property, gather_color_property
+        from ...io.texture_profiles import USAGE_ENVIRONMENT
         output = {
             'toneMapping': self.toneMapping,
             'toneMappingExposure': self.toneMappingExposure,
@@ -140,12 +141,14 @@ class EnvironmentSettings(HubsComponent):
                 export_settings,
                 object,
                 self,
-                'backgroundTexture'),
+                'backgroundTexture',
+                USAGE_ENVIRONMENT),
             'envMapTexture': gather_texture_property(
                 export_settings,
                 object,
                 self,
-                'envMapTexture')
+                'envMapTexture',
+                USAGE_ENVIRONMENT)
 
         }
 
@@ -1,5 +1,4 @@
-from ..models import image
-from ..gizmos import CustomModelGizmo, bone_matrix_world
+from ..gizmos import CustomModelGizmo, bone_matrix_world, load_gizmo_shape
 from bpy.props import EnumProperty, FloatProperty, StringProperty, BoolProperty
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
@@ -76,7 +75,7 @@ class Image(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", image.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("image"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
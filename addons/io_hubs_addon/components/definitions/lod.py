@@ -0,0 +1,71 @@
+from bpy.props import IntProperty, FloatVectorProperty
+from ..hubs_component import HubsComponent
+from ..types import Category, PanelType, NodeType
+from ...utils import delayed_gather
+
+MAX_LOD_LEVELS = 3
+
+
+class LOD(HubsComponent):
+    _definition = {
+        'name': 'lod',
+        'display_name': 'LOD',
+        'category': Category.OBJECT,
+        'node_type': NodeType.NODE,
+        'panel_type': [PanelType.OBJECT],
+        'icon': 'MOD_DECIM',
+        'version': (1, 0, 0)
+    }
+
+    level_count: IntProperty(
+        name="Levels",
+        description="Number of decimated levels generated on export",
+        default=2,
+        min=1,
+        max=MAX_LOD_LEVELS)
+
+    distances: FloatVectorProperty(
+        name="Distances",
+        description="Distance from the camera at which every level starts to be used",
+        size=MAX_LOD_LEVELS,
+        default=(10.0, 25.0, 50.0),
+        min=0.0,
+        unit='LENGTH')
+
+    ratios: FloatVectorProperty(
+        name="Ratios",
+        description="Ratio of the faces of the mesh that are kept in every level",
+        size=MAX_LOD_LEVELS,
+        default=(0.5, 0.25, 0.1),
+        min=0.01,
+        max=1.0)
+
+    @classmethod
+    def poll(cls, panel_type, host, ob=None):
+        return host.type == 'MESH'
+
+    def get_levels(self):
+        return [(self.distances[i], self.ratios[i]) for i in range(self.level_count)]
+
+    def draw(self, context, layout, panel):
+        layout.prop(data=self, property="level_count")
+        for i in range(self.level_count):
+            col = layout.column(align=True)
+            col.prop(data=self, property="distances", index=i, text=f"LOD {i + 1} Distance")
+            col.prop(data=self, property="ratios", index=i, text=f"LOD {i + 1} Ratio")
+
+        distances = [distance for distance, _ in self.get_levels()]
+        if distances != sorted(distances):
+            col = layout.column()
+            col.alert = True
+            col.label(text='The distances should increase with every level', icon='ERROR')
+
+    @delayed_gather
+    def gather(self, export_settings, object):
+        from ...io.lod import gather_lod_extension
+        distances = [distance for distance, _ in self.get_levels()]
+        ratios = [ratio for _, ratio in self.get_levels()]
+        gather_lod_extension(export_settings, object, distances, ratios)
+        return {
+            'distances': distances
+        }
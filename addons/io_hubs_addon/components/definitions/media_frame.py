@@ -1,8 +1,7 @@
 import bpy
 from bpy.props import EnumProperty, FloatVectorProperty, BoolProperty
 from bpy.types import (Gizmo, Bone, EditBone)
-from ..gizmos import bone_matrix_world
-from ..models import box
+from ..gizmos import bone_matrix_world, load_gizmo_shape
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType, MigrationType
 from ..utils import V_S1, is_linked, get_host_reference_message
@@ -132,7 +131,7 @@ class MediaFrame(HubsComponent):
     @classmethod
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(MediaFrameGizmo.bl_idname)
-        setattr(gizmo, "hubs_gizmo_shape", box.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("box"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
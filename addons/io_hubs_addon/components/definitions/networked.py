@@ -5,6 +5,9 @@ import uuid
 from ..utils import add_component
 import bpy
 
+# Namespace of the deterministic networked ids
+NETWORKED_ID_NAMESPACE = uuid.UUID('c7e2b3f0-f0dc-475e-a028-0c4c2ac48702')
+
 
 class Networked(HubsComponent):
     _definition = {
@@ -16,11 +19,35 @@ class Networked(HubsComponent):
     }
 
     def gather(self, export_settings, object):
+        props = bpy.context.scene.HubsComponentsExtensionProperties
+        if props.networked_ids == 'RANDOM':
+            networked_id = uuid.uuid4()
+        else:
+            networked_id = get_deterministic_id(object, export_settings)
         return {
-            'id': str(uuid.uuid4()).upper()
+            'id': str(networked_id).upper()
         }
 
 
+def get_library_path(id_block):
+    return id_block.library.filepath if id_block.library else ""
+
+
+def get_deterministic_id(host, export_settings):
+    '''Derives the id from the identity of the host: the file, the exported scene, the library the host comes from,
+    and the object, or the armature, armature object and bone, names.  The same host gets the same id on every export.
+    Bones are shared by all the objects of their armature so the armature object being exported is part of their id.'''
+    from os.path import basename, splitext
+    id_block = host.id_data
+    identity = [splitext(basename(bpy.data.filepath))[0], bpy.context.scene.name, get_library_path(id_block), id_block.name]
+    if isinstance(host, bpy.types.Bone):
+        owner = export_settings.get('hubs_joint_owner')
+        if owner is not None:
+            identity.extend([get_library_path(owner), owner.name])
+        identity.append(host.name)
+    return uuid.uuid5(NETWORKED_ID_NAMESPACE, "\n".join(identity))
+
+
 def migrate_networked(host):
     if Networked.get_name() not in host.hubs_component_list.items:
         add_component(host, Networked.get_name())
@@ -2,8 +2,7 @@ from bpy.props import FloatProperty, EnumProperty, FloatVectorProperty, StringPr
 from ..hubs_component import HubsComponent
 from ..types import Category, NodeType, PanelType, MigrationType
 from ..consts import INTERPOLATION_MODES
-from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
-from ..models import particle_emitter
+from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos, load_gizmo_shape
 from ..utils import is_linked, get_host_reference_message
 import bpy
 from mathutils import Vector
@@ -148,7 +147,7 @@ class ParticleEmitter(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", particle_emitter.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("particle_emitter"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
@@ -5,7 +5,7 @@ from bpy.types import Image, PropertyGroup, Operator
 
 from ...components.utils import is_gpu_available, redraw_component_ui, is_linked, update_image_editors
 
-from ..components_registry import get_components_registry
+from ..component_index import get_component_hosts, get_host_objects
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
 from ..ui import add_link_indicator
@@ -60,23 +60,14 @@ def set_resolution(self, value):
 
 def get_probes(all_objects=False, include_locked=False, include_linked=False):
     probes = []
-    objects = bpy.data.objects if all_objects else bpy.context.view_layer.objects
-    for ob in objects:
-        component_list = ob.hubs_component_list
-
-        registered_hubs_components = get_components_registry()
-
-        if component_list.items:
-            for component_item in component_list.items:
-                component_name = component_item.name
-                if component_name in registered_hubs_components:
-                    if component_name == 'reflection-probe':
-                        probe_component = ob.hubs_component_reflection_probe
-                        if is_linked(ob) and not include_linked:
-                            continue
-                        if probe_component.locked and not include_locked:
-                            continue
-                        probes.append(ob)
+    view_layer = None if all_objects else bpy.context.view_layer
+    for ob in get_host_objects(get_component_hosts('reflection-probe'), view_layer):
+        probe_component = ob.hubs_component_reflection_probe
+        if is_linked(ob) and not include_linked:
+            continue
+        if probe_component.locked and not include_locked:
+            continue
+        probes.append(ob)
 
     return probes
 
@@ -744,11 +735,12 @@ class ReflectionProbe(HubsComponent):
 
     def gather(self, export_settings, object):
         from ...io.utils import gather_texture
+        from ...io.texture_profiles import USAGE_REFLECTION_PROBE
         return {
             "size": object.data.influence_distance,
             "envMapTexture": {
                 "__mhc_link_type": "texture",
-                "index": gather_texture(self.envMapTexture, export_settings)
+                "index": gather_texture(self.envMapTexture, export_settings, USAGE_REFLECTION_PROBE)
             }
         }
 
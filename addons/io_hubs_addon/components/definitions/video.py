@@ -1,5 +1,4 @@
-from ..models import video
-from ..gizmos import CustomModelGizmo, bone_matrix_world
+from ..gizmos import CustomModelGizmo, bone_matrix_world, load_gizmo_shape
 from bpy.props import BoolProperty, EnumProperty, StringProperty
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
@@ -63,7 +62,7 @@ class Video(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", video.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("video"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
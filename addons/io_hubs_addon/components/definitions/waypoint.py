@@ -1,5 +1,4 @@
-from ..models import spawn_point
-from ..gizmos import CustomModelGizmo, bone_matrix_world
+from ..gizmos import CustomModelGizmo, bone_matrix_world, load_gizmo_shape
 from ..types import Category, PanelType, NodeType
 from ..hubs_component import HubsComponent
 from bpy.props import BoolProperty
@@ -68,7 +67,7 @@ class Waypoint(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", spawn_point.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", load_gizmo_shape("spawn_point"))
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
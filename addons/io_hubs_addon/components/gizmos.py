@@ -2,9 +2,28 @@ import bpy
 from bpy.types import (Gizmo, GizmoGroup)
 from bpy.props import (IntProperty)
 from .components_registry import get_component_by_name
+from .component_index import get_hosts_with_components, is_object_in
 from bpy.app.handlers import persistent
 from math import radians
 from mathutils import Matrix
+from os.path import join, dirname, realpath
+
+# The gizmo shapes are stored as packed little endian float32 triangle vertices (x, y, z), see scripts/export_gizmo.py
+GIZMO_SHAPES_DIR = join(dirname(realpath(__file__)), "models")
+
+__gizmo_shapes = {}
+
+
+def load_gizmo_shape(name):
+    '''Returns the (vertex count, 3) array of the triangle vertices of a gizmo shape.
+    The shape file is memory mapped the first time the shape is requested and shared by all the gizmos using it.'''
+    global __gizmo_shapes
+    shape = __gizmo_shapes.get(name)
+    if shape is None:
+        import numpy as np
+        shape = np.memmap(join(GIZMO_SHAPES_DIR, name + ".bin"), dtype=np.float32, mode='r').reshape(-1, 3)
+        __gizmo_shapes[name] = shape
+    return shape
 
 
 def gizmo_update(obj, gizmo):
@@ -93,15 +112,25 @@ class HubsGizmoGroup(GizmoGroup):
         # A new instance of the gizmo group is instantiated, and setup is called once for each instance, for each open window.
         self.widgets = {}
 
-        for ob in context.scene.objects:
-            self.add_gizmo(ob, ob, 'OBJECT')
-            if ob.type == 'ARMATURE':
-                if ob.mode == 'EDIT':
-                    for edit_bone in ob.data.edit_bones:
-                        self.add_gizmo(ob, edit_bone, 'BONE')
-                else:
-                    for bone in ob.data.bones:
-                        self.add_gizmo(ob, bone, 'BONE')
+        scene_objects = context.scene.objects
+        armatures = set()
+        for host in get_hosts_with_components():
+            if isinstance(host, bpy.types.Object):
+                if is_object_in(host, scene_objects):
+                    self.add_gizmo(host, host, 'OBJECT')
+            elif isinstance(host, (bpy.types.Bone, bpy.types.EditBone)):
+                armatures.add(host.id_data)
+
+        # Bones only know their armature, their gizmos are added for every object in the scene that uses it
+        if armatures:
+            for ob in scene_objects:
+                if ob.type == 'ARMATURE' and ob.data in armatures:
+                    if ob.mode == 'EDIT':
+                        for edit_bone in ob.data.edit_bones:
+                            self.add_gizmo(ob, edit_bone, 'BONE')
+                    else:
+                        for bone in ob.data.bones:
+                            self.add_gizmo(ob, bone, 'BONE')
 
         if self.widgets:
             HubsGizmoGroup.has_widgets = True
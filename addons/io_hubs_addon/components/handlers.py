@@ -3,6 +3,9 @@ from bpy.app.handlers import persistent
 from .components_registry import get_components_registry
 from .utils import redirect_c_stdout, get_host_components, is_linked, get_host_reference_message
 from .gizmos import update_gizmos
+from .component_index import invalidate_component_index
+from .migration_fingerprint import (
+    load_migration_fingerprints, is_migration_needed, get_components_to_migrate, record_library_component)
 from .types import MigrationType, PanelType
 import io
 import sys
@@ -10,6 +13,8 @@ import traceback
 
 previous_undo_steps_dump = ""
 previous_undo_step_index = 0
+previous_undo_stack_fingerprint = None
+undo_redo_count = 0
 previous_window_setups = []
 file_loading = False
 msgbus_owners = []
@@ -51,9 +56,18 @@ def migrate(component, migration_type, panel_type, host, migration_report, ob=No
     return was_migrated
 
 
+def get_migrated_components(host, migration_filter):
+    component_names = get_components_to_migrate(migration_filter, host)
+    if component_names is None:
+        return get_host_components(host)
+    if not component_names:
+        return []
+    return [component for component in get_host_components(host) if component.get_name() in component_names]
+
+
 def migrate_components(
         migration_type, *, do_beta_versioning=False, do_update_gizmos=True, display_report=True,
-        override_report_title=""):
+        override_report_title="", migration_filter=None):
     migration_report = []
     migrated_linked_components = []
     armature_objects = {}
@@ -64,7 +78,8 @@ def migrate_components(
         display_registration_message |= handle_beta_versioning()
 
     for scene in bpy.data.scenes:
-        for component in get_host_components(scene):
+        for component in get_migrated_components(scene, migration_filter):
+            record_library_component(scene, component)
             try:
                 was_migrated = migrate(
                     component, migration_type, PanelType.SCENE, scene, migration_report)
@@ -82,7 +97,8 @@ def migrate_components(
                 migrated_linked_components.append(component_info)
 
     for ob in bpy.data.objects:
-        for component in get_host_components(ob):
+        for component in get_migrated_components(ob, migration_filter):
+            record_library_component(ob, component)
             try:
                 was_migrated = migrate(
                     component, migration_type, PanelType.OBJECT, ob, migration_report, ob=ob)
@@ -111,7 +127,8 @@ def migrate_components(
     for armature in bpy.data.armatures:
         ob = armature_objects.get(armature.name_full, armature)
         for bone in armature.bones:
-            for component in get_host_components(bone):
+            for component in get_migrated_components(bone, migration_filter):
+                record_library_component(bone, component)
                 try:
                     was_migrated = migrate(
                         component, migration_type, PanelType.BONE, bone, migration_report, ob=ob)
@@ -129,7 +146,8 @@ def migrate_components(
                     migrated_linked_components.append(component_info)
 
     for material in bpy.data.materials:
-        for component in get_host_components(material):
+        for component in get_migrated_components(material, migration_filter):
+            record_library_component(material, component)
             try:
                 was_migrated = migrate(
                     component, migration_type, PanelType.MATERIAL, material, migration_report)
@@ -146,6 +164,8 @@ def migrate_components(
                 component_info = f"{component.get_display_name()} component on material \"{material.name_full}\""
                 migrated_linked_components.append(component_info)
 
+    invalidate_component_index()
+
     if do_update_gizmos:
         update_gizmos()
 
@@ -209,14 +229,19 @@ def handle_beta_versioning():
 def load_post(dummy):
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_stack_fingerprint
     global previous_window_setups
     global file_loading
     previous_undo_steps_dump = ""
     previous_undo_step_index = 0
+    previous_undo_stack_fingerprint = None
     previous_window_setups = []
     file_loading = True
 
-    migrate_components(MigrationType.GLOBAL, do_beta_versioning=True)
+    # Only migrate the components whose definitions changed since the file, or its libraries, were saved
+    migration_filter = load_migration_fingerprints()
+    if is_migration_needed(migration_filter):
+        migrate_components(MigrationType.GLOBAL, do_beta_versioning=True, migration_filter=migration_filter)
     register_msgbus()
 
 
@@ -231,10 +256,45 @@ def find_active_undo_step_index(undo_steps):
     return None
 
 
+@persistent
+def undo_redo_post(dummy):
+    global undo_redo_count
+    undo_redo_count += 1
+
+
+def get_undo_stack_fingerprint(context):
+    '''Cheap stand-in for the undo stack dump that changes whenever the undo stack may have changed: undo steps are pushed by registered operators, undo and redo are counted by their handlers, and linking and appending add data-blocks.'''
+    operators = context.window_manager.operators
+    last_operator = operators[-1] if len(operators) else None
+    return (
+        undo_redo_count,
+        object_data_switched,
+        len(operators),
+        last_operator.as_pointer() if last_operator else 0,
+        len(bpy.data.objects),
+        len(bpy.data.scenes),
+        len(bpy.data.materials),
+        len(bpy.data.libraries),
+    )
+
+
+def dump_undo_steps(context):
+    '''Returns a representation of the undo stack.  This is expensive as it is printed by Blender to the C stdout.'''
+    binary_stream = io.BytesIO()
+
+    with redirect_c_stdout(binary_stream):
+        context.window_manager.print_undo_steps()
+
+    undo_steps_dump = binary_stream.getvalue().decode(sys.stdout.encoding)
+    binary_stream.close()
+    return undo_steps_dump
+
+
 @persistent
 def undo_stack_handler(dummy, depsgraph):
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_stack_fingerprint
     global file_loading
     global object_data_switched
 
@@ -245,14 +305,14 @@ def undo_stack_handler(dummy, depsgraph):
 
         file_loading = False
 
-    # Get a representation of the undo stack.
-    binary_stream = io.BytesIO()
-
-    with redirect_c_stdout(binary_stream):
-        bpy.context.window_manager.print_undo_steps()
+    # Only dump the undo stack if something that can change it has happened since the last time.  Most depsgraph updates (e.g. moving objects around) don't change it.
+    undo_stack_fingerprint = get_undo_stack_fingerprint(bpy.context)
+    if undo_stack_fingerprint == previous_undo_stack_fingerprint:
+        return
+    previous_undo_stack_fingerprint = undo_stack_fingerprint
 
-    undo_steps_dump = binary_stream.getvalue().decode(sys.stdout.encoding)
-    binary_stream.close()
+    # Get a representation of the undo stack.
+    undo_steps_dump = dump_undo_steps(bpy.context)
 
     if undo_steps_dump == previous_undo_steps_dump:
         # The undo stack hasn't changed, so return early.  Note: this prevents modal operators (and anything else) from triggering things repeatedly when nothing has changed.
@@ -315,6 +375,10 @@ def undo_stack_handler(dummy, depsgraph):
     # Handle the active undo step.  Migrations (or anything that modifies blend data) need to be handled here because the undo step in which they occurred holds the unmodified data, so the modifications need to be applied each time it becomes active.
     active_step_name = undo_steps[undo_step_index].split("name=")[-1][1:-1]
 
+    # The component index is kept up to date when components are added or removed, any other step can add, remove or rename hosts.
+    if step_type == 'UNDO' or interim_undo_steps or active_step_name not in {'Add Hubs Component', 'Remove Hubs Component'}:
+        invalidate_component_index()
+
     if step_type == 'DO' and active_step_name in {'Link'}:
         # Components need to be migrated after they are linked, but don't need to be remigrated when returning to the link step, and don't store the migrated values in subsequent undo steps until after they have been made local.
         task_scheduler.add('migrate_components')
@@ -383,9 +447,11 @@ def register_msgbus():
 def register():
     global previous_undo_steps_dump
     global previous_undo_step_index
+    global previous_undo_stack_fingerprint
     global previous_window_setups
     previous_undo_steps_dump = ""
     previous_undo_step_index = 0
+    previous_undo_stack_fingerprint = None
     previous_window_setups = []
 
     if load_post not in bpy.app.handlers.load_post:
@@ -394,6 +460,12 @@ def register():
     if undo_stack_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(undo_stack_handler)
 
+    if undo_redo_post not in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.append(undo_redo_post)
+
+    if undo_redo_post not in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.append(undo_redo_post)
+
     bpy.types.TOPBAR_HT_upper_bar.append(scene_and_view_layer_update_notifier)
 
     register_msgbus()
@@ -408,6 +480,12 @@ def unregister():
     if undo_stack_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(undo_stack_handler)
 
+    if undo_redo_post in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(undo_redo_post)
+
+    if undo_redo_post in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(undo_redo_post)
+
     bpy.types.TOPBAR_HT_upper_bar.remove(scene_and_view_layer_update_notifier)
 
     for owner in msgbus_owners:
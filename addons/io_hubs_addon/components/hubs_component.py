@@ -20,7 +20,10 @@ class HubsComponent(PropertyGroup):
         # Name of the icon to load. It can be a image file in the icons directory or one of the Blender builtin icons id
         'icon': 'icon.png',
         # Version of the component. This will be used to trigger component migrations.
-        'version': (0, 0, 1)
+        'version': (0, 0, 1),
+        # Whether nodes carrying this component can be merged into a GPU instanced node when their data is identical.
+        # Only set this for components that describe how a mesh is rendered and so apply to every instance.
+        'instanceable': False
     }
 
     # Properties defined here are for internal use and won't be displayed by default in components or exported.
@@ -68,6 +71,10 @@ class HubsComponent(PropertyGroup):
     def get_definition_version(cls):
         return cls.__get_definition('version', (0, 0, 0))
 
+    @classmethod
+    def is_instanceable(cls):
+        return cls.__get_definition('instanceable', False)
+
     @classmethod
     def init(cls, obj):
         '''Called right after the component is added to give the component a chance to initialize'''
@@ -0,0 +1,134 @@
+import bpy
+import json
+import os
+from bpy.app.handlers import persistent
+from .components_registry import get_component_versions
+
+# Files store the component definition versions that were in effect when they were saved, so the migration pass that
+# runs when they are loaded only visits the components whose definitions changed since then, or is skipped altogether.
+# Linked data isn't migrated permanently, so every library gets its own fingerprint: the versions of its linked
+# components, recorded when they are migrated and only trusted while the library file is unchanged.
+
+MIGRATION_FINGERPRINT_KEY = 'migration_fingerprint'
+LIBRARY_FINGERPRINTS_KEY = 'library_migration_fingerprints'
+
+# library filepath -> {'mtime': library file mtime, 'versions': {component name: instance version}}
+__library_fingerprints = {}
+
+
+def get_current_fingerprint():
+    return {name: list(version) for name, version in get_component_versions().items()}
+
+
+def get_host_library(host):
+    '''The library the component data of the host comes from, None for local data'''
+    id_data = host.id_data
+    if id_data.override_library and id_data.override_library.reference:
+        return id_data.override_library.reference.library
+    return id_data.library
+
+
+def get_library_mtime(library):
+    try:
+        return os.stat(bpy.path.abspath(library.filepath, library=library.library)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def read_fingerprint(key):
+    '''Reads a fingerprint saved on the local scenes, None if the file doesn't have one'''
+    for scene in bpy.data.scenes:
+        if scene.library:
+            continue
+        value = scene.HubsComponentsExtensionProperties.get(key)
+        if value:
+            try:
+                return json.loads(value)
+            except ValueError:
+                print(f"Warning: Invalid component migration fingerprint in scene \"{scene.name}\"")
+                return None
+    return None
+
+
+def get_stale_components(saved_versions, current_versions):
+    '''Returns the names of the components whose version differs from the saved one, None if nothing was saved'''
+    if saved_versions is None:
+        return None
+    return {name for name, version in saved_versions.items() if list(current_versions.get(name, version)) != version}
+
+
+def load_migration_fingerprints():
+    '''Reads the fingerprints of the loaded file and returns the migration filter: the names of the components to migrate
+    for the local data (None key) and each library (filepath key), None when all of them need to be migrated'''
+    global __library_fingerprints
+    current_versions = get_current_fingerprint()
+    migration_filter = {None: get_stale_components(read_fingerprint(MIGRATION_FINGERPRINT_KEY), current_versions)}
+
+    saved_library_fingerprints = read_fingerprint(LIBRARY_FINGERPRINTS_KEY) or {}
+    __library_fingerprints = {}
+    for library in bpy.data.libraries:
+        mtime = get_library_mtime(library)
+        fingerprint = saved_library_fingerprints.get(library.filepath)
+        if fingerprint and mtime is not None and fingerprint.get('mtime') == mtime:
+            migration_filter[library.filepath] = get_stale_components(fingerprint.get('versions'), current_versions)
+        else:
+            fingerprint = {'mtime': mtime, 'versions': {}}
+            migration_filter[library.filepath] = None
+        __library_fingerprints[library.filepath] = fingerprint
+
+    return migration_filter
+
+
+def is_migration_needed(migration_filter):
+    return any(components is None or components for components in migration_filter.values())
+
+
+def get_components_to_migrate(migration_filter, host):
+    '''Returns the names of the components of the host to migrate, None if all of them need to be migrated'''
+    if migration_filter is None:
+        return None
+    library = get_host_library(host)
+    return migration_filter.get(library.filepath if library else None)
+
+
+def record_library_component(host, component):
+    '''Records the version of a linked component in its library fingerprint.  Must be called before it is migrated.'''
+    global __library_fingerprints
+    library = get_host_library(host)
+    if library is None:
+        return
+    fingerprint = __library_fingerprints.get(library.filepath)
+    if fingerprint is None:
+        fingerprint = {'mtime': get_library_mtime(library), 'versions': {}}
+        __library_fingerprints[library.filepath] = fingerprint
+    fingerprint['versions'][component.get_name()] = list(component.instance_version)
+
+
+@persistent
+def save_pre(dummy):
+    global __library_fingerprints
+    fingerprint = json.dumps(get_current_fingerprint(), sort_keys=True)
+    library_paths = {library.filepath for library in bpy.data.libraries}
+    library_fingerprints = json.dumps(
+        {path: library_fingerprint for path, library_fingerprint in __library_fingerprints.items()
+         if path in library_paths},
+        sort_keys=True)
+    for scene in bpy.data.scenes:
+        if scene.library:
+            continue
+        extension_properties = scene.HubsComponentsExtensionProperties
+        extension_properties[MIGRATION_FINGERPRINT_KEY] = fingerprint
+        extension_properties[LIBRARY_FINGERPRINTS_KEY] = library_fingerprints
+
+
+def register():
+    global __library_fingerprints
+    __library_fingerprints = {}
+
+    if save_pre not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(save_pre)
+
+
+def unregister():
+    if save_pre in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(save_pre)
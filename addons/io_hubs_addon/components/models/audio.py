@@ -1 +0,0 @@
-SHAPE = ((-0.500000, 0.000000, -0.362840),(0.500000, 0.000000, -0.362840),(0.500000, 0.000000, 0.362840),(-0.500000, 0.000000, -0.362840),(0.500000, 0.000000, 0.362840),(-0.500000, 0.000000, 0.362840),(0.228459, -0.095301, 0.228459),(0.128507, -0.080516, 0.310241),(0.123642, -0.095301, 0.298496),(0.298496, -0.095301, 0.123641),(0.237449, -0.080516, 0.237448),(0.228459, -0.095301, 0.228459),(0.323090, -0.095301, 0.000000),(0.310242, -0.080516, 0.128506),(0.298496, -0.095301, 0.123641),(0.298496, -0.095301, -0.123641),(0.335803, -0.080516, 0.000000),(0.323090, -0.095301, 0.000000),(0.298496, -0.095301, -0.123641),(0.237449, -0.080516, -0.237448),(0.310242, -0.080516, -0.128506),(0.228459, -0.095301, -0.228458),(0.128507, -0.080516, -0.310241),(0.237449, -0.080516, -0.237448),(0.123642, -0.095301, -0.298495),(0.000001, -0.080516, -0.335802),(0.128507, -0.080516, -0.310241),(0.000001, -0.095301, -0.323089),(-0.128505, -0.080516, -0.310241),(0.000001, -0.080516, -0.335802),(-0.228458, -0.095301, -0.228458),(-0.128505, -0.080516, -0.310241),(-0.123640, -0.095301, -0.298495),(-0.298495, -0.095301, -0.123641),(-0.237447, -0.080516, -0.237448),(-0.228458, -0.095301, -0.228458),(-0.298495, -0.095301, -0.123641),(-0.335801, -0.080516, 0.000000),(-0.310240, -0.080516, -0.128506),(-0.298495, -0.095301, 0.123641),(-0.335801, -0.080516, 0.000000),(-0.323088, -0.095301, 0.000000),(-0.228458, -0.095301, 0.228459),(-0.310240, -0.080516, 0.128506),(-0.298495, -0.095301, 0.123641),(-0.123640, -0.095301, 0.298496),(-0.237447, -0.080516, 0.237448),(-0.228458, -0.095301, 0.228459),(0.000001, -0.095301, 0.323089),(-0.128505, -0.080516, 0.310241),(-0.123640, -0.095301, 0.298496),(-0.196763, -0.067532, 0.196764),(-0.076460, 0.000000, 0.184591),(-0.106487, -0.067532, 0.257084),(0.000001, -0.067532, -0.278266),(0.076460, 0.000000, -0.184591),(0.000000, 0.000000, -0.199800),(0.000001, -0.067532, 0.278266),(0.076460, 0.000000, 0.184591),(0.106488, -0.067532, 0.257084),(-0.106487, -0.067532, 0.257084),(0.000000, 0.000000, 0.199800),(0.000001, -0.067532, 0.278266),(-0.106487, -0.067532, -0.257084),(0.000000, 0.000000, -0.199800),(-0.076460, 0.000000, -0.184591),(0.106488, -0.067532, 0.257084),(0.141280, 0.000000, 0.141280),(0.196764, -0.067532, 0.196764),(-0.196763, -0.067532, -0.196764),(-0.076460, 0.000000, -0.184591),(-0.141280, 0.000000, -0.141280),(0.196764, -0.067532, 0.196764),(0.184591, 0.000000, 0.076460),(0.257085, -0.067532, 0.106488),(-0.257084, -0.067532, -0.106488),(-0.141280, 0.000000, -0.141280),(-0.184591, 0.000000, -0.076460),(0.257085, -0.067532, 0.106488),(0.199800, 0.000000, 0.000000),(0.278266, -0.067532, 0.000000),(-0.257084, -0.067532, -0.106488),(-0.199800, 0.000000, 0.000000),(-0.278265, -0.067532, 0.000000),(0.257085, -0.067532, -0.106488),(0.199800, 0.000000, 0.000000),(0.184591, 0.000000, -0.076460),(-0.278265, -0.067532, 0.000000),(-0.184591, 0.000000, 0.076460),(-0.257084, -0.067532, 0.106488),(0.196764, -0.067532, -0.196764),(0.184591, 0.000000, -0.076460),(0.141280, 0.000000, -0.141280),(-0.257084, -0.067532, 0.106488),(-0.141280, 0.000000, 0.141280),(-0.196763, -0.067532, 0.196764),(-0.128505, -0.080516, 0.310241),(0.000000, -0.000000, 0.236914),(-0.090663, 0.000000, 0.218880),(-0.237447, -0.080516, 0.237448),(-0.090663, 0.000000, 0.218880),(-0.167523, 0.000000, 0.167523),(-0.310240, -0.080516, 0.128506),(-0.167523, 0.000000, 0.167523),(-0.218879, 0.000000, 0.090663),(-0.335801, -0.080516, 0.000000),(-0.218879, 0.000000, 0.090663),(-0.236913, 0.000000, 0.000000),(-0.218879, 0.000000, -0.090663),(-0.335801, -0.080516, 0.000000),(-0.236913, 0.000000, 0.000000),(-0.167523, 0.000000, -0.167523),(-0.310240, -0.080516, -0.128506),(-0.218879, 0.000000, -0.090663),(-0.090663, 0.000000, -0.218879),(-0.237447, -0.080516, -0.237448),(-0.167523, 0.000000, -0.167523),(0.000000, 0.000000, -0.236913),(-0.128505, -0.080516, -0.310241),(-0.090663, 0.000000, -0.218879),(0.090663, 0.000000, -0.218879),(0.000001, -0.080516, -0.335802),(0.000000, 0.000000, -0.236913),(0.167523, 0.000000, -0.167523),(0.128507, -0.080516, -0.310241),(0.090663, 0.000000, -0.218879),(0.218880, 0.000000, -0.090663),(0.237449, -0.080516, -0.237448),(0.167523, 0.000000, -0.167523),(0.236914, 0.000000, 0.000000),(0.310242, -0.080516, -0.128506),(0.218880, 0.000000, -0.090663),(0.310242, -0.080516, 0.128506),(0.236914, 0.000000, 0.000000),(0.218880, 0.000000, 0.090663),(0.237449, -0.080516, 0.237448),(0.218880, 0.000000, 0.090663),(0.167523, 0.000000, 0.167523),(0.128507, -0.080516, 0.310241),(0.167523, 0.000000, 0.167523),(0.090663, 0.000000, 0.218880),(0.000001, -0.080516, 0.335802),(0.090663, 0.000000, 0.218880),(0.000000, -0.000000, 0.236914),(0.123642, -0.095301, -0.298495),(0.211498, -0.082967, -0.211497),(0.114462, -0.082967, -0.276334),(-0.298495, -0.095301, 0.123641),(-0.211496, -0.082967, 0.211497),(-0.228458, -0.095301, 0.228459),(0.228459, -0.095301, -0.228458),(0.276335, -0.082967, -0.114461),(0.211498, -0.082967, -0.211497),(-0.323088, -0.095301, 0.000000),(-0.276333, -0.082967, 0.114461),(-0.298495, -0.095301, 0.123641),(0.298496, -0.095301, -0.123641),(0.299102, -0.082967, 0.000000),(0.276335, -0.082967, -0.114461),(-0.298495, -0.095301, -0.123641),(-0.299101, -0.082967, 0.000000),(-0.323088, -0.095301, 0.000000),(0.298496, -0.095301, 0.123641),(0.299102, -0.082967, 0.000000),(0.323090, -0.095301, 0.000000),(-0.228458, -0.095301, -0.228458),(-0.276333, -0.082967, -0.114461),(-0.298495, -0.095301, -0.123641),(0.228459, -0.095301, 0.228459),(0.276335, -0.082967, 0.114461),(0.298496, -0.095301, 0.123641),(-0.123640, -0.095301, -0.298495),(-0.211496, -0.082967, -0.211497),(-0.228458, -0.095301, -0.228458),(0.123642, -0.095301, 0.298496),(0.211498, -0.082967, 0.211497),(0.228459, -0.095301, 0.228459),(0.000001, -0.095301, -0.323089),(-0.114461, -0.082967, -0.276334),(-0.123640, -0.095301, -0.298495),(-0.123640, -0.095301, 0.298496),(0.000001, -0.082967, 0.299102),(0.000001, -0.095301, 0.323089),(0.000001, -0.095301, 0.323089),(0.114462, -0.082967, 0.276334),(0.123642, -0.095301, 0.298496),(0.000001, -0.095301, -0.323089),(0.114462, -0.082967, -0.276334),(0.000001, -0.082967, -0.299102),(-0.228458, -0.095301, 0.228459),(-0.114461, -0.082967, 0.276334),(-0.123640, -0.095301, 0.298496),(0.362201, -0.107929, -0.150028),(0.348407, -0.107762, -0.069303),(0.387390, -0.108020, -0.077057),(-0.348405, -0.107762, -0.069303),(-0.362199, -0.107929, -0.150028),(-0.387388, -0.108020, -0.077057),(0.277329, -0.107941, 0.277148),(0.195801, -0.107931, 0.295860),(0.219479, -0.108088, 0.328575),(-0.195798, -0.107931, 0.295860),(-0.277327, -0.107941, 0.277148),(-0.219477, -0.108088, 0.328575),(0.277329, -0.107941, -0.277148),(0.295367, -0.107762, -0.197358),(0.328413, -0.108020, -0.219438),(-0.348405, -0.107762, 0.069302),(-0.392041, -0.107929, -0.000000),(-0.387388, -0.108020, 0.077056),(-0.295365, -0.107762, -0.197358),(-0.277327, -0.107941, -0.277148),(-0.328411, -0.108020, -0.219438),(0.392043, -0.107929, -0.000000),(0.348407, -0.107762, 0.069302),(0.387390, -0.108020, 0.077056),(-0.295365, -0.107762, 0.197358),(-0.362199, -0.107929, 0.150028),(-0.328411, -0.108020, 0.219438),(0.362201, -0.107929, 0.150028),(0.295367, -0.107762, 0.197358),(0.328413, -0.108020, 0.219438),(0.252395, -0.145456, -0.382567),(0.354805, -0.145454, -0.354519),(0.280016, -0.145617, -0.420616),(-0.449813, -0.145227, -0.089474),(-0.463371, -0.145448, -0.191935),(-0.495566, -0.145548, -0.098575),(0.449816, -0.145227, -0.089474),(0.501553, -0.145448, -0.000000),(0.495569, -0.145548, -0.098575),(-0.252392, -0.145456, 0.382567),(-0.354802, -0.145454, 0.354519),(-0.280013, -0.145617, 0.420616),(0.381338, -0.145226, 0.254800),(0.354805, -0.145454, 0.354519),(0.420123, -0.145548, 0.280717),(-0.449813, -0.145227, 0.089473),(-0.501550, -0.145448, -0.000000),(-0.495566, -0.145548, 0.098574),(0.381338, -0.145226, -0.254800),(0.463374, -0.145448, -0.191935),(0.420123, -0.145548, -0.280717),(-0.381335, -0.145226, -0.254800),(-0.354802, -0.145454, -0.354520),(-0.420120, -0.145548, -0.280717),(0.449816, -0.145227, 0.089473),(0.463374, -0.145448, 0.191935),(0.495569, -0.145548, 0.098574),(-0.381335, -0.145226, 0.254800),(-0.463371, -0.145448, 0.191935),(-0.420120, -0.145548, 0.280717),(0.354805, -0.145454, 0.354519),(0.252395, -0.145456, 0.382567),(0.280016, -0.145617, 0.420616),(-0.354802, -0.145454, 0.354519),(-0.381335, -0.145226, 0.254800),(-0.420120, -0.145548, 0.280717),(0.501553, -0.145448, -0.000000),(0.449816, -0.145227, 0.089473),(0.495569, -0.145548, 0.098574),(-0.463371, -0.145448, -0.191935),(-0.381335, -0.145226, -0.254800),(-0.420120, -0.145548, -0.280717),(0.354805, -0.145454, -0.354519),(0.381338, -0.145226, -0.254800),(0.420123, -0.145548, -0.280717),(-0.463371, -0.145448, 0.191935),(-0.449813, -0.145227, 0.089473),(-0.495566, -0.145548, 0.098574),(0.463374, -0.145448, 0.191935),(0.381338, -0.145226, 0.254800),(0.420123, -0.145548, 0.280717),(-0.354802, -0.145454, -0.354520),(-0.252392, -0.145456, -0.382567),(-0.280013, -0.145617, -0.420616),(0.463374, -0.145448, -0.191935),(0.449816, -0.145227, -0.089474),(0.495569, -0.145548, -0.098575),(-0.501550, -0.145448, -0.000000),(-0.449813, -0.145227, -0.089474),(-0.495566, -0.145548, -0.098575),(-0.277327, -0.107941, 0.277148),(-0.295365, -0.107762, 0.197358),(-0.328411, -0.108020, 0.219438),(-0.362199, -0.107929, -0.150028),(-0.295365, -0.107762, -0.197358),(-0.328411, -0.108020, -0.219438),(-0.362199, -0.107929, 0.150028),(-0.348405, -0.107762, 0.069302),(-0.387388, -0.108020, 0.077056),(-0.277327, -0.107941, -0.277148),(-0.195798, -0.107931, -0.295861),(-0.219477, -0.108088, -0.328576),(-0.392041, -0.107929, -0.000000),(-0.348405, -0.107762, -0.069303),(-0.387388, -0.108020, -0.077057),(0.277329, -0.107941, 0.277148),(0.295367, -0.107762, 0.197358),(0.249662, -0.107816, 0.249649),(0.362201, -0.107929, -0.150028),(0.295367, -0.107762, -0.197358),(0.326163, -0.107826, -0.135101),(0.362201, -0.107929, 0.150028),(0.348407, -0.107762, 0.069302),(0.326163, -0.107826, 0.135101),(0.277329, -0.107941, -0.277148),(0.195801, -0.107931, -0.295861),(0.249662, -0.107816, -0.249649),(0.392043, -0.107929, -0.000000),(0.348407, -0.107762, -0.069303),(0.353036, -0.107826, -0.000000),(0.219479, -0.108088, -0.328576),(0.185681, -0.112150, -0.314268),(0.195801, -0.107931, -0.295861),(0.280016, -0.145617, 0.420616),(0.242157, -0.149913, 0.402607),(0.257907, -0.150086, 0.424342),(0.219479, -0.108088, 0.328575),(0.185681, -0.112150, 0.314268),(0.199198, -0.112320, 0.332804),(0.280016, -0.145617, -0.420616),(0.242157, -0.149913, -0.402608),(0.252395, -0.145456, -0.382567),(-0.219477, -0.108088, 0.328575),(-0.185679, -0.112150, 0.314268),(-0.195798, -0.107931, 0.295860),(-0.219477, -0.108088, -0.328576),(-0.185679, -0.112150, -0.314268),(-0.199196, -0.112320, -0.332804),(-0.280013, -0.145617, 0.420616),(-0.242153, -0.149913, 0.402607),(-0.252392, -0.145456, 0.382567),(-0.280013, -0.145617, -0.420616),(-0.242154, -0.149913, -0.402608),(-0.257904, -0.150086, -0.424342),(-0.002862, 0.000000, 0.066096),(-0.027207, 0.000000, 0.116094),(-0.027207, 0.000000, -0.031918),(0.000001, -0.080516, 0.335802),(0.123642, -0.095301, 0.298496),(0.128507, -0.080516, 0.310241),(0.106488, -0.067532, -0.257084),(0.141280, 0.000000, -0.141280),(0.076460, 0.000000, -0.184591),(-0.027207, 0.000000, -0.031918),(-0.043270, 0.000000, -0.025400),(-0.002768, 0.000000, -0.084581),(-0.043270, 0.000000, -0.025400),(-0.059014, 0.000000, -0.022269),(-0.080924, 0.000000, -0.026627),(-0.099498, 0.000000, -0.039038),(-0.043270, 0.000000, -0.025400),(-0.080924, 0.000000, -0.026627),(-0.099498, 0.000000, -0.039038),(-0.111909, 0.000000, -0.057612),(-0.043270, 0.000000, -0.025400),(-0.111909, 0.000000, -0.057612),(-0.116267, 0.000000, -0.079521),(-0.043270, 0.000000, -0.025400),(-0.116267, 0.000000, -0.079521),(-0.111909, 0.000000, -0.101431),(-0.043270, 0.000000, -0.025400),(-0.111909, 0.000000, -0.101431),(-0.099498, 0.000000, -0.120005),(-0.043270, 0.000000, -0.025400),(-0.099498, 0.000000, -0.120005),(-0.080924, 0.000000, -0.132416),(-0.002768, 0.000000, -0.084581),(-0.080924, 0.000000, -0.132416),(-0.059014, 0.000000, -0.136774),(-0.002768, 0.000000, -0.084581),(-0.059014, 0.000000, -0.136774),(-0.037105, 0.000000, -0.132416),(-0.002768, 0.000000, -0.084581),(-0.037105, 0.000000, -0.132416),(-0.018531, 0.000000, -0.120005),(-0.002768, 0.000000, -0.084581),(-0.018531, 0.000000, -0.120005),(-0.006120, 0.000000, -0.101431),(-0.002768, 0.000000, -0.084581),(-0.002862, 0.000000, 0.066096),(0.097449, 0.000000, 0.052513),(0.097449, 0.000000, 0.130106),(-0.002768, 0.000000, -0.084581),(-0.002862, 0.000000, 0.066096),(-0.027207, 0.000000, -0.031918),(-0.002862, 0.000000, 0.066096),(0.097449, 0.000000, 0.130106),(-0.027207, 0.000000, 0.116094),(-0.043270, 0.000000, -0.025400),(-0.099498, 0.000000, -0.120005),(-0.002768, 0.000000, -0.084581),(0.228459, -0.095301, 0.228459),(0.237449, -0.080516, 0.237448),(0.128507, -0.080516, 0.310241),(0.298496, -0.095301, 0.123641),(0.310242, -0.080516, 0.128506),(0.237449, -0.080516, 0.237448),(0.323090, -0.095301, 0.000000),(0.335803, -0.080516, 0.000000),(0.310242, -0.080516, 0.128506),(0.298496, -0.095301, -0.123641),(0.310242, -0.080516, -0.128506),(0.335803, -0.080516, 0.000000),(0.298496, -0.095301, -0.123641),(0.228459, -0.095301, -0.228458),(0.237449, -0.080516, -0.237448),(0.228459, -0.095301, -0.228458),(0.123642, -0.095301, -0.298495),(0.128507, -0.080516, -0.310241),(0.123642, -0.095301, -0.298495),(0.000001, -0.095301, -0.323089),(0.000001, -0.080516, -0.335802),(0.000001, -0.095301, -0.323089),(-0.123640, -0.095301, -0.298495),(-0.128505, -0.080516, -0.310241),(-0.228458, -0.095301, -0.228458),(-0.237447, -0.080516, -0.237448),(-0.128505, -0.080516, -0.310241),(-0.298495, -0.095301, -0.123641),(-0.310240, -0.080516, -0.128506),(-0.237447, -0.080516, -0.237448),(-0.298495, -0.095301, -0.123641),(-0.323088, -0.095301, 0.000000),(-0.335801, -0.080516, 0.000000),(-0.298495, -0.095301, 0.123641),(-0.310240, -0.080516, 0.128506),(-0.335801, -0.080516, 0.000000),(-0.228458, -0.095301, 0.228459),(-0.237447, -0.080516, 0.237448),(-0.310240, -0.080516, 0.128506),(-0.123640, -0.095301, 0.298496),(-0.128505, -0.080516, 0.310241),(-0.237447, -0.080516, 0.237448),(0.000001, -0.095301, 0.323089),(0.000001, -0.080516, 0.335802),(-0.128505, -0.080516, 0.310241),(-0.196763, -0.067532, 0.196764),(-0.141280, 0.000000, 0.141280),(-0.076460, 0.000000, 0.184591),(0.000001, -0.067532, -0.278266),(0.106488, -0.067532, -0.257084),(0.076460, 0.000000, -0.184591),(0.000001, -0.067532, 0.278266),(0.000000, 0.000000, 0.199800),(0.076460, 0.000000, 0.184591),(-0.106487, -0.067532, 0.257084),(-0.076460, 0.000000, 0.184591),(0.000000, 0.000000, 0.199800),(-0.106487, -0.067532, -0.257084),(0.000001, -0.067532, -0.278266),(0.000000, 0.000000, -0.199800),(0.106488, -0.067532, 0.257084),(0.076460, 0.000000, 0.184591),(0.141280, 0.000000, 0.141280),(-0.196763, -0.067532, -0.196764),(-0.106487, -0.067532, -0.257084),(-0.076460, 0.000000, -0.184591),(0.196764, -0.067532, 0.196764),(0.141280, 0.000000, 0.141280),(0.184591, 0.000000, 0.076460),(-0.257084, -0.067532, -0.106488),(-0.196763, -0.067532, -0.196764),(-0.141280, 0.000000, -0.141280),(0.257085, -0.067532, 0.106488),(0.184591, 0.000000, 0.076460),(0.199800, 0.000000, 0.000000),(-0.257084, -0.067532, -0.106488),(-0.184591, 0.000000, -0.076460),(-0.199800, 0.000000, 0.000000),(0.257085, -0.067532, -0.106488),(0.278266, -0.067532, 0.000000),(0.199800, 0.000000, 0.000000),(-0.278265, -0.067532, 0.000000),(-0.199800, 0.000000, 0.000000),(-0.184591, 0.000000, 0.076460),(0.196764, -0.067532, -0.196764),(0.257085, -0.067532, -0.106488),(0.184591, 0.000000, -0.076460),(-0.257084, -0.067532, 0.106488),(-0.184591, 0.000000, 0.076460),(-0.141280, 0.000000, 0.141280),(-0.128505, -0.080516, 0.310241),(0.000001, -0.080516, 0.335802),(0.000000, -0.000000, 0.236914),(-0.237447, -0.080516, 0.237448),(-0.128505, -0.080516, 0.310241),(-0.090663, 0.000000, 0.218880),(-0.310240, -0.080516, 0.128506),(-0.237447, -0.080516, 0.237448),(-0.167523, 0.000000, 0.167523),(-0.335801, -0.080516, 0.000000),(-0.310240, -0.080516, 0.128506),(-0.218879, 0.000000, 0.090663),(-0.218879, 0.000000, -0.090663),(-0.310240, -0.080516, -0.128506),(-0.335801, -0.080516, 0.000000),(-0.167523, 0.000000, -0.167523),(-0.237447, -0.080516, -0.237448),(-0.310240, -0.080516, -0.128506),(-0.090663, 0.000000, -0.218879),(-0.128505, -0.080516, -0.310241),(-0.237447, -0.080516, -0.237448),(0.000000, 0.000000, -0.236913),(0.000001, -0.080516, -0.335802),(-0.128505, -0.080516, -0.310241),(0.090663, 0.000000, -0.218879),(0.128507, -0.080516, -0.310241),(0.000001, -0.080516, -0.335802),(0.167523, 0.000000, -0.167523),(0.237449, -0.080516, -0.237448),(0.128507, -0.080516, -0.310241),(0.218880, 0.000000, -0.090663),(0.310242, -0.080516, -0.128506),(0.237449, -0.080516, -0.237448),(0.236914, 0.000000, 0.000000),(0.335803, -0.080516, 0.000000),(0.310242, -0.080516, -0.128506),(0.310242, -0.080516, 0.128506),(0.335803, -0.080516, 0.000000),(0.236914, 0.000000, 0.000000),(0.237449, -0.080516, 0.237448),(0.310242, -0.080516, 0.128506),(0.218880, 0.000000, 0.090663),(0.128507, -0.080516, 0.310241),(0.237449, -0.080516, 0.237448),(0.167523, 0.000000, 0.167523),(0.000001, -0.080516, 0.335802),(0.128507, -0.080516, 0.310241),(0.090663, 0.000000, 0.218880),(0.123642, -0.095301, -0.298495),(0.228459, -0.095301, -0.228458),(0.211498, -0.082967, -0.211497),(-0.298495, -0.095301, 0.123641),(-0.276333, -0.082967, 0.114461),(-0.211496, -0.082967, 0.211497),(0.228459, -0.095301, -0.228458),(0.298496, -0.095301, -0.123641),(0.276335, -0.082967, -0.114461),(-0.323088, -0.095301, 0.000000),(-0.299101, -0.082967, 0.000000),(-0.276333, -0.082967, 0.114461),(0.298496, -0.095301, -0.123641),(0.323090, -0.095301, 0.000000),(0.299102, -0.082967, 0.000000),(-0.298495, -0.095301, -0.123641),(-0.276333, -0.082967, -0.114461),(-0.299101, -0.082967, 0.000000),(0.298496, -0.095301, 0.123641),(0.276335, -0.082967, 0.114461),(0.299102, -0.082967, 0.000000),(-0.228458, -0.095301, -0.228458),(-0.211496, -0.082967, -0.211497),(-0.276333, -0.082967, -0.114461),(0.228459, -0.095301, 0.228459),(0.211498, -0.082967, 0.211497),(0.276335, -0.082967, 0.114461),(-0.123640, -0.095301, -0.298495),(-0.114461, -0.082967, -0.276334),(-0.211496, -0.082967, -0.211497),(0.123642, -0.095301, 0.298496),(0.114462, -0.082967, 0.276334),(0.211498, -0.082967, 0.211497),(0.000001, -0.095301, -0.323089),(0.000001, -0.082967, -0.299102),(-0.114461, -0.082967, -0.276334),(-0.123640, -0.095301, 0.298496),(-0.114461, -0.082967, 0.276334),(0.000001, -0.082967, 0.299102),(0.000001, -0.095301, 0.323089),(0.000001, -0.082967, 0.299102),(0.114462, -0.082967, 0.276334),(0.000001, -0.095301, -0.323089),(0.123642, -0.095301, -0.298495),(0.114462, -0.082967, -0.276334),(-0.228458, -0.095301, 0.228459),(-0.211496, -0.082967, 0.211497),(-0.114461, -0.082967, 0.276334),(0.362201, -0.107929, -0.150028),(0.326163, -0.107826, -0.135101),(0.348407, -0.107762, -0.069303),(-0.348405, -0.107762, -0.069303),(-0.326161, -0.107826, -0.135101),(-0.362199, -0.107929, -0.150028),(0.277329, -0.107941, 0.277148),(0.249662, -0.107816, 0.249649),(0.195801, -0.107931, 0.295860),(-0.195798, -0.107931, 0.295860),(-0.249660, -0.107816, 0.249649),(-0.277327, -0.107941, 0.277148),(0.277329, -0.107941, -0.277148),(0.249662, -0.107816, -0.249649),(0.295367, -0.107762, -0.197358),(-0.348405, -0.107762, 0.069302),(-0.353034, -0.107826, -0.000000),(-0.392041, -0.107929, -0.000000),(-0.295365, -0.107762, -0.197358),(-0.249660, -0.107816, -0.249649),(-0.277327, -0.107941, -0.277148),(0.392043, -0.107929, -0.000000),(0.353036, -0.107826, -0.000000),(0.348407, -0.107762, 0.069302),(-0.295365, -0.107762, 0.197358),(-0.326161, -0.107826, 0.135101),(-0.362199, -0.107929, 0.150028),(0.362201, -0.107929, 0.150028),(0.326163, -0.107826, 0.135101),(0.295367, -0.107762, 0.197358),(0.252395, -0.145456, -0.382567),(0.322367, -0.145291, -0.322310),(0.354805, -0.145454, -0.354519),(-0.449813, -0.145227, -0.089474),(-0.421138, -0.145297, -0.174442),(-0.463371, -0.145448, -0.191935),(0.449816, -0.145227, -0.089474),(0.455839, -0.145297, -0.000000),(0.501553, -0.145448, -0.000000),(-0.252392, -0.145456, 0.382567),(-0.322364, -0.145291, 0.322310),(-0.354802, -0.145454, 0.354519),(0.381338, -0.145226, 0.254800),(0.322367, -0.145291, 0.322310),(0.354805, -0.145454, 0.354519),(-0.449813, -0.145227, 0.089473),(-0.455836, -0.145297, -0.000000),(-0.501550, -0.145448, -0.000000),(0.381338, -0.145226, -0.254800),(0.421140, -0.145297, -0.174442),(0.463374, -0.145448, -0.191935),(-0.381335, -0.145226, -0.254800),(-0.322364, -0.145291, -0.322310),(-0.354802, -0.145454, -0.354520),(0.449816, -0.145227, 0.089473),(0.421140, -0.145297, 0.174441),(0.463374, -0.145448, 0.191935),(-0.381335, -0.145226, 0.254800),(-0.421138, -0.145297, 0.174441),(-0.463371, -0.145448, 0.191935),(0.354805, -0.145454, 0.354519),(0.322367, -0.145291, 0.322310),(0.252395, -0.145456, 0.382567),(-0.354802, -0.145454, 0.354519),(-0.322364, -0.145291, 0.322310),(-0.381335, -0.145226, 0.254800),(0.501553, -0.145448, -0.000000),(0.455839, -0.145297, -0.000000),(0.449816, -0.145227, 0.089473),(-0.463371, -0.145448, -0.191935),(-0.421138, -0.145297, -0.174442),(-0.381335, -0.145226, -0.254800),(0.354805, -0.145454, -0.354519),(0.322367, -0.145291, -0.322310),(0.381338, -0.145226, -0.254800),(-0.463371, -0.145448, 0.191935),(-0.421138, -0.145297, 0.174441),(-0.449813, -0.145227, 0.089473),(0.463374, -0.145448, 0.191935),(0.421140, -0.145297, 0.174441),(0.381338, -0.145226, 0.254800),(-0.354802, -0.145454, -0.354520),(-0.322364, -0.145291, -0.322310),(-0.252392, -0.145456, -0.382567),(0.463374, -0.145448, -0.191935),(0.421140, -0.145297, -0.174442),(0.449816, -0.145227, -0.089474),(-0.501550, -0.145448, -0.000000),(-0.455836, -0.145297, -0.000000),(-0.449813, -0.145227, -0.089474),(-0.277327, -0.107941, 0.277148),(-0.249660, -0.107816, 0.249649),(-0.295365, -0.107762, 0.197358),(-0.362199, -0.107929, -0.150028),(-0.326161, -0.107826, -0.135101),(-0.295365, -0.107762, -0.197358),(-0.362199, -0.107929, 0.150028),(-0.326161, -0.107826, 0.135101),(-0.348405, -0.107762, 0.069302),(-0.277327, -0.107941, -0.277148),(-0.249660, -0.107816, -0.249649),(-0.195798, -0.107931, -0.295861),(-0.392041, -0.107929, -0.000000),(-0.353034, -0.107826, -0.000000),(-0.348405, -0.107762, -0.069303),(0.277329, -0.107941, 0.277148),(0.328413, -0.108020, 0.219438),(0.295367, -0.107762, 0.197358),(0.362201, -0.107929, -0.150028),(0.328413, -0.108020, -0.219438),(0.295367, -0.107762, -0.197358),(0.362201, -0.107929, 0.150028),(0.387390, -0.108020, 0.077056),(0.348407, -0.107762, 0.069302),(0.277329, -0.107941, -0.277148),(0.219479, -0.108088, -0.328576),(0.195801, -0.107931, -0.295861),(0.392043, -0.107929, -0.000000),(0.387390, -0.108020, -0.077057),(0.348407, -0.107762, -0.069303),(0.219479, -0.108088, -0.328576),(0.199198, -0.112320, -0.332804),(0.185681, -0.112150, -0.314268),(0.280016, -0.145617, 0.420616),(0.252395, -0.145456, 0.382567),(0.242157, -0.149913, 0.402607),(0.219479, -0.108088, 0.328575),(0.195801, -0.107931, 0.295860),(0.185681, -0.112150, 0.314268),(0.280016, -0.145617, -0.420616),(0.257907, -0.150086, -0.424342),(0.242157, -0.149913, -0.402608),(-0.219477, -0.108088, 0.328575),(-0.199196, -0.112320, 0.332804),(-0.185679, -0.112150, 0.314268),(-0.219477, -0.108088, -0.328576),(-0.195798, -0.107931, -0.295861),(-0.185679, -0.112150, -0.314268),(-0.280013, -0.145617, 0.420616),(-0.257904, -0.150086, 0.424342),(-0.242153, -0.149913, 0.402607),(-0.280013, -0.145617, -0.420616),(-0.252392, -0.145456, -0.382567),(-0.242154, -0.149913, -0.402608),(0.000001, -0.080516, 0.335802),(0.000001, -0.095301, 0.323089),(0.123642, -0.095301, 0.298496),(0.106488, -0.067532, -0.257084),(0.196764, -0.067532, -0.196764),(0.141280, 0.000000, -0.141280),)
\ No newline at end of file
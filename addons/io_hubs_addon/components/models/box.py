@@ -1 +0,0 @@
-SHAPE = ((0.500000, 0.500000, 0.500000),(-0.500000, 0.500000, 0.500000),(-0.475000, 0.475000, 0.500000),(0.500000, 0.500000, 0.500000),(-0.475000, 0.475000, 0.500000),(0.475000, 0.475000, 0.500000),(-0.500000, 0.500000, 0.500000),(-0.500000, -0.500000, 0.500000),(-0.475000, -0.475000, 0.500000),(-0.500000, 0.500000, 0.500000),(-0.475000, -0.475000, 0.500000),(-0.475000, 0.475000, 0.500000),(-0.500000, -0.500000, 0.500000),(0.500000, -0.500000, 0.500000),(0.475000, -0.475000, 0.500000),(-0.500000, -0.500000, 0.500000),(0.475000, -0.475000, 0.500000),(-0.475000, -0.475000, 0.500000),(0.500000, -0.500000, 0.500000),(0.500000, 0.500000, 0.500000),(0.475000, 0.475000, 0.500000),(0.500000, -0.500000, 0.500000),(0.475000, 0.475000, 0.500000),(0.475000, -0.475000, 0.500000),(0.500000, -0.500000, -0.500000),(0.500000, -0.500000, 0.500000),(0.475000, -0.500000, 0.475000),(0.500000, -0.500000, -0.500000),(0.475000, -0.500000, 0.475000),(0.475000, -0.500000, -0.475000),(0.500000, -0.500000, 0.500000),(-0.500000, -0.500000, 0.500000),(-0.475000, -0.500000, 0.475000),(0.500000, -0.500000, 0.500000),(-0.475000, -0.500000, 0.475000),(0.475000, -0.500000, 0.475000),(-0.500000, -0.500000, 0.500000),(-0.500000, -0.500000, -0.500000),(-0.475000, -0.500000, -0.475000),(-0.500000, -0.500000, 0.500000),(-0.475000, -0.500000, -0.475000),(-0.475000, -0.500000, 0.475000),(-0.500000, -0.500000, -0.500000),(0.500000, -0.500000, -0.500000),(0.475000, -0.500000, -0.475000),(-0.500000, -0.500000, -0.500000),(0.475000, -0.500000, -0.475000),(-0.475000, -0.500000, -0.475000),(-0.500000, -0.500000, -0.500000),(-0.500000, -0.500000, 0.500000),(-0.500000, -0.475000, 0.475000),(-0.500000, -0.500000, -0.500000),(-0.500000, -0.475000, 0.475000),(-0.500000, -0.475000, -0.475000),(-0.500000, -0.500000, 0.500000),(-0.500000, 0.500000, 0.500000),(-0.500000, 0.475000, 0.475000),(-0.500000, -0.500000, 0.500000),(-0.500000, 0.475000, 0.475000),(-0.500000, -0.475000, 0.475000),(-0.500000, 0.500000, 0.500000),(-0.500000, 0.500000, -0.500000),(-0.500000, 0.475000, -0.475000),(-0.500000, 0.500000, 0.500000),(-0.500000, 0.475000, -0.475000),(-0.500000, 0.475000, 0.475000),(-0.500000, 0.500000, -0.500000),(-0.500000, -0.500000, -0.500000),(-0.500000, -0.475000, -0.475000),(-0.500000, 0.500000, -0.500000),(-0.500000, -0.475000, -0.475000),(-0.500000, 0.475000, -0.475000),(-0.500000, 0.500000, -0.500000),(0.500000, 0.500000, -0.500000),(0.475000, 0.475000, -0.500000),(-0.500000, 0.500000, -0.500000),(0.475000, 0.475000, -0.500000),(-0.475000, 0.475000, -0.500000),(0.500000, 0.500000, -0.500000),(0.500000, -0.500000, -0.500000),(0.475000, -0.475000, -0.500000),(0.500000, 0.500000, -0.500000),(0.475000, -0.475000, -0.500000),(0.475000, 0.475000, -0.500000),(0.500000, -0.500000, -0.500000),(-0.500000, -0.500000, -0.500000),(-0.475000, -0.475000, -0.500000),(0.500000, -0.500000, -0.500000),(-0.475000, -0.475000, -0.500000),(0.475000, -0.475000, -0.500000),(-0.500000, -0.500000, -0.500000),(-0.500000, 0.500000, -0.500000),(-0.475000, 0.475000, -0.500000),(-0.500000, -0.500000, -0.500000),(-0.475000, 0.475000, -0.500000),(-0.475000, -0.475000, -0.500000),(0.500000, 0.500000, -0.500000),(0.500000, 0.500000, 0.500000),(0.500000, 0.475000, 0.475000),(0.500000, 0.500000, -0.500000),(0.500000, 0.475000, 0.475000),(0.500000, 0.475000, -0.475000),(0.500000, 0.500000, 0.500000),(0.500000, -0.500000, 0.500000),(0.500000, -0.475000, 0.475000),(0.500000, 0.500000, 0.500000),(0.500000, -0.475000, 0.475000),(0.500000, 0.475000, 0.475000),(0.500000, -0.500000, 0.500000),(0.500000, -0.500000, -0.500000),(0.500000, -0.475000, -0.475000),(0.500000, -0.500000, 0.500000),(0.500000, -0.475000, -0.475000),(0.500000, -0.475000, 0.475000),(0.500000, -0.500000, -0.500000),(0.500000, 0.500000, -0.500000),(0.500000, 0.475000, -0.475000),(0.500000, -0.500000, -0.500000),(0.500000, 0.475000, -0.475000),(0.500000, -0.475000, -0.475000),(-0.500000, 0.500000, -0.500000),(-0.500000, 0.500000, 0.500000),(-0.475000, 0.500000, 0.475000),(-0.500000, 0.500000, -0.500000),(-0.475000, 0.500000, 0.475000),(-0.475000, 0.500000, -0.475000),(-0.500000, 0.500000, 0.500000),(0.500000, 0.500000, 0.500000),(0.475000, 0.500000, 0.475000),(-0.500000, 0.500000, 0.500000),(0.475000, 0.500000, 0.475000),(-0.475000, 0.500000, 0.475000),(0.500000, 0.500000, 0.500000),(0.500000, 0.500000, -0.500000),(0.475000, 0.500000, -0.475000),(0.500000, 0.500000, 0.500000),(0.475000, 0.500000, -0.475000),(0.475000, 0.500000, 0.475000),(0.500000, 0.500000, -0.500000),(-0.500000, 0.500000, -0.500000),(-0.475000, 0.500000, -0.475000),(0.500000, 0.500000, -0.500000),(-0.475000, 0.500000, -0.475000),(0.475000, 0.500000, -0.475000),(-0.500000, 0.475000, -0.475000),(-0.475000, 0.475000, -0.475000),(-0.475000, 0.475000, 0.475000),(-0.500000, 0.475000, -0.475000),(-0.475000, 0.475000, 0.475000),(-0.500000, 0.475000, 0.475000),(-0.500000, 0.475000, 0.475000),(-0.475000, 0.475000, 0.475000),(-0.475000, -0.475000, 0.475000),(-0.500000, 0.475000, 0.475000),(-0.475000, -0.475000, 0.475000),(-0.500000, -0.475000, 0.475000),(-0.500000, -0.475000, 0.475000),(-0.475000, -0.475000, 0.475000),(-0.475000, -0.475000, -0.475000),(-0.500000, -0.475000, 0.475000),(-0.475000, -0.475000, -0.475000),(-0.500000, -0.475000, -0.475000),(-0.500000, -0.475000, -0.475000),(-0.475000, -0.475000, -0.475000),(-0.475000, 0.475000, -0.475000),(-0.500000, -0.475000, -0.475000),(-0.475000, 0.475000, -0.475000),(-0.500000, 0.475000, -0.475000),(-0.475000, -0.475000, 0.500000),(0.475000, -0.475000, 0.500000),(0.475000, -0.475000, 0.475000),(-0.475000, -0.475000, 0.500000),(0.475000, -0.475000, 0.475000),(-0.475000, -0.475000, 0.475000),(0.475000, -0.475000, 0.500000),(0.475000, 0.475000, 0.500000),(0.475000, 0.475000, 0.475000),(0.475000, -0.475000, 0.500000),(0.475000, 0.475000, 0.475000),(0.475000, -0.475000, 0.475000),(0.475000, 0.475000, 0.500000),(-0.475000, 0.475000, 0.500000),(-0.475000, 0.475000, 0.475000),(0.475000, 0.475000, 0.500000),(-0.475000, 0.475000, 0.475000),(0.475000, 0.475000, 0.475000),(-0.475000, 0.475000, 0.500000),(-0.475000, -0.475000, 0.500000),(-0.475000, -0.475000, 0.475000),(-0.475000, 0.475000, 0.500000),(-0.475000, -0.475000, 0.475000),(-0.475000, 0.475000, 0.475000),(0.475000, 0.475000, -0.500000),(0.475000, 0.475000, -0.475000),(-0.475000, 0.475000, -0.475000),(0.475000, 0.475000, -0.500000),(-0.475000, 0.475000, -0.475000),(-0.475000, 0.475000, -0.500000),(-0.475000, 0.475000, -0.500000),(-0.475000, 0.475000, -0.475000),(-0.475000, -0.475000, -0.475000),(-0.475000, 0.475000, -0.500000),(-0.475000, -0.475000, -0.475000),(-0.475000, -0.475000, -0.500000),(-0.475000, -0.475000, -0.500000),(-0.475000, -0.475000, -0.475000),(0.475000, -0.475000, -0.475000),(-0.475000, -0.475000, -0.500000),(0.475000, -0.475000, -0.475000),(0.475000, -0.475000, -0.500000),(0.475000, -0.475000, -0.500000),(0.475000, -0.475000, -0.475000),(0.475000, 0.475000, -0.475000),(0.475000, -0.475000, -0.500000),(0.475000, 0.475000, -0.475000),(0.475000, 0.475000, -0.500000),(-0.475000, -0.500000, -0.475000),(-0.475000, -0.475000, -0.475000),(-0.475000, -0.475000, 0.475000),(-0.475000, -0.500000, -0.475000),(-0.475000, -0.475000, 0.475000),(-0.475000, -0.500000, 0.475000),(-0.475000, -0.500000, 0.475000),(-0.475000, -0.475000, 0.475000),(0.475000, -0.475000, 0.475000),(-0.475000, -0.500000, 0.475000),(0.475000, -0.475000, 0.475000),(0.475000, -0.500000, 0.475000),(0.475000, -0.500000, 0.475000),(0.475000, -0.475000, 0.475000),(0.475000, -0.475000, -0.475000),(0.475000, -0.500000, 0.475000),(0.475000, -0.475000, -0.475000),(0.475000, -0.500000, -0.475000),(0.475000, -0.500000, -0.475000),(0.475000, -0.475000, -0.475000),(-0.475000, -0.475000, -0.475000),(0.475000, -0.500000, -0.475000),(-0.475000, -0.475000, -0.475000),(-0.475000, -0.500000, -0.475000),(0.475000, 0.500000, -0.475000),(0.475000, 0.475000, -0.475000),(0.475000, 0.475000, 0.475000),(0.475000, 0.500000, -0.475000),(0.475000, 0.475000, 0.475000),(0.475000, 0.500000, 0.475000),(0.475000, 0.500000, 0.475000),(0.475000, 0.475000, 0.475000),(-0.475000, 0.475000, 0.475000),(0.475000, 0.500000, 0.475000),(-0.475000, 0.475000, 0.475000),(-0.475000, 0.500000, 0.475000),(-0.475000, 0.500000, 0.475000),(-0.475000, 0.475000, 0.475000),(-0.475000, 0.475000, -0.475000),(-0.475000, 0.500000, 0.475000),(-0.475000, 0.475000, -0.475000),(-0.475000, 0.500000, -0.475000),(-0.475000, 0.500000, -0.475000),(-0.475000, 0.475000, -0.475000),(0.475000, 0.475000, -0.475000),(-0.475000, 0.500000, -0.475000),(0.475000, 0.475000, -0.475000),(0.475000, 0.500000, -0.475000),(0.500000, 0.475000, -0.475000),(0.500000, 0.475000, 0.475000),(0.475000, 0.475000, 0.475000),(0.500000, 0.475000, -0.475000),(0.475000, 0.475000, 0.475000),(0.475000, 0.475000, -0.475000),(0.500000, 0.475000, 0.475000),(0.500000, -0.475000, 0.475000),(0.475000, -0.475000, 0.475000),(0.500000, 0.475000, 0.475000),(0.475000, -0.475000, 0.475000),(0.475000, 0.475000, 0.475000),(0.500000, -0.475000, 0.475000),(0.500000, -0.475000, -0.475000),(0.475000, -0.475000, -0.475000),(0.500000, -0.475000, 0.475000),(0.475000, -0.475000, -0.475000),(0.475000, -0.475000, 0.475000),(0.500000, -0.475000, -0.475000),(0.500000, 0.475000, -0.475000),(0.475000, 0.475000, -0.475000),(0.500000, -0.475000, -0.475000),(0.475000, 0.475000, -0.475000),(0.475000, -0.475000, -0.475000),)
\ No newline at end of file
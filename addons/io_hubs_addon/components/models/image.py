@@ -1 +0,0 @@
-SHAPE = ((0.179200, -0.003164, 0.143934),(-0.379381, -0.003164, 0.218799),(0.374179, -0.003164, 0.218799),(0.176258, -0.003164, 0.053778),(-0.042987, -0.003164, 0.049414),(0.152390, -0.003164, 0.064234),(0.374179, -0.003164, -0.227073),(0.224317, -0.003164, 0.064234),(0.374179, -0.003164, 0.218799),(0.374179, -0.003164, -0.227073),(0.203420, -0.003164, 0.053778),(0.224317, -0.003164, 0.064234),(-0.042987, -0.003164, 0.049414),(0.176258, -0.003164, 0.053778),(0.255820, -0.003164, -0.227073),(0.255820, -0.003164, -0.227073),(0.203420, -0.003164, 0.053778),(0.374179, -0.003164, -0.227073),(0.176258, -0.003164, 0.053778),(0.203420, -0.003164, 0.053778),(0.255820, -0.003164, -0.227073),(0.152390, -0.003164, 0.064234),(-0.042987, -0.003164, 0.049414),(0.140885, -0.003164, 0.085722),(-0.379381, -0.003164, 0.218799),(-0.185834, -0.003164, -0.056347),(-0.379381, -0.003164, -0.227073),(-0.379381, -0.003164, -0.227073),(-0.185834, -0.003164, -0.056347),(-0.245138, -0.003164, -0.227073),(-0.185834, -0.003164, -0.056347),(-0.042987, -0.003164, 0.049414),(-0.115578, -0.003164, -0.121322),(0.240318, -0.003164, 0.085722),(0.374179, -0.003164, 0.218799),(0.224317, -0.003164, 0.064234),(0.240318, -0.003164, 0.110617),(0.374179, -0.003164, 0.218799),(0.240318, -0.003164, 0.085722),(-0.379381, -0.003164, 0.218799),(-0.042987, -0.003164, 0.049414),(-0.185834, -0.003164, -0.056347),(-0.042987, -0.003164, 0.049414),(0.141931, -0.003164, 0.110617),(0.140885, -0.003164, 0.085722),(-0.042987, -0.003164, 0.049414),(0.155332, -0.003164, 0.133878),(0.141931, -0.003164, 0.110617),(0.227260, -0.003164, 0.133878),(0.374179, -0.003164, 0.218799),(0.240318, -0.003164, 0.110617),(0.206362, -0.003164, 0.143301),(0.374179, -0.003164, 0.218799),(0.227260, -0.003164, 0.133878),(-0.379381, -0.003164, 0.218799),(0.155332, -0.003164, 0.133878),(-0.042987, -0.003164, 0.049414),(0.179200, -0.003164, 0.143934),(0.374179, -0.003164, 0.218799),(0.206362, -0.003164, 0.143301),(-0.379381, -0.003164, 0.218799),(0.179200, -0.003164, 0.143934),(0.155332, -0.003164, 0.133878),(0.172613, -0.005452, 0.169954),(0.374179, -0.005452, 0.218799),(-0.379381, -0.005452, 0.218799),(0.374179, -0.005452, -0.227073),(0.374179, -0.005452, 0.218799),(0.243650, -0.005452, 0.044467),(0.374179, -0.005452, -0.227073),(0.243650, -0.005452, 0.044467),(0.210748, -0.005452, 0.028005),(0.336084, -0.005452, -0.227073),(0.374179, -0.005452, -0.227073),(0.210748, -0.005452, 0.028005),(0.167981, -0.005452, 0.028005),(0.336084, -0.005452, -0.227073),(0.210748, -0.005452, 0.028005),(0.130400, -0.005452, 0.044467),(0.112286, -0.005452, 0.078300),(-0.059786, -0.005452, 0.136211),(-0.379381, -0.005452, 0.218799),(-0.379381, -0.005452, -0.227073),(-0.212899, -0.005452, 0.046316),(-0.379381, -0.005452, -0.227073),(-0.313268, -0.005452, -0.227073),(-0.212899, -0.005452, 0.046316),(-0.212899, -0.005452, 0.046316),(-0.128645, -0.005452, -0.037325),(-0.059786, -0.005452, 0.136211),(0.268843, -0.005452, 0.078300),(0.243650, -0.005452, 0.044467),(0.374179, -0.005452, 0.218799),(0.268843, -0.005452, 0.117497),(0.268843, -0.005452, 0.078300),(0.374179, -0.005452, 0.218799),(-0.379381, -0.005452, 0.218799),(-0.212899, -0.005452, 0.046316),(-0.059786, -0.005452, 0.136211),(-0.059786, -0.005452, 0.136211),(0.112286, -0.005452, 0.078300),(0.113934, -0.005452, 0.117497),(-0.059786, -0.005452, 0.136211),(0.113934, -0.005452, 0.117497),(0.135032, -0.005452, 0.154122),(0.248282, -0.005452, 0.154122),(0.268843, -0.005452, 0.117497),(0.374179, -0.005452, 0.218799),(0.215379, -0.005452, 0.168957),(0.248282, -0.005452, 0.154122),(0.374179, -0.005452, 0.218799),(-0.379381, -0.005452, 0.218799),(-0.059786, -0.005452, 0.136211),(0.135032, -0.005452, 0.154122),(0.172613, -0.005452, 0.169954),(0.215379, -0.005452, 0.168957),(0.374179, -0.005452, 0.218799),(-0.379381, -0.005452, 0.218799),(0.135032, -0.005452, 0.154122),(0.172613, -0.005452, 0.169954),(0.501103, 0.000000, -0.325349),(0.501103, -0.000000, 0.325349),(0.433878, -0.000000, 0.269627),(-0.501103, -0.000000, 0.325349),(-0.501103, 0.000000, -0.325349),(-0.433878, 0.000000, -0.269627),(0.433878, -0.000000, 0.269627),(0.501103, -0.000000, 0.325349),(-0.501103, -0.000000, 0.325349),(-0.433878, 0.000000, -0.269627),(-0.501103, 0.000000, -0.325349),(0.501103, 0.000000, -0.325349),(0.336084, -0.005452, -0.227073),(0.130400, -0.005452, 0.044467),(-0.059786, -0.005452, 0.136211),(0.336084, -0.005452, -0.227073),(0.167981, -0.005452, 0.028005),(0.130400, -0.005452, 0.044467),(0.501103, 0.000000, -0.325349),(0.433878, -0.000000, 0.269627),(0.433878, 0.000000, -0.269627),(-0.501103, -0.000000, 0.325349),(-0.433878, 0.000000, -0.269627),(-0.433878, -0.000000, 0.269627),(0.433878, -0.000000, 0.269627),(-0.501103, -0.000000, 0.325349),(-0.433878, -0.000000, 0.269627),(-0.433878, 0.000000, -0.269627),(0.501103, 0.000000, -0.325349),(0.433878, 0.000000, -0.269627),)
\ No newline at end of file
@@ -1 +0,0 @@
-SHAPE = ((0.000000, -0.014454, 0.006692),(-0.939086, -1.070925, 0.495799),(-0.952800, -1.077091, 0.493699),(0.000000, -0.014454, 0.006692),(-0.952800, -1.077091, 0.493699),(0.000000, -0.010000, 0.000000),(-0.939086, -1.070925, 0.495799),(0.000000, -0.014454, 0.006692),(-0.000000, 0.010000, 0.000000),(-0.939086, -1.070925, 0.495799),(-0.000000, 0.010000, 0.000000),(-0.967200, -1.082909, 0.506301),(-0.939086, -1.070925, 0.495799),(0.939086, -1.070925, 0.495799),(0.952800, -1.077091, 0.493699),(-0.939086, -1.070925, 0.495799),(0.952800, -1.077091, 0.493699),(-0.952800, -1.077091, 0.493699),(0.939086, -1.070925, 0.495799),(-0.939086, -1.070925, 0.495799),(-0.967200, -1.082909, 0.506301),(0.939086, -1.070925, 0.495799),(-0.967200, -1.082909, 0.506301),(0.967200, -1.082909, 0.506301),(0.939086, -1.070925, 0.495799),(0.000000, -0.014454, 0.006692),(0.000000, -0.010000, 0.000000),(0.939086, -1.070925, 0.495799),(0.000000, -0.010000, 0.000000),(0.952800, -1.077091, 0.493699),(0.000000, -0.014454, 0.006692),(0.939086, -1.070925, 0.495799),(0.967200, -1.082909, 0.506301),(0.000000, -0.014454, 0.006692),(0.967200, -1.082909, 0.506301),(-0.000000, 0.010000, 0.000000),(0.950000, -1.080000, -0.490000),(0.950000, -1.080000, 0.490000),(0.952800, -1.077091, 0.493699),(0.950000, -1.080000, -0.490000),(0.952800, -1.077091, 0.493699),(0.952800, -1.077091, -0.493699),(0.950000, -1.080000, 0.490000),(0.950000, -1.080000, -0.490000),(0.967200, -1.082909, -0.506301),(0.950000, -1.080000, 0.490000),(0.967200, -1.082909, -0.506301),(0.967200, -1.082909, 0.506301),(0.950000, -1.080000, 0.490000),(-0.950000, -1.080000, 0.490000),(-0.952800, -1.077091, 0.493699),(0.950000, -1.080000, 0.490000),(-0.952800, -1.077091, 0.493699),(0.952800, -1.077091, 0.493699),(-0.950000, -1.080000, 0.490000),(0.950000, -1.080000, 0.490000),(0.967200, -1.082909, 0.506301),(-0.950000, -1.080000, 0.490000),(0.967200, -1.082909, 0.506301),(-0.967200, -1.082909, 0.506301),(-0.950000, -1.080000, 0.490000),(-0.950000, -1.080000, -0.490000),(-0.952800, -1.077091, -0.493699),(-0.950000, -1.080000, 0.490000),(-0.952800, -1.077091, -0.493699),(-0.952800, -1.077091, 0.493699),(-0.950000, -1.080000, -0.490000),(-0.950000, -1.080000, 0.490000),(-0.967200, -1.082909, 0.506301),(-0.950000, -1.080000, -0.490000),(-0.967200, -1.082909, 0.506301),(-0.967200, -1.082909, -0.506301),(-0.950000, -1.080000, -0.490000),(0.950000, -1.080000, -0.490000),(0.952800, -1.077091, -0.493699),(-0.950000, -1.080000, -0.490000),(0.952800, -1.077091, -0.493699),(-0.952800, -1.077091, -0.493699),(0.950000, -1.080000, -0.490000),(-0.950000, -1.080000, -0.490000),(-0.967200, -1.082909, -0.506301),(0.950000, -1.080000, -0.490000),(-0.967200, -1.082909, -0.506301),(0.967200, -1.082909, -0.506301),(-0.953356, -1.072526, -0.485958),(-0.953356, -1.072526, 0.485958),(-0.952800, -1.077091, 0.493699),(-0.953356, -1.072526, -0.485958),(-0.952800, -1.077091, 0.493699),(-0.952800, -1.077091, -0.493699),(-0.953356, -1.072526, 0.485958),(-0.953356, -1.072526, -0.485958),(-0.967200, -1.082909, -0.506301),(-0.953356, -1.072526, 0.485958),(-0.967200, -1.082909, -0.506301),(-0.967200, -1.082909, 0.506301),(-0.953356, -1.072526, 0.485958),(-0.020317, -0.022857, 0.000000),(0.000000, -0.010000, 0.000000),(-0.953356, -1.072526, 0.485958),(0.000000, -0.010000, 0.000000),(-0.952800, -1.077091, 0.493699),(-0.020317, -0.022857, 0.000000),(-0.953356, -1.072526, 0.485958),(-0.967200, -1.082909, 0.506301),(-0.020317, -0.022857, 0.000000),(-0.967200, -1.082909, 0.506301),(-0.000000, 0.010000, 0.000000),(-0.020317, -0.022857, 0.000000),(-0.953356, -1.072526, -0.485958),(-0.952800, -1.077091, -0.493699),(-0.020317, -0.022857, 0.000000),(-0.952800, -1.077091, -0.493699),(0.000000, -0.010000, 0.000000),(-0.953356, -1.072526, -0.485958),(-0.020317, -0.022857, 0.000000),(-0.000000, 0.010000, 0.000000),(-0.953356, -1.072526, -0.485958),(-0.000000, 0.010000, 0.000000),(-0.967200, -1.082909, -0.506301),(0.000000, -0.014454, -0.006692),(0.939086, -1.070925, -0.495799),(0.952800, -1.077091, -0.493699),(0.000000, -0.014454, -0.006692),(0.952800, -1.077091, -0.493699),(0.000000, -0.010000, 0.000000),(0.939086, -1.070925, -0.495799),(0.000000, -0.014454, -0.006692),(-0.000000, 0.010000, 0.000000),(0.939086, -1.070925, -0.495799),(-0.000000, 0.010000, 0.000000),(0.967200, -1.082909, -0.506301),(0.939086, -1.070925, -0.495799),(-0.939086, -1.070925, -0.495799),(-0.952800, -1.077091, -0.493699),(0.939086, -1.070925, -0.495799),(-0.952800, -1.077091, -0.493699),(0.952800, -1.077091, -0.493699),(-0.939086, -1.070925, -0.495799),(0.939086, -1.070925, -0.495799),(0.967200, -1.082909, -0.506301),(-0.939086, -1.070925, -0.495799),(0.967200, -1.082909, -0.506301),(-0.967200, -1.082909, -0.506301),(-0.939086, -1.070925, -0.495799),(0.000000, -0.014454, -0.006692),(0.000000, -0.010000, 0.000000),(-0.939086, -1.070925, -0.495799),(0.000000, -0.010000, 0.000000),(-0.952800, -1.077091, -0.493699),(0.000000, -0.014454, -0.006692),(-0.939086, -1.070925, -0.495799),(-0.967200, -1.082909, -0.506301),(0.000000, -0.014454, -0.006692),(-0.967200, -1.082909, -0.506301),(-0.000000, 0.010000, 0.000000),(0.020317, -0.022857, 0.000000),(0.953356, -1.072526, 0.485958),(0.952800, -1.077091, 0.493699),(0.020317, -0.022857, 0.000000),(0.952800, -1.077091, 0.493699),(0.000000, -0.010000, 0.000000),(0.953356, -1.072526, 0.485958),(0.020317, -0.022857, 0.000000),(-0.000000, 0.010000, 0.000000),(0.953356, -1.072526, 0.485958),(-0.000000, 0.010000, 0.000000),(0.967200, -1.082909, 0.506301),(0.953356, -1.072526, 0.485958),(0.953356, -1.072526, -0.485958),(0.952800, -1.077091, -0.493699),(0.953356, -1.072526, 0.485958),(0.952800, -1.077091, -0.493699),(0.952800, -1.077091, 0.493699),(0.953356, -1.072526, -0.485958),(0.953356, -1.072526, 0.485958),(0.967200, -1.082909, 0.506301),(0.953356, -1.072526, -0.485958),(0.967200, -1.082909, 0.506301),(0.967200, -1.082909, -0.506301),(0.953356, -1.072526, -0.485958),(0.020317, -0.022857, 0.000000),(0.000000, -0.010000, 0.000000),(0.953356, -1.072526, -0.485958),(0.000000, -0.010000, 0.000000),(0.952800, -1.077091, -0.493699),(0.020317, -0.022857, 0.000000),(0.953356, -1.072526, -0.485958),(0.967200, -1.082909, -0.506301),(0.020317, -0.022857, 0.000000),(0.967200, -1.082909, -0.506301),(-0.000000, 0.010000, 0.000000),(0.633167, -1.080000, 0.553006),(-0.633167, -1.080000, 0.553006),(-0.663860, -1.090000, 0.543006),(0.633167, -1.080000, 0.553006),(-0.663860, -1.090000, 0.543006),(0.663860, -1.090000, 0.543006),(-0.633167, -1.080000, 0.553006),(0.633167, -1.080000, 0.553006),(0.663860, -1.070000, 0.543006),(-0.633167, -1.080000, 0.553006),(0.663860, -1.070000, 0.543006),(-0.663860, -1.070000, 0.543006),(-0.633167, -1.080000, 0.553006),(0.000000, -1.080000, 1.014572),(0.000000, -1.090000, 1.026947),(-0.633167, -1.080000, 0.553006),(0.000000, -1.090000, 1.026947),(-0.663860, -1.090000, 0.543006),(0.000000, -1.080000, 1.014572),(-0.633167, -1.080000, 0.553006),(-0.663860, -1.070000, 0.543006),(0.000000, -1.080000, 1.014572),(-0.663860, -1.070000, 0.543006),(0.000000, -1.070000, 1.026947),(0.000000, -1.080000, 1.014572),(0.633167, -1.080000, 0.553006),(0.663860, -1.090000, 0.543006),(0.000000, -1.080000, 1.014572),(0.663860, -1.090000, 0.543006),(0.000000, -1.090000, 1.026947),(0.633167, -1.080000, 0.553006),(0.000000, -1.080000, 1.014572),(0.000000, -1.070000, 1.026947),(0.633167, -1.080000, 0.553006),(0.000000, -1.070000, 1.026947),(0.663860, -1.070000, 0.543006),)
\ No newline at end of file
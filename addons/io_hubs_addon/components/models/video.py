@@ -1 +0,0 @@
-SHAPE = ((0.301114, -0.005712, 0.153260),(0.429815, -0.005712, 0.132392),(0.429815, -0.005712, 0.153260),(-0.521948, -0.005712, 0.008985),(-0.473534, -0.005712, 0.003730),(-0.473534, -0.005712, 0.132392),(-0.176476, -0.005712, -0.168574),(-0.186545, -0.005712, -0.169010),(-0.345418, -0.005712, -0.295329),(-0.521948, -0.005712, -0.290074),(-0.521948, -0.005712, -0.316610),(-0.474118, -0.005712, -0.295329),(0.301114, -0.005712, 0.281922),(0.429815, -0.005712, 0.281922),(0.477645, -0.005712, 0.329738),(0.301114, -0.005712, 0.153260),(0.301114, -0.005712, 0.132392),(0.429815, -0.005712, 0.132392),(-0.495405, -0.005712, 0.329738),(-0.521948, -0.005712, 0.329738),(-0.495405, -0.005712, 0.276667),(-0.521948, -0.005712, 0.329738),(-0.521948, -0.005712, 0.008985),(-0.495405, -0.005712, 0.276667),(-0.521948, -0.005712, 0.008985),(-0.473534, -0.005712, -0.017137),(-0.473534, -0.005712, 0.003730),(-0.473534, -0.005712, -0.017137),(-0.344834, -0.005712, -0.017137),(-0.473534, -0.005712, 0.003730),(-0.344834, -0.005712, -0.017137),(-0.344834, -0.005712, 0.003730),(-0.473534, -0.005712, 0.003730),(-0.473534, -0.005712, 0.132392),(-0.474118, -0.005712, 0.153260),(-0.521948, -0.005712, 0.008985),(-0.474118, -0.005712, 0.153260),(-0.474118, -0.005712, 0.281922),(-0.495405, -0.005712, 0.276667),(-0.474118, -0.005712, 0.153260),(-0.495405, -0.005712, 0.276667),(-0.521948, -0.005712, 0.008985),(-0.473534, -0.005712, -0.017137),(-0.521948, -0.005712, 0.008985),(-0.473534, -0.005712, -0.145799),(-0.521948, -0.005712, 0.008985),(-0.521948, -0.005712, -0.290074),(-0.495405, -0.005712, -0.171922),(-0.495405, -0.005712, -0.171922),(-0.474118, -0.005712, -0.166667),(-0.473534, -0.005712, -0.145799),(-0.474118, -0.005712, -0.166667),(-0.345418, -0.005712, -0.166667),(-0.473534, -0.005712, -0.145799),(-0.521948, -0.005712, 0.008985),(-0.495405, -0.005712, -0.171922),(-0.473534, -0.005712, -0.145799),(-0.344834, -0.005712, 0.003730),(-0.344834, -0.005712, -0.017137),(-0.318172, -0.005712, 0.008986),(-0.344834, -0.005712, -0.017137),(-0.344834, -0.005712, -0.145799),(-0.190316, -0.005712, -0.159664),(-0.344834, -0.005712, 0.003730),(-0.318172, -0.005712, 0.008986),(-0.344834, -0.005712, 0.132392),(-0.344834, -0.005712, -0.145799),(-0.473534, -0.005712, -0.145799),(-0.345418, -0.005712, -0.166667),(-0.345418, -0.005712, -0.295329),(-0.474118, -0.005712, -0.295329),(-0.521948, -0.005712, -0.343145),(-0.474118, -0.005712, -0.295329),(-0.521948, -0.005712, -0.316610),(-0.521948, -0.005712, -0.343145),(-0.344834, -0.005712, -0.145799),(-0.345418, -0.005712, -0.166667),(-0.190316, -0.005712, -0.159664),(-0.318172, -0.005712, 0.008986),(-0.344834, -0.005712, -0.017137),(-0.190316, -0.005712, -0.159664),(-0.344834, -0.005712, 0.132392),(-0.318172, -0.005712, 0.008986),(-0.345418, -0.005712, 0.153260),(-0.345418, -0.005712, -0.295329),(-0.521948, -0.005712, -0.343145),(0.301114, -0.005712, -0.295329),(-0.521948, -0.005712, -0.343145),(0.477645, -0.005712, -0.343145),(0.301114, -0.005712, -0.295329),(-0.345418, -0.005712, -0.166667),(-0.345418, -0.005712, -0.295329),(-0.186545, -0.005712, -0.169010),(0.477645, -0.005712, -0.343145),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, -0.295329),(0.477645, -0.005712, -0.343145),(0.429815, -0.005712, -0.295329),(0.301114, -0.005712, -0.295329),(-0.474118, -0.005712, 0.153260),(-0.473534, -0.005712, 0.132392),(-0.344834, -0.005712, 0.132392),(-0.345418, -0.005712, 0.153260),(-0.474118, -0.005712, 0.153260),(-0.344834, -0.005712, 0.132392),(0.301114, -0.005712, -0.166667),(0.429815, -0.005712, -0.166667),(0.429815, -0.005712, -0.145799),(-0.345418, -0.005712, -0.295329),(0.301114, -0.005712, -0.295329),(-0.176476, -0.005712, -0.168574),(0.301114, -0.005712, -0.295329),(0.301114, -0.005712, -0.166667),(0.132173, -0.005712, -0.028202),(-0.176476, -0.005712, -0.168574),(0.301114, -0.005712, -0.295329),(0.132173, -0.005712, -0.028202),(-0.345418, -0.005712, 0.281922),(-0.345418, -0.005712, 0.153260),(-0.318172, -0.005712, 0.329738),(-0.318172, -0.005712, 0.329738),(-0.345418, -0.005712, 0.153260),(-0.318172, -0.005712, 0.008986),(0.301114, -0.005712, -0.166667),(0.429815, -0.005712, -0.145799),(0.301114, -0.005712, -0.145799),(0.301114, -0.005712, -0.166667),(0.301114, -0.005712, -0.145799),(0.132173, -0.005712, -0.028202),(0.301114, -0.005712, -0.145799),(0.301114, -0.005712, -0.017137),(0.142242, -0.005712, -0.019480),(0.301114, -0.005712, -0.017137),(0.429815, -0.005712, -0.017137),(0.429815, -0.005712, 0.003730),(0.301114, -0.005712, 0.003730),(0.138879, -0.005712, 0.008986),(0.142242, -0.005712, 0.006073),(0.301114, -0.005712, -0.017137),(0.429815, -0.005712, 0.003730),(0.301114, -0.005712, 0.003730),(-0.495405, -0.005712, 0.276667),(-0.474118, -0.005712, 0.281922),(-0.495405, -0.005712, 0.329738),(-0.474118, -0.005712, 0.281922),(-0.345418, -0.005712, 0.281922),(-0.495405, -0.005712, 0.329738),(-0.495405, -0.005712, 0.329738),(-0.345418, -0.005712, 0.281922),(-0.318172, -0.005712, 0.329738),(-0.190316, -0.005712, -0.159664),(-0.190316, -0.005712, 0.008986),(-0.318172, -0.005712, 0.008986),(0.301114, -0.005712, -0.017137),(0.301114, -0.005712, 0.003730),(0.146013, -0.005712, -0.006703),(0.142242, -0.005712, 0.006073),(0.146013, -0.005712, -0.006703),(0.146013, -0.005712, -0.006703),(0.301114, -0.005712, 0.003730),(0.142242, -0.005712, 0.006073),(0.146013, -0.005712, -0.006703),(-0.186545, -0.005712, -0.169010),(-0.190316, -0.005712, -0.159664),(-0.345418, -0.005712, -0.166667),(0.146013, -0.005712, -0.006703),(0.142242, -0.005712, -0.019480),(0.301114, -0.005712, -0.017137),(0.142242, -0.005712, -0.019480),(0.132173, -0.005712, -0.028202),(0.301114, -0.005712, -0.145799),(-0.474118, -0.005712, -0.295329),(-0.474118, -0.005712, -0.166667),(-0.495405, -0.005712, -0.171922),(-0.495405, -0.005712, -0.171922),(-0.521948, -0.005712, -0.290074),(-0.474118, -0.005712, -0.295329),(0.429815, -0.005712, -0.017137),(0.429815, -0.005712, -0.145799),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, -0.145799),(0.429815, -0.005712, -0.166667),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, -0.017137),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, 0.003730),(0.429815, -0.005712, -0.166667),(0.429815, -0.005712, -0.295329),(0.477645, -0.005712, 0.127137),(-0.318172, -0.005712, 0.329738),(-0.318172, -0.005712, 0.008986),(-0.190316, -0.005712, 0.146257),(-0.318172, -0.005712, 0.008986),(-0.190316, -0.005712, 0.008986),(-0.190316, -0.005712, 0.146257),(0.477645, -0.005712, 0.127137),(0.477645, -0.005712, 0.329738),(0.429815, -0.005712, 0.281922),(0.429815, -0.005712, 0.132392),(0.429815, -0.005712, 0.003730),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, 0.132392),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, 0.153260),(-0.318172, -0.005712, 0.329738),(-0.190316, -0.005712, 0.146257),(-0.186545, -0.005712, 0.155603),(-0.318172, -0.005712, 0.329738),(-0.186545, -0.005712, 0.155603),(-0.176476, -0.005712, 0.155167),(0.429815, -0.005712, 0.153260),(0.477645, -0.005712, 0.127137),(0.429815, -0.005712, 0.281922),(0.477645, -0.005712, 0.329738),(-0.318172, -0.005712, 0.329738),(0.301114, -0.005712, 0.281922),(-0.318172, -0.005712, 0.329738),(-0.176476, -0.005712, 0.155167),(0.301114, -0.005712, 0.281922),(0.132173, -0.005712, 0.014795),(0.138879, -0.005712, 0.008986),(0.301114, -0.005712, 0.132392),(0.138879, -0.005712, 0.008986),(0.301114, -0.005712, 0.003730),(0.301114, -0.005712, 0.132392),(0.301114, -0.005712, 0.132392),(0.301114, -0.005712, 0.153260),(0.132173, -0.005712, 0.014795),(0.301114, -0.005712, 0.153260),(0.301114, -0.005712, 0.281922),(0.132173, -0.005712, 0.014795),(0.132173, -0.005712, 0.014795),(0.301114, -0.005712, 0.281922),(-0.176476, -0.005712, 0.155167),(0.321729, -0.000000, 0.173868),(0.409200, -0.000000, 0.173868),(0.409200, 0.000000, 0.111784),(-0.521948, 0.000000, 0.008985),(-0.453504, 0.000000, 0.111784),(-0.453504, 0.000000, 0.024338),(-0.146304, -0.000000, -0.119575),(-0.366033, 0.000000, -0.274721),(-0.153372, 0.000000, -0.119881),(-0.521948, -0.000000, -0.290074),(-0.453504, 0.000000, -0.274721),(-0.521948, -0.000000, -0.316610),(0.321729, 0.000000, 0.261314),(0.477645, 0.000000, 0.329738),(0.409200, 0.000000, 0.261314),(0.321729, -0.000000, 0.173868),(0.409200, 0.000000, 0.111784),(0.321729, 0.000000, 0.111784),(-0.495405, 0.000000, 0.329738),(-0.495405, 0.000000, 0.276667),(-0.521948, 0.000000, 0.329738),(-0.521948, 0.000000, 0.329738),(-0.495405, 0.000000, 0.276667),(-0.521948, 0.000000, 0.008985),(-0.521948, 0.000000, 0.008985),(-0.453504, 0.000000, 0.024338),(-0.453504, 0.000000, -0.037746),(-0.453504, 0.000000, -0.037746),(-0.453504, 0.000000, 0.024338),(-0.366033, 0.000000, -0.037746),(-0.366033, 0.000000, -0.037746),(-0.453504, 0.000000, 0.024338),(-0.366033, 0.000000, 0.024338),(-0.453504, 0.000000, 0.111784),(-0.521948, 0.000000, 0.008985),(-0.453504, -0.000000, 0.173868),(-0.453504, -0.000000, 0.173868),(-0.495405, 0.000000, 0.276667),(-0.453504, -0.000000, 0.261314),(-0.453504, -0.000000, 0.173868),(-0.521948, 0.000000, 0.008985),(-0.495405, 0.000000, 0.276667),(-0.453504, 0.000000, -0.037746),(-0.453504, 0.000000, -0.125191),(-0.521948, 0.000000, 0.008985),(-0.521948, 0.000000, 0.008985),(-0.495405, 0.000000, -0.171922),(-0.521948, -0.000000, -0.290074),(-0.495405, 0.000000, -0.171922),(-0.453504, 0.000000, -0.125191),(-0.453504, 0.000000, -0.187275),(-0.453504, 0.000000, -0.187275),(-0.453504, 0.000000, -0.125191),(-0.366033, 0.000000, -0.187275),(-0.521948, 0.000000, 0.008985),(-0.453504, 0.000000, -0.125191),(-0.495405, 0.000000, -0.171922),(-0.366033, 0.000000, 0.024338),(-0.318172, 0.000000, 0.008986),(-0.366033, 0.000000, -0.037746),(-0.366033, 0.000000, -0.037746),(-0.156019, 0.000000, -0.113321),(-0.366033, 0.000000, -0.125191),(-0.366033, 0.000000, 0.024338),(-0.366033, 0.000000, 0.111784),(-0.318172, 0.000000, 0.008986),(-0.366033, 0.000000, -0.125191),(-0.366033, 0.000000, -0.187275),(-0.453504, 0.000000, -0.125191),(-0.366033, 0.000000, -0.274721),(-0.521948, 0.000000, -0.343145),(-0.453504, 0.000000, -0.274721),(-0.453504, 0.000000, -0.274721),(-0.521948, 0.000000, -0.343145),(-0.521948, -0.000000, -0.316610),(-0.366033, 0.000000, -0.125191),(-0.156019, 0.000000, -0.113321),(-0.366033, 0.000000, -0.187275),(-0.318172, 0.000000, 0.008986),(-0.156019, 0.000000, -0.113321),(-0.366033, 0.000000, -0.037746),(-0.366033, 0.000000, 0.111784),(-0.366033, -0.000000, 0.173868),(-0.318172, 0.000000, 0.008986),(-0.366033, 0.000000, -0.274721),(0.321729, -0.000000, -0.274721),(-0.521948, 0.000000, -0.343145),(-0.521948, 0.000000, -0.343145),(0.321729, -0.000000, -0.274721),(0.477645, 0.000000, -0.343145),(-0.366033, 0.000000, -0.187275),(-0.153372, 0.000000, -0.119881),(-0.366033, 0.000000, -0.274721),(0.477645, 0.000000, -0.343145),(0.409200, -0.000000, -0.274721),(0.477645, 0.000000, 0.127137),(0.477645, 0.000000, -0.343145),(0.321729, -0.000000, -0.274721),(0.409200, -0.000000, -0.274721),(-0.453504, -0.000000, 0.173868),(-0.366033, 0.000000, 0.111784),(-0.453504, 0.000000, 0.111784),(-0.366033, -0.000000, 0.173868),(-0.366033, 0.000000, 0.111784),(-0.453504, -0.000000, 0.173868),(0.321729, -0.000000, -0.187275),(0.409200, -0.000000, -0.125191),(0.409200, 0.000000, -0.187275),(-0.366033, 0.000000, -0.274721),(-0.146304, -0.000000, -0.119575),(0.321729, -0.000000, -0.274721),(0.321729, -0.000000, -0.274721),(0.070346, -0.000000, -0.021043),(0.321729, -0.000000, -0.187275),(-0.146304, -0.000000, -0.119575),(0.070346, -0.000000, -0.021043),(0.321729, -0.000000, -0.274721),(-0.366033, -0.000000, 0.261314),(-0.318172, 0.000000, 0.329738),(-0.366033, -0.000000, 0.173868),(-0.318172, 0.000000, 0.329738),(-0.318172, 0.000000, 0.008986),(-0.366033, -0.000000, 0.173868),(0.321729, -0.000000, -0.187275),(0.321729, -0.000000, -0.125191),(0.409200, -0.000000, -0.125191),(0.321729, -0.000000, -0.187275),(0.070346, -0.000000, -0.021043),(0.321729, -0.000000, -0.125191),(0.321729, -0.000000, -0.125191),(0.077414, -0.000000, -0.014921),(0.321729, -0.000000, -0.037746),(0.321729, -0.000000, -0.037746),(0.409200, 0.000000, 0.024338),(0.409200, 0.000000, -0.037746),(0.321729, 0.000000, 0.024338),(0.077414, 0.000000, 0.003015),(0.075054, 0.000000, 0.005060),(0.321729, -0.000000, -0.037746),(0.321729, 0.000000, 0.024338),(0.409200, 0.000000, 0.024338),(-0.495405, 0.000000, 0.276667),(-0.495405, 0.000000, 0.329738),(-0.453504, -0.000000, 0.261314),(-0.453504, -0.000000, 0.261314),(-0.495405, 0.000000, 0.329738),(-0.366033, -0.000000, 0.261314),(-0.495405, 0.000000, 0.329738),(-0.318172, 0.000000, 0.329738),(-0.366033, -0.000000, 0.261314),(-0.156019, 0.000000, -0.113321),(-0.318172, 0.000000, 0.008986),(-0.156019, 0.000000, 0.005060),(0.321729, -0.000000, -0.037746),(0.080061, -0.000000, -0.005953),(0.321729, 0.000000, 0.024338),(0.077414, 0.000000, 0.003015),(0.080061, -0.000000, -0.005953),(0.080061, -0.000000, -0.005953),(0.321729, 0.000000, 0.024338),(0.080061, -0.000000, -0.005953),(0.077414, 0.000000, 0.003015),(-0.153372, 0.000000, -0.119881),(-0.366033, 0.000000, -0.187275),(-0.156019, 0.000000, -0.113321),(0.080061, -0.000000, -0.005953),(0.321729, -0.000000, -0.037746),(0.077414, -0.000000, -0.014921),(0.077414, -0.000000, -0.014921),(0.321729, -0.000000, -0.125191),(0.070346, -0.000000, -0.021043),(-0.453504, 0.000000, -0.274721),(-0.495405, 0.000000, -0.171922),(-0.453504, 0.000000, -0.187275),(-0.495405, 0.000000, -0.171922),(-0.453504, 0.000000, -0.274721),(-0.521948, -0.000000, -0.290074),(0.409200, 0.000000, -0.037746),(0.477645, 0.000000, 0.127137),(0.409200, -0.000000, -0.125191),(0.409200, -0.000000, -0.125191),(0.477645, 0.000000, 0.127137),(0.409200, 0.000000, -0.187275),(0.409200, 0.000000, -0.037746),(0.409200, 0.000000, 0.024338),(0.477645, 0.000000, 0.127137),(0.409200, 0.000000, -0.187275),(0.477645, 0.000000, 0.127137),(0.409200, -0.000000, -0.274721),(-0.318172, 0.000000, 0.329738),(-0.156019, 0.000000, 0.101415),(-0.318172, 0.000000, 0.008986),(-0.318172, 0.000000, 0.008986),(-0.156019, 0.000000, 0.101415),(-0.156019, 0.000000, 0.005060),(0.477645, 0.000000, 0.127137),(0.409200, 0.000000, 0.261314),(0.477645, 0.000000, 0.329738),(0.409200, 0.000000, 0.111784),(0.477645, 0.000000, 0.127137),(0.409200, 0.000000, 0.024338),(0.409200, 0.000000, 0.111784),(0.409200, -0.000000, 0.173868),(0.477645, 0.000000, 0.127137),(-0.318172, 0.000000, 0.329738),(-0.153372, 0.000000, 0.107975),(-0.156019, 0.000000, 0.101415),(-0.318172, 0.000000, 0.329738),(-0.146304, 0.000000, 0.107669),(-0.153372, 0.000000, 0.107975),(0.409200, -0.000000, 0.173868),(0.409200, 0.000000, 0.261314),(0.477645, 0.000000, 0.127137),(0.477645, 0.000000, 0.329738),(0.321729, 0.000000, 0.261314),(-0.318172, 0.000000, 0.329738),(-0.318172, 0.000000, 0.329738),(0.321729, 0.000000, 0.261314),(-0.146304, 0.000000, 0.107669),(0.070346, 0.000000, 0.009137),(0.321729, 0.000000, 0.111784),(0.075054, 0.000000, 0.005060),(0.075054, 0.000000, 0.005060),(0.321729, 0.000000, 0.111784),(0.321729, 0.000000, 0.024338),(0.321729, 0.000000, 0.111784),(0.070346, 0.000000, 0.009137),(0.321729, -0.000000, 0.173868),(0.321729, -0.000000, 0.173868),(0.070346, 0.000000, 0.009137),(0.321729, 0.000000, 0.261314),(0.070346, 0.000000, 0.009137),(-0.146304, 0.000000, 0.107669),(0.321729, 0.000000, 0.261314),)
\ No newline at end of file
@@ -11,6 +11,7 @@ from .handlers import migrate_components
 from .gizmos import update_gizmos
 from .utils import is_linked, redraw_component_ui
 from ..icons import get_hubs_icons
+import json
 import os
 
 
@@ -298,8 +299,9 @@ class ViewLastReport(Operator):
         wm = context.window_manager
         title = wm.hubs_report_last_title
         report_string = wm.hubs_report_last_report_string
+        table_string = wm.hubs_report_last_table_string
         bpy.ops.wm.hubs_report_viewer(
-            'INVOKE_DEFAULT', title=title, report_string=report_string)
+            'INVOKE_DEFAULT', title=title, report_string=report_string, table_string=table_string)
         return {'FINISHED'}
 
 
@@ -379,12 +381,93 @@ class ReportScroller(Operator):
                 return {'FINISHED'}
 
 
+class ReportTableSorter(Operator):
+    bl_idname = "wm.hubs_report_table_sorter"
+    bl_label = "Sort Hubs Report"
+    bl_description = "Sort the report by this column.\nClick again to reverse the order"
+
+    column: IntProperty()
+
+    def execute(self, context):
+        wm = context.window_manager
+        if wm.hubs_report_table_sort_column == self.column:
+            wm.hubs_report_table_sort_descending = not wm.hubs_report_table_sort_descending
+        else:
+            wm.hubs_report_table_sort_column = self.column
+            # Names are sorted alphabetically, values from the highest
+            wm.hubs_report_table_sort_descending = self.column != 0
+        wm.hubs_report_scroll_index = 0
+        wm.hubs_report_scroll_percentage = 0
+        return {'FINISHED'}
+
+
+def split_table_row(layout):
+    # The first column holds the row names so it gets more space
+    split = layout.split(factor=0.4)
+    return split.row(), split.row()
+
+
 class ReportViewer(Operator):
     bl_idname = "wm.hubs_report_viewer"
     bl_label = "Hubs Report Viewer"
 
     title: StringProperty(default="")
     report_string: StringProperty()
+    # Optional JSON encoded table: {"columns": [...], "rows": [[...], ...], "sort_column": int, "sort_descending": bool}
+    # If set the table is displayed instead of the report messages, the report string is still used for the Info Editor.
+    table_string: StringProperty()
+
+    def draw_table(self, context, row, column, box):
+        wm = context.window_manager
+        columns = self.table["columns"]
+        rows = self.table["rows"]
+        sort_column = wm.hubs_report_table_sort_column
+        if 0 <= sort_column < len(columns):
+            rows = sorted(rows, key=lambda table_row: table_row[sort_column],
+                          reverse=wm.hubs_report_table_sort_descending)
+
+        maximum_scrolling = max(0, len(rows) - self.lines_to_show)
+        start_index = min(wm.hubs_report_scroll_index, maximum_scrolling)
+
+        name_cell, value_cells = split_table_row(box)
+        for i, column_name in enumerate(columns):
+            icon = 'NONE'
+            if i == sort_column:
+                icon = 'TRIA_DOWN' if wm.hubs_report_table_sort_descending else 'TRIA_UP'
+            op = (name_cell if i == 0 else value_cells).operator(
+                ReportTableSorter.bl_idname, text=column_name, icon=icon)
+            op.column = i
+
+        displayed_rows = rows[start_index:start_index + self.lines_to_show]
+        for table_row in displayed_rows:
+            name_cell, value_cells = split_table_row(box)
+            for i, value in enumerate(table_row):
+                (name_cell if i == 0 else value_cells).label(text=str(value))
+
+        # Add padding to the bottom of the table so its size doesn't change while scrolling
+        for _ in range(self.lines_to_show - len(displayed_rows)):
+            box.label(text="")
+
+        scroll_column = row.column()
+        scroll_column.enabled = maximum_scrolling > 0
+
+        scroll_up = scroll_column.row()
+        scroll_up.enabled = start_index > 0
+        op = scroll_up.operator(ReportScroller.bl_idname,
+                                text="", icon="TRIA_UP")
+        op.increment = -1
+        op.maximum = maximum_scrolling
+
+        scroll_down = scroll_column.row()
+        scroll_down.enabled = start_index < maximum_scrolling
+        op = scroll_down.operator(
+            ReportScroller.bl_idname, text="", icon="TRIA_DOWN")
+        op.increment = 1
+        op.maximum = maximum_scrolling
+
+        total_rows = column.row()
+        total_rows.alignment = 'RIGHT'
+        total_rows.label(text=f"{len(rows)} Rows")
 
     def draw(self, context):
         layout = self.layout
@@ -396,6 +479,11 @@ class ReportViewer(Operator):
         box = column.box()
 
         wm = context.window_manager
+        if self.table:
+            self.draw_table(context, row, column, box)
+            self.draw_footer(context, layout, column)
+            return
+
         report_length = len(self.messages)
         maximum_scrolling = len(self.report_display_blocks) - 1
         start_index = wm.hubs_report_scroll_index
@@ -433,6 +521,10 @@ class ReportViewer(Operator):
         total_messages.alignment = 'RIGHT'
         total_messages.label(text=f"{report_length} Messages")
 
+        self.draw_footer(context, layout, column)
+
+    def draw_footer(self, context, layout, column):
+        wm = context.window_manager
         scroll_percentage = column.row()
         scroll_percentage.enabled = False
         scroll_percentage.prop(
@@ -500,11 +592,17 @@ class ReportViewer(Operator):
         self.messages = split_and_prefix_report_messages(self.report_string)
         self.lines_to_show = 15
         self.messages_to_show = 5
+        self.table = json.loads(self.table_string) if self.table_string else None
         wm.hubs_report_scroll_index = 0
         wm.hubs_report_scroll_percentage = 0
         wm.hubs_report_last_title = self.title
         wm.hubs_report_last_report_string = self.report_string
-        self.init_report_display_blocks()
+        wm.hubs_report_last_table_string = self.table_string
+        if self.table:
+            wm.hubs_report_table_sort_column = self.table.get("sort_column", -1)
+            wm.hubs_report_table_sort_descending = self.table.get("sort_descending", False)
+        else:
+            self.init_report_display_blocks()
         return wm.invoke_props_dialog(self, width=600)
 
 
@@ -676,6 +774,7 @@ def register():
     bpy.utils.register_class(UpdateHubsGizmos)
     bpy.utils.register_class(ReportViewer)
     bpy.utils.register_class(ReportScroller)
+    bpy.utils.register_class(ReportTableSorter)
     bpy.utils.register_class(ViewLastReport)
     bpy.utils.register_class(ViewReportInInfoEditor)
     bpy.utils.register_class(CopyHubsComponent)
@@ -686,6 +785,10 @@ def register():
         name="Scroll Position", default=0, min=0, max=100, subtype='PERCENTAGE')
     bpy.types.WindowManager.hubs_report_last_title = StringProperty()
     bpy.types.WindowManager.hubs_report_last_report_string = StringProperty()
+    bpy.types.WindowManager.hubs_report_last_table_string = StringProperty()
+    bpy.types.WindowManager.hubs_report_table_sort_column = IntProperty(
+        default=-1, min=-1)
+    bpy.types.WindowManager.hubs_report_table_sort_descending = BoolProperty()
 
 
 def unregister():
@@ -695,6 +798,7 @@ def unregister():
     bpy.utils.unregister_class(UpdateHubsGizmos)
     bpy.utils.unregister_class(ReportViewer)
     bpy.utils.unregister_class(ReportScroller)
+    bpy.utils.unregister_class(ReportTableSorter)
     bpy.utils.unregister_class(ViewLastReport)
     bpy.utils.unregister_class(ViewReportInInfoEditor)
     bpy.utils.unregister_class(CopyHubsComponent)
@@ -703,3 +807,6 @@ def unregister():
     del bpy.types.WindowManager.hubs_report_scroll_percentage
     del bpy.types.WindowManager.hubs_report_last_title
     del bpy.types.WindowManager.hubs_report_last_report_string
+    del bpy.types.WindowManager.hubs_report_last_table_string
+    del bpy.types.WindowManager.hubs_report_table_sort_column
+    del bpy.types.WindowManager.hubs_report_table_sort_descending
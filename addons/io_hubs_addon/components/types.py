@@ -29,3 +29,16 @@ class MigrationType(Enum):
     GLOBAL = 'global'
     LOCAL = 'local'
     REGISTRATION = 'registration'
+
+
+class GatherKind(Enum):
+    SCALAR = 'scalar'
+    JSON = 'json'
+    VEC_ARRAY = 'vec_array'
+    VEC_XYZ = 'vec_xyz'
+    COLOR_LINEAR = 'color_linear'
+    COLOR_GAMMA = 'color_gamma'
+    NODE = 'node'
+    MATERIAL = 'material'
+    IMAGE = 'image'
+    TEXTURE = 'texture'
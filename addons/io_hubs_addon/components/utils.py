@@ -1,6 +1,7 @@
 import tempfile
 import bpy
 from .components_registry import get_component_by_name, get_components_registry
+from .component_index import add_component_host, remove_component_host, get_component_hosts, get_host_objects
 from .gizmos import update_gizmos
 from .types import PanelType
 from mathutils import Vector
@@ -17,6 +18,7 @@ V_S1 = Vector((1.0, 1.0, 1.0))
 def add_component(obj, component_name):
     component_item = obj.hubs_component_list.items.add()
     component_item.name = component_name
+    add_component_host(component_name, obj)
 
     component_class = get_component_by_name(component_name)
     if component_class:
@@ -38,6 +40,7 @@ def add_component(obj, component_name):
 def remove_component(obj, component_name):
     component_items = obj.hubs_component_list.items
     component_items.remove(component_items.find(component_name))
+    remove_component_host(component_name, obj)
     component_class = get_component_by_name(component_name)
 
     component_class = get_component_by_name(component_name)
@@ -57,7 +60,7 @@ def remove_component(obj, component_name):
 
 
 def get_objects_with_component(component_name):
-    return [ob for ob in bpy.context.view_layer.objects if has_component(ob, component_name)]
+    return get_host_objects(get_component_hosts(component_name), bpy.context.view_layer)
 
 
 def has_component(obj, component_name):
@@ -12,29 +12,47 @@ from bpy.types import AnyType
 ROOM_FLAGS_DOC_URL = "https://hubs.mozilla.com/docs/hubs-query-string-parameters.html"
 
 
-def export_scene(context):
-    export_prefs = context.scene.hubs_scene_debugger_room_export_prefs
+# Room export preferences that are passed through to the glTF exporter
+EXPORT_SCENE_OPTIONS = [
+    'export_cameras',
+    'export_lights',
+    'use_selection',
+    'use_visible',
+    'use_renderable',
+    'use_active_collection',
+    'export_apply',
+]
+
+
+def get_export_scene_options(scene):
+    export_prefs = scene.hubs_scene_debugger_room_export_prefs
+    return {option: getattr(export_prefs, option) for option in EXPORT_SCENE_OPTIONS}
+
+
+def get_export_scene_args(filepath, export_options):
+    '''Returns the glTF exporter arguments for exporting the active scene to filepath.
+    This is shared by the scene debugger and the batch export so both produce the same output.'''
     import os
-    extension = '.glb'
+    extension = os.path.splitext(filepath)[1]
     args = {
         # Settings from "Remember Export Settings"
         **dict(bpy.context.scene.get('glTF2ExportSettings', {})),
 
         'export_format': ('GLB' if extension == '.glb' else 'GLTF_SEPARATE'),
-        'filepath': os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME),
-        'export_cameras': export_prefs.export_cameras,
-        'export_lights': export_prefs.export_lights,
-        'use_selection': export_prefs.use_selection,
-        'use_visible': export_prefs.use_visible,
-        'use_renderable': export_prefs.use_renderable,
-        'use_active_collection': export_prefs.use_active_collection,
-        'export_apply': export_prefs.export_apply,
+        'filepath': filepath,
+        **{option: export_options[option] for option in EXPORT_SCENE_OPTIONS},
         'export_force_sampling': False,
     }
     if bpy.app.version >= (3, 2, 0):
         args['use_active_scene'] = True
 
-    bpy.ops.export_scene.gltf(**args)
+    return args
+
+
+def export_scene(context):
+    import os
+    filepath = os.path.join(bpy.app.tempdir, EXPORT_TMP_FILE_NAME)
+    bpy.ops.export_scene.gltf(**get_export_scene_args(filepath, get_export_scene_options(context.scene)))
 
 
 hubs_session = None
@@ -0,0 +1,77 @@
+import bpy
+import json
+import os
+import sys
+import time
+import traceback
+
+# Batch export worker.  It runs in a background Blender process started by scripts/batch_export.py and exports the
+# .blend files it receives in turn, so Blender and the add-on are only started once per worker.
+#
+# The jobs are received as JSON lines on stdin:
+#   {"blend": "<.blend path>", "output": "<.glb/.gltf path>", "options": {<debugger room export options>}}
+# and a result is written for each of them as a JSON line on stdout, prefixed with BATCH_RESULT_PREFIX to tell it
+# apart from the rest of Blender's output.  An empty line or the end of stdin stops the worker.
+# When the file has size analysis after export enabled, the result has its size report and the export fails if the
+# exported file is over budget.
+
+BATCH_RESULT_PREFIX = "HUBS_BATCH_RESULT "
+
+
+def export_blend_file(job):
+    from ..debugger import get_export_scene_args, get_export_scene_options
+    from .size_report import run_pending_size_analyses
+
+    result = {
+        "blend": job["blend"],
+        "output": job["output"],
+        "ok": False,
+        "error": None,
+        "load_seconds": 0.0,
+        "export_seconds": 0.0,
+        "size": 0,
+    }
+
+    try:
+        start = time.perf_counter()
+        bpy.ops.wm.open_mainfile(filepath=job["blend"], load_ui=False)
+        result["load_seconds"] = time.perf_counter() - start
+
+        # The room export preferences stored in the file are the defaults, like in the scene debugger
+        export_options = get_export_scene_options(bpy.context.scene)
+        export_options.update(job.get("options", {}))
+
+        output_dir = os.path.dirname(job["output"])
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        start = time.perf_counter()
+        bpy.ops.export_scene.gltf(**get_export_scene_args(job["output"], export_options))
+        result["export_seconds"] = time.perf_counter() - start
+
+        result["size"] = os.path.getsize(job["output"])
+        result["ok"] = True
+
+        # The analysis after export is deferred until the file is written
+        for report in run_pending_size_analyses():
+            result["size_report"] = {key: report[key] for key in ("passed", "violations", "totals")}
+            if not report["passed"]:
+                result["ok"] = False
+                result["error"] = "Over the size budget:\n" + "\n".join(report["violations"])
+    except Exception as err:
+        result["error"] = f"{err}\n{traceback.format_exc()}"
+        # Don't leave the analysis of a failed export for the next job
+        run_pending_size_analyses()
+
+    return result
+
+
+def run_batch_export_worker():
+    while True:
+        line = sys.stdin.readline()
+        if not line.strip():
+            break
+
+        result = export_blend_file(json.loads(line))
+        sys.stdout.write(BATCH_RESULT_PREFIX + json.dumps(result) + "\n")
+        sys.stdout.flush()
@@ -0,0 +1,47 @@
+import json
+
+# Compact encoding of the MOZ_hubs_components extensions.  Large scenes repeat the same component payloads over and
+# over (e.g. thousands of "visible": {"visible": true}), so identical payloads are shared by all their hosts instead of
+# keeping a dict per host.  Only payloads made of plain JSON values are shared: the glTF exporter replaces the glTF
+# objects linked from component data by their indices in place, which is a no-op for plain values, so a shared dict is
+# written the same way for every host.  The written JSON doesn't change.
+
+PLAIN_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def is_plain_json(value):
+    if isinstance(value, PLAIN_JSON_TYPES):
+        return True
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and is_plain_json(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(is_plain_json(item) for item in value)
+    return False
+
+
+class ComponentInterner:
+    def __init__(self):
+        # canonical JSON -> shared payload
+        self.payloads = {}
+        self.interned = 0
+        self.shared = 0
+
+    def intern(self, value):
+        '''Returns the shared instance of a plain JSON value, or the value itself if it can't be shared'''
+        if not isinstance(value, (dict, list)) or not is_plain_json(value):
+            return value
+        key = json.dumps(value, sort_keys=True, separators=(',', ':'))
+        shared_value = self.payloads.setdefault(key, value)
+        self.interned += 1
+        if shared_value is not value:
+            self.shared += 1
+        return shared_value
+
+    def report(self):
+        if self.shared:
+            print(f"Compact components encoding shared {self.shared} of {self.interned} component payloads, {len(self.payloads)} unique")
+
+
+def get_component_interner(export_settings):
+    '''Returns the export scoped interner, None if the compact encoding is disabled'''
+    return export_settings.get('hubs_component_interner')
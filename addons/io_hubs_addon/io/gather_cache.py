@@ -0,0 +1,90 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Incremental export cache.  Keeps the data gathered for the components in the previous exports so hosts that
+# haven't changed since then don't need to be gathered again.  Entries are dropped as soon as the depsgraph reports
+# an update of the ID that owns the host (bones are owned by their armature), and the whole cache is dropped on file
+# load and undo/redo since the hosts are reallocated then.
+
+# host owner ID pointer -> {host pointer: {component name: (component class, gathered data)}}
+__gather_cache = {}
+
+
+def get_host_owner_key(host):
+    return host.id_data.as_pointer()
+
+
+def can_reuse_gather(component_class):
+    '''Only the components whose gathered data depends exclusively on their own plain properties can be reused.
+    Pointer properties reference glTF objects that are created anew in every export, and custom gathers or
+    pre_export callbacks can depend on anything.'''
+    from ..components.hubs_component import HubsComponent
+    from .utils import can_batch_gather
+    if component_class.pre_export is not HubsComponent.pre_export:
+        return False
+    return can_batch_gather(component_class)
+
+
+def get_cached_gather(host, component_name, component_class):
+    '''Returns the data gathered in a previous export for the host component, None if there isn't any or it's dirty'''
+    host_entries = __gather_cache.get(get_host_owner_key(host), {}).get(host.as_pointer())
+    if not host_entries:
+        return None
+    entry = host_entries.get(component_name)
+    # The component class changes if the component is registered again
+    if entry is None or entry[0] is not component_class:
+        return None
+    return entry[1]
+
+
+def store_cached_gather(host, component_name, component_class, data):
+    owner_entries = __gather_cache.setdefault(get_host_owner_key(host), {})
+    owner_entries.setdefault(host.as_pointer(), {})[component_name] = (component_class, data)
+
+
+def invalidate_gather_cache_id(id_pointer):
+    __gather_cache.pop(id_pointer, None)
+
+
+def clear_gather_cache():
+    __gather_cache.clear()
+
+
+def flush_gather_cache_updates():
+    '''Evaluates the pending depsgraph updates so the cache entries of the hosts changed right before the export
+    (i.e. from a script) are invalidated before the export starts'''
+    try:
+        bpy.context.view_layer.update()
+    except Exception:
+        # The view layer can't be updated in some contexts, don't use stale entries then
+        clear_gather_cache()
+
+
+@persistent
+def depsgraph_update_post(dummy, depsgraph):
+    if not __gather_cache:
+        return
+    for update in depsgraph.updates:
+        invalidate_gather_cache_id(update.id.original.as_pointer())
+
+
+@persistent
+def invalidate_all(dummy):
+    clear_gather_cache()
+
+
+def register():
+    if depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post)
+    for handlers in [bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post]:
+        if invalidate_all not in handlers:
+            handlers.append(invalidate_all)
+
+
+def unregister():
+    if depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    for handlers in [bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post]:
+        if invalidate_all in handlers:
+            handlers.remove(invalidate_all)
+    clear_gather_cache()
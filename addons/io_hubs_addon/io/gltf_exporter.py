@@ -1,7 +1,15 @@
 import bpy
 from bpy.props import PointerProperty
-from ..components.components_registry import get_components_registry
-from ..components.utils import get_host_components
+from ..components.components_registry import get_component_by_name
+from .profiler import profiled, get_export_profiler, start_export_profiler, finish_export_profile, get_json_size
+from .gather_cache import can_reuse_gather, get_cached_gather, store_cached_gather, flush_gather_cache_updates
+from . import gather_cache
+from . import size_report
+from .image_dedup import ImageDedup, get_image_dedup
+from .gpu_instancing import instance_scene_nodes
+from .static_batching import StaticBatchingState, batch_scene_nodes, get_static_batching
+from .component_interning import ComponentInterner, get_component_interner
+from .texture_profiles import TEXTURE_PROFILE_ITEMS
 import traceback
 
 hubs_config = {
@@ -30,61 +38,214 @@ def get_version_string():
     return str(bl_info['version'][0]) + '.' + str(bl_info['version'][1]) + '.' + str(bl_info['version'][2])
 
 
-def export_callback(callback_method, export_settings):
-    # Note: we loop through copied lists of the potential component hosts
-    # to allow the callbacks to change the host names.  This is needed
-    # because a name change will cause Blender to update the host lists in
-    # mid iteration and so multiple callbacks could be executed for the same
-    # component/host.
-
-    for scene in bpy.data.scenes[:]:
-        for component in get_host_components(scene):
-            component_callback = getattr(component, callback_method)
-            try:
-                component_callback(export_settings, scene)
-            except Exception:
-                traceback.print_exc()
+# Minimum number of hosts of a component class for it to be gathered in a batch
+BATCHED_GATHER_MIN_HOSTS = 32
+
+
+class HostIndex:
+    '''Export scoped index of the component hosts in the file.  Only hosts that carry components are indexed.
+    The entries are stored in the order the export callbacks are executed: scenes, objects (followed by their bones) and materials.'''
+
+    def __init__(self):
+        # (host, ob, [(component_name, component_class, component), ...])
+        self.entries = []
+        # host -> [(component_name, component_class, component), ...]
+        self.hosts = {}
+        # component_class -> [(host, ob, component), ...]
+        self.components = {}
+        # component_class -> {host: gathered data}
+        self.batched_gathers = {}
+
+    def add_host(self, host, ob=None):
+        component_items = host.hubs_component_list.items
+        if not component_items:
+            return
+
+        host_components = []
+        for component_item in component_items:
+            component_name = component_item.name
+            component_class = get_component_by_name(component_name)
+            component = getattr(host, component_class.get_id()) if component_class else None
+            host_components.append((component_name, component_class, component))
+            if component_class:
+                self.components.setdefault(component_class, []).append((host, ob, component))
+
+        self.entries.append((host, ob, host_components))
+        self.hosts.setdefault(host, host_components)
+
+    def get_host_components(self, host):
+        return self.hosts.get(host, [])
+
+    def get_batched_gather(self, component_class, export_settings):
+        '''Returns the gathered data of every host of the component class if it can be gathered in a batch, None otherwise.
+        The batch is gathered the first time it's requested so it reflects the state of the components after the pre_export callbacks.'''
+        if component_class not in self.batched_gathers:
+            from .utils import can_batch_gather, gather_properties_batch
+            component_entries = self.components.get(component_class, [])
+            incremental_export = export_settings.get('hubs_incremental_export')
+            if incremental_export and not incremental_export["check"] and can_reuse_gather(component_class):
+                # Only batch the hosts that need to be gathered again
+                component_name = component_class.get_name()
+                component_entries = [
+                    entry for entry in component_entries
+                    if get_cached_gather(entry[0], component_name, component_class) is None]
+            if len(component_entries) < BATCHED_GATHER_MIN_HOSTS or not can_batch_gather(component_class):
+                self.batched_gathers[component_class] = None
+            else:
+                host_components = {}
+                for host, _, component in component_entries:
+                    host_components.setdefault(host, component)
+                profiler = get_export_profiler()
+                if profiler:
+                    gathered_data = profiler.call(
+                        f"gather:{component_class.get_name()} (batched)", gather_properties_batch,
+                        export_settings, component_class, list(host_components.values()))
+                else:
+                    gathered_data = gather_properties_batch(
+                        export_settings, component_class, list(host_components.values()))
+                self.batched_gathers[component_class] = dict(zip(host_components.keys(), gathered_data))
+
+        return self.batched_gathers[component_class]
 
-    for ob in bpy.data.objects[:]:
-        for component in get_host_components(ob):
-            component_callback = getattr(component, callback_method)
-            try:
-                component_callback(export_settings, ob, ob)
-            except Exception:
-                traceback.print_exc()
+
+def build_host_index():
+    host_index = HostIndex()
+
+    for scene in bpy.data.scenes:
+        host_index.add_host(scene)
+
+    for ob in bpy.data.objects:
+        host_index.add_host(ob, ob)
 
         if ob.type == 'ARMATURE':
-            for bone in ob.data.bones[:]:
-                for component in get_host_components(bone):
-                    component_callback = getattr(component, callback_method)
-                    try:
-                        component_callback(export_settings, bone, ob)
-                    except Exception:
-                        traceback.print_exc()
-
-    for material in bpy.data.materials[:]:
-        for component in get_host_components(material):
+            for bone in ob.data.bones:
+                host_index.add_host(bone, ob)
+
+    for material in bpy.data.materials:
+        host_index.add_host(material)
+
+    return host_index
+
+
+def get_host_index(export_settings):
+    host_index = export_settings.get('hubs_host_index')
+    if host_index is None:
+        host_index = build_host_index()
+        export_settings['hubs_host_index'] = host_index
+
+    return host_index
+
+
+@profiled("export_callback")
+def export_callback(callback_method, export_settings):
+    # Note: we loop through the entries of the host index, which were collected before any callback was executed,
+    # to allow the callbacks to change the host names.  A name change causes Blender to update the host lists
+    # in mid iteration and so multiple callbacks could be executed for the same component/host otherwise.
+
+    for host, ob, host_components in get_host_index(export_settings).entries:
+        for _, component_class, component in host_components:
+            if not component_class:
+                continue
+
             component_callback = getattr(component, callback_method)
+            profiler = get_export_profiler()
             try:
-                component_callback(export_settings, material)
+                args = (export_settings, host) if ob is None else (export_settings, host, ob)
+                if profiler:
+                    profiler.call(f"{callback_method}:{component_class.get_name()}", component_callback, *args)
+                else:
+                    component_callback(*args)
             except Exception:
                 traceback.print_exc()
 
 
+def report_incremental_export_mismatches(incremental_export):
+    if not incremental_export or not incremental_export["mismatches"]:
+        return
+
+    messages = incremental_export["mismatches"]
+    for message in messages:
+        print(message)
+
+    if bpy.app.background:
+        return
+
+    def report_mismatches():
+        bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Incremental Export Check Report",
+                                      report_string='\n\n'.join(messages))
+    bpy.app.timers.register(report_mismatches)
+
+
+def report_export_messages(messages):
+    if not messages or bpy.app.background:
+        return
+
+    def report_messages():
+        bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Export Report", report_string='\n\n'.join(messages))
+    bpy.app.timers.register(report_messages)
+
+
 def glTF2_pre_export_callback(export_settings):
     from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
     BLACK_LIST.extend(glTF2ExportUserExtension.EXCLUDED_PROPERTIES)
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    if props.enabled and props.profile_export:
+        start_export_profiler()
+    export_settings['hubs_host_index'] = build_host_index()
+    if props.enabled and props.compact_components:
+        export_settings['hubs_component_interner'] = ComponentInterner()
+    if props.enabled and props.image_deduplication:
+        export_settings['hubs_image_dedup'] = ImageDedup()
+    if props.enabled and props.static_batching:
+        export_settings['hubs_static_batching'] = StaticBatchingState(props.static_batching_max_vertices)
     export_callback("pre_export", export_settings)
+    if props.enabled and props.incremental_export:
+        # Make sure the changes made until now, including the pre_export ones, have invalidated the cached gathers
+        flush_gather_cache_updates()
+        export_settings['hubs_incremental_export'] = {
+            "check": props.incremental_export_check,
+            "mismatches": []
+        }
 
 
 def glTF2_post_export_callback(export_settings):
     export_callback("post_export", export_settings)
+    export_settings.pop('hubs_host_index', None)
+    export_settings.pop('hubs_lightmap_atlas', None)
+    component_interner = export_settings.pop('hubs_component_interner', None)
+    if component_interner:
+        component_interner.report()
+    static_batching = export_settings.pop('hubs_static_batching', None)
+    if static_batching:
+        static_batching.report()
+    export_messages = []
+    image_dedup = export_settings.pop('hubs_image_dedup', None)
+    if image_dedup:
+        message = image_dedup.report()
+        if message:
+            export_messages.append(message)
+    report_incremental_export_mismatches(export_settings.pop('hubs_incremental_export', None))
+
+    from .image_encoder import shutdown_image_encoder
+    shutdown_image_encoder(export_settings)
+    from .image_cache import evict_image_cache
+    evict_image_cache(export_settings)
+    from .utils import close_export_files
+    close_export_files(export_settings)
 
     from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
     for excluded_prop in glTF2ExportUserExtension.EXCLUDED_PROPERTIES:
         if excluded_prop in BLACK_LIST:
             BLACK_LIST.remove(excluded_prop)
 
+    finish_export_profile(export_settings,
+                          write_json=bpy.context.scene.HubsComponentsExtensionProperties.profile_export_json)
+
+    if bpy.context.scene.hubs_size_budget.analyze_after_export:
+        size_report.analyze_size_after_export(export_settings['gltf_filepath'], export_messages)
+    else:
+        report_export_messages(export_messages)
+
 
 # This class name is specifically looked for by gltf-blender-io and it's hooks are automatically invoked on export
 
@@ -135,19 +296,30 @@ class glTF2ExportUserExtension:
     def gather_gltf_extensions_hook(self, gltf2_plan, export_settings):
         self.hubs_gather_gltf_hook(gltf2_plan, export_settings)
 
+    @profiled("gather_scene_hook")
     def gather_scene_hook(self, gltf2_object, blender_scene, export_settings):
         if not self.properties.enabled:
             return
 
         self.add_hubs_components(gltf2_object, blender_scene, export_settings)
         self.call_delayed_gathers()
+        # Merge the static meshes first, the remaining nodes are then instanced
+        batch_scene_nodes(gltf2_object, export_settings)
+        if self.properties.gpu_instancing:
+            # Run after the delayed gathers, so every node link of the component data has been gathered
+            instance_scene_nodes(gltf2_object, export_settings).report()
 
+    @profiled("gather_node_hook")
     def gather_node_hook(self, gltf2_object, blender_object, export_settings):
         if not self.properties.enabled:
             return
 
         self.add_hubs_components(gltf2_object, blender_object, export_settings)
+        static_batching = get_static_batching(export_settings)
+        if static_batching is not None:
+            static_batching.add_node(gltf2_object, blender_object)
 
+    @profiled("gather_material_hook")
     def gather_material_hook(self, gltf2_object, blender_material, export_settings):
         if not self.properties.enabled:
             return
@@ -170,43 +342,104 @@ class glTF2ExportUserExtension:
         self.gather_material_hook(
             gltf2_object, blender_material, export_settings)
 
-    def gather_joint_hook(self, gltf2_object, blender_pose_bone, export_settings):
+    def gather_texture_hook(self, gltf2_texture, *args):
+        # The arguments in between vary with the glTF exporter version, export_settings is always the last one
         if not self.properties.enabled:
             return
-        self.add_hubs_components(
-            gltf2_object, blender_pose_bone.bone, export_settings)
+        image_dedup = get_image_dedup(args[-1])
+        if image_dedup is not None:
+            image_dedup.add_texture(gltf2_texture)
 
+    def gather_gltf_hook(self, *args):
+        # The arguments vary with the glTF exporter version, export_settings is always the last one
+        if not self.properties.enabled:
+            return
+        # Every texture has been gathered at this point and the glTF exporter assembles the buffers right after
+        image_dedup = get_image_dedup(args[-1])
+        if image_dedup is not None:
+            image_dedup.deduplicate()
+
+    @profiled("gather_joint_hook")
+    def gather_joint_hook(self, gltf2_object, blender_pose_bone, export_settings):
+        if not self.properties.enabled:
+            return
+        # Several armature objects can share the same armature data, and so the same bones and components.  The
+        # components that depend on the armature object being exported can look it up while the joint is gathered.
+        export_settings['hubs_joint_owner'] = blender_pose_bone.id_data
+        try:
+            self.add_hubs_components(
+                gltf2_object, blender_pose_bone.bone, export_settings)
+        finally:
+            export_settings.pop('hubs_joint_owner', None)
+
+    @profiled("call_delayed_gathers")
     def call_delayed_gathers(self):
+        profiler = get_export_profiler()
         for delayed_gather in self.delayed_gathers:
             component_data, component_name, gather = delayed_gather
-            component_data[component_name] = gather()
+            if profiler:
+                profile_name = f"gather:{component_name} (delayed)"
+                component_data[component_name] = profiler.call(profile_name, gather)
+                profiler.add_bytes(profile_name, get_json_size(component_data[component_name]))
+            else:
+                component_data[component_name] = gather()
         self.delayed_gathers.clear()
 
-    def add_hubs_components(self, gltf2_object, blender_object, export_settings):
-        component_list = blender_object.hubs_component_list
+    def gather_component(self, host_index, component_name, component_class, component, blender_object, export_settings):
+        incremental_export = export_settings.get('hubs_incremental_export')
+        reusable = incremental_export is not None and can_reuse_gather(component_class)
+        cached_data = get_cached_gather(blender_object, component_name, component_class) if reusable else None
+        if cached_data is not None and not incremental_export["check"]:
+            return cached_data
+
+        batched_gather = host_index.get_batched_gather(component_class, export_settings)
+        profiler = get_export_profiler()
+        if batched_gather is not None and blender_object in batched_gather:
+            data = batched_gather[blender_object]
+        elif profiler:
+            data = profiler.call(f"gather:{component_name}", component.gather, export_settings, blender_object)
+        else:
+            data = component.gather(export_settings, blender_object)
+
+        if reusable:
+            if cached_data is not None and cached_data != data:
+                incremental_export["mismatches"].append(
+                    f"Warning: The cached data of the {component_name} component on \"{blender_object.name}\" doesn't match a full gather\nCached: {cached_data}\nGathered: {data}")
+            store_cached_gather(blender_object, component_name, component_class, data)
+
+        return data
 
-        registered_hubs_components = get_components_registry()
+    def add_hubs_components(self, gltf2_object, blender_object, export_settings):
+        host_index = get_host_index(export_settings)
+        host_components = host_index.get_host_components(blender_object)
 
-        if component_list.items:
+        if host_components:
             extension_name = hubs_config["gltfExtensionName"]
             component_data = {}
-
-            for component_item in component_list.items:
-                component_name = component_item.name
-                if component_name in registered_hubs_components:
-                    component_class = registered_hubs_components[component_name]
-                    component = getattr(
-                        blender_object, component_class.get_id())
-                    data = component.gather(export_settings, blender_object)
+            profiler = get_export_profiler()
+            interner = get_component_interner(export_settings)
+            has_delayed_gathers = False
+
+            for component_name, component_class, component in host_components:
+                if component_class:
+                    data = self.gather_component(
+                        host_index, component_name, component_class, component, blender_object, export_settings)
+                    if profiler and not hasattr(data, "delayed_gather"):
+                        profiler.add_bytes(f"gather:{component_name}", get_json_size(data))
                     if hasattr(data, "delayed_gather"):
                         self.delayed_gathers.append(
                             (component_data, component_class.gather_name(), data))
+                        has_delayed_gathers = True
                     else:
-                        component_data[component_class.gather_name()] = data
+                        component_data[component_class.gather_name()] = interner.intern(data) if interner else data
                 else:
                     print('Could not export unsupported component "%s"' %
                           (component_name))
 
+            if interner and not has_delayed_gathers:
+                # The delayed gathers fill in the component data later, so it can only be shared without them
+                component_data = interner.intern(component_data)
+
             if gltf2_object.extensions is None:
                 gltf2_object.extensions = {}
             gltf2_object.extensions[extension_name] = self.Extension(
@@ -224,6 +457,87 @@ class HubsComponentsExtensionProperties(bpy.types.PropertyGroup):
         description='Include this extension in the exported glTF file',
         default=True
     )
+    lightmap_atlas: bpy.props.BoolProperty(
+        name="Lightmap Atlases",
+        description='Pack the lightmaps of the exported materials in atlases to reduce the number of textures.  Lightmaps with a texture transform are exported as they are',
+        default=False
+    )
+    lightmap_atlas_size: bpy.props.EnumProperty(
+        name="Atlas Size",
+        description='Maximum width and height of the lightmap atlases',
+        items=[("1024", "1024", "1024 x 1024"),
+               ("2048", "2048", "2048 x 2048"),
+               ("4096", "4096", "4096 x 4096"),
+               ("8192", "8192", "8192 x 8192")],
+        default="2048"
+    )
+    lightmap_atlas_padding: bpy.props.IntProperty(
+        name="Atlas Padding",
+        description='Pixels around every lightmap in the atlas, filled with its edge pixels to prevent bleeding between lightmaps',
+        default=2,
+        min=0,
+        max=16
+    )
+    texture_profile: bpy.props.EnumProperty(
+        name="Texture Profile",
+        description='Maximum resolution of the environment maps, reflection probes, lightmaps and other component images.  The images over it are downscaled on export',
+        items=TEXTURE_PROFILE_ITEMS,
+        default="ORIGINAL"
+    )
+    image_deduplication: bpy.props.BoolProperty(
+        name="Deduplicate Images",
+        description='Embed the images with identical content only once, even when they come from different images or materials.  Every exported image is hashed, which makes the export slower',
+        default=False
+    )
+    compact_components: bpy.props.BoolProperty(
+        name="Compact Components",
+        description='Share the identical component payloads between their hosts while exporting to reduce the memory used by scenes with many components.  The exported file does not change',
+        default=False
+    )
+    networked_ids: bpy.props.EnumProperty(
+        name="Networked IDs",
+        description='How the ids of the networked components are generated',
+        items=[("DETERMINISTIC", "Deterministic",
+                "Derive the ids from the file, scene and object/bone names so exporting the same scene twice produces the same file"),
+               ("RANDOM", "Random", "Generate new random ids on every export")],
+        default="DETERMINISTIC"
+    )
+    static_batching: bpy.props.BoolProperty(
+        name="Static Batching",
+        description='Merge the static meshes that share their materials into combined meshes.  Objects with Hubs components, animation or custom properties and objects linked from components are exported as they are.  The batches are built from the exported data, the file is not modified',
+        default=False
+    )
+    static_batching_max_vertices: bpy.props.IntProperty(
+        name="Max Batch Vertices",
+        description='Maximum number of vertices of a batch',
+        default=65535,
+        min=1
+    )
+    gpu_instancing: bpy.props.BoolProperty(
+        name="GPU Instancing",
+        description='Merge sibling objects that share a mesh and have identical Shadow/Visible components into a single node drawn with EXT_mesh_gpu_instancing.  Animated objects and objects linked from components are exported as they are.  Requires Blender 3.2 or newer',
+        default=False
+    )
+    profile_export: bpy.props.BoolProperty(
+        name="Profile Export",
+        description='Measure the time spent in the Hubs export hooks, component gathers and image encoding and show the results in a report once the export is done',
+        default=False
+    )
+    incremental_export: bpy.props.BoolProperty(
+        name="Incremental Export",
+        description='Reuse the component data gathered in the previous exports for the hosts that have not changed since then',
+        default=False
+    )
+    incremental_export_check: bpy.props.BoolProperty(
+        name="Check Incremental Export",
+        description='Gather every component again and report the reused data that does not match it.  Used to verify that the incremental export is correct, it is not faster than a full export',
+        default=False
+    )
+    profile_export_json: bpy.props.BoolProperty(
+        name="Save Profile",
+        description='Save the export profile as a JSON file next to the exported file',
+        default=False
+    )
 
 
 class HubsGLTFExportPanel(bpy.types.Panel):
@@ -254,8 +568,28 @@ class HubsGLTFExportPanel(bpy.types.Panel):
         props = bpy.context.scene.HubsComponentsExtensionProperties
         layout.active = props.enabled
 
-        box = layout.box()
-        box.label(text="No options yet")
+        layout.prop(props, 'networked_ids')
+        layout.prop(props, 'texture_profile')
+        layout.prop(props, 'image_deduplication')
+        layout.prop(props, 'compact_components')
+        layout.prop(props, 'incremental_export')
+        row = layout.row()
+        row.active = props.incremental_export
+        row.prop(props, 'incremental_export_check')
+        layout.prop(props, 'lightmap_atlas')
+        col = layout.column()
+        col.active = props.lightmap_atlas
+        col.prop(props, 'lightmap_atlas_size')
+        col.prop(props, 'lightmap_atlas_padding')
+        layout.prop(props, 'static_batching')
+        row = layout.row()
+        row.active = props.static_batching
+        row.prop(props, 'static_batching_max_vertices')
+        layout.prop(props, 'gpu_instancing')
+        layout.prop(props, 'profile_export')
+        row = layout.row()
+        row.active = props.profile_export
+        row.prop(props, 'profile_export_json')
 
 # called by gltf-blender-io after it has loaded
 
@@ -285,10 +619,16 @@ def register():
     bpy.types.Scene.HubsComponentsExtensionProperties = PointerProperty(
         type=HubsComponentsExtensionProperties)
     glTF2ExportUserExtension.add_excluded_property("HubsComponentsExtensionProperties")
+    gather_cache.register()
+    size_report.register()
+    glTF2ExportUserExtension.add_excluded_property("hubs_size_budget")
 
 
 def unregister():
     print("Unregister GLTF Exporter")
+    gather_cache.unregister()
+    size_report.unregister()
+    glTF2ExportUserExtension.remove_excluded_property("hubs_size_budget")
     unregister_export_panel()
     del bpy.types.Scene.HubsComponentsExtensionProperties
     bpy.utils.unregister_class(HubsComponentsExtensionProperties)
@@ -0,0 +1,216 @@
+import json
+from io_scene_gltf2.io.com import gltf2_io
+from io_scene_gltf2.io.com import gltf2_io_constants
+from io_scene_gltf2.io.com import gltf2_io_extensions
+from ..components.components_registry import get_component_by_name
+from .profiler import profiled
+
+# Export time GPU instancing.  Sibling leaf nodes that share the same mesh (and so the same materials), the same
+# instanceable component payload and the same extras are replaced by a single node that draws the mesh once per
+# instance with EXT_mesh_gpu_instancing.  Nodes whose component data differs are kept in separate groups, so every
+# instance keeps its own component data.
+
+EXTENSION_NAME = "EXT_mesh_gpu_instancing"
+HUBS_EXTENSION_NAME = "MOZ_hubs_components"
+
+
+class GPUInstancingReport:
+    def __init__(self):
+        self.instanced_nodes = 0
+        self.instancing_nodes = 0
+        self.saved_draw_calls = 0
+
+    def add_group(self, nodes):
+        self.instanced_nodes += len(nodes)
+        self.instancing_nodes += 1
+        # Every primitive of the mesh is a draw call per node, an instanced primitive is a single draw call
+        self.saved_draw_calls += (len(nodes) - 1) * len(nodes[0].mesh.primitives)
+
+    def report(self):
+        if self.instancing_nodes:
+            print(f"GPU instancing replaced {self.instanced_nodes} nodes by {self.instancing_nodes} instanced nodes, saving {self.saved_draw_calls} draw calls")
+
+
+def has_animation(animation_data):
+    return bool(animation_data and (animation_data.action or animation_data.nla_tracks or animation_data.drivers))
+
+
+def is_animated(blender_object):
+    '''Animated nodes are targeted by the exported animations, so they can't be replaced'''
+    if has_animation(blender_object.animation_data):
+        return True
+    shape_keys = getattr(blender_object.data, "shape_keys", None)
+    return shape_keys is not None and has_animation(shape_keys.animation_data)
+
+
+def find_linked_nodes(value, linked_nodes):
+    '''Collects the nodes linked from component data'''
+    if isinstance(value, dict):
+        if value.get("__mhc_link_type") == "node" and isinstance(value.get("index"), gltf2_io.Node):
+            linked_nodes.add(id(value["index"]))
+        for child in value.values():
+            find_linked_nodes(child, linked_nodes)
+    elif isinstance(value, list):
+        for child in value:
+            find_linked_nodes(child, linked_nodes)
+
+
+def get_component_data(gltf2_object):
+    extension = (gltf2_object.extensions or {}).get(HUBS_EXTENSION_NAME)
+    return extension.extension if extension is not None else None
+
+
+def iter_nodes(nodes):
+    for node in nodes:
+        if isinstance(node, gltf2_io.Node):
+            yield node
+            yield from iter_nodes(node.children or [])
+
+
+def get_linked_nodes(gltf2_scene):
+    '''Returns the ids of the nodes that are referenced from component data or skins'''
+    linked_nodes = set()
+    find_linked_nodes(get_component_data(gltf2_scene), linked_nodes)
+    for node in iter_nodes(gltf2_scene.nodes):
+        find_linked_nodes(get_component_data(node), linked_nodes)
+        if isinstance(node.skin, gltf2_io.Skin):
+            linked_nodes.update(id(joint) for joint in node.skin.joints)
+            if isinstance(node.skin.skeleton, gltf2_io.Node):
+                linked_nodes.add(id(node.skin.skeleton))
+        if isinstance(node.mesh, gltf2_io.Mesh):
+            for primitive in node.mesh.primitives:
+                if isinstance(primitive.material, gltf2_io.Material):
+                    find_linked_nodes(get_component_data(primitive.material), linked_nodes)
+    return linked_nodes
+
+
+def is_instanceable_payload(component_data):
+    for component_name in component_data or {}:
+        component_class = get_component_by_name(component_name)
+        if not component_class or not component_class.is_instanceable():
+            return False
+    return True
+
+
+def get_instance_key(node, blender_object, linked_nodes):
+    '''Returns the key of the instances that can replace the node, None if it can't be instanced'''
+    if (not isinstance(node.mesh, gltf2_io.Mesh) or node.children or node.skin is not None or node.camera is not None or
+            node.weights or node.matrix is not None or id(node) in linked_nodes):
+        return None
+    if blender_object is None or is_animated(blender_object):
+        return None
+    if set(node.extensions or {}) - {HUBS_EXTENSION_NAME}:
+        return None
+
+    component_data = get_component_data(node)
+    if not is_instanceable_payload(component_data):
+        return None
+
+    try:
+        payload = json.dumps([component_data, node.extras], sort_keys=True,
+                             default=lambda value: f"{type(value).__name__}:{id(value)}")
+    except (TypeError, ValueError):
+        return None
+    return (id(node.mesh), payload)
+
+
+def create_accessor(values, data_type):
+    import numpy as np
+    from .utils import HubsBinaryData
+    data = np.array(values, dtype=np.float32)
+    return gltf2_io.Accessor(
+        buffer_view=HubsBinaryData(data.tobytes()),
+        byte_offset=None,
+        component_type=gltf2_io_constants.ComponentType.Float,
+        count=len(values),
+        extensions=None,
+        extras=None,
+        max=None,
+        min=None,
+        name=None,
+        normalized=None,
+        sparse=None,
+        type=data_type
+    )
+
+
+def create_instancing_node(nodes):
+    first_node = nodes[0]
+    attributes = {
+        "TRANSLATION": create_accessor([node.translation or [0.0, 0.0, 0.0] for node in nodes],
+                                       gltf2_io_constants.DataType.Vec3),
+        "ROTATION": create_accessor([node.rotation or [0.0, 0.0, 0.0, 1.0] for node in nodes],
+                                    gltf2_io_constants.DataType.Vec4),
+        "SCALE": create_accessor([node.scale or [1.0, 1.0, 1.0] for node in nodes],
+                                 gltf2_io_constants.DataType.Vec3),
+    }
+    extensions = dict(first_node.extensions or {})
+    extensions[EXTENSION_NAME] = gltf2_io_extensions.Extension(
+        name=EXTENSION_NAME,
+        extension={"attributes": attributes},
+        # There is no fallback for the replaced nodes
+        required=True
+    )
+    return gltf2_io.Node(
+        camera=None,
+        children=[],
+        extensions=extensions,
+        extras=first_node.extras,
+        matrix=None,
+        mesh=first_node.mesh,
+        name=first_node.mesh.name or first_node.name,
+        rotation=None,
+        scale=None,
+        skin=None,
+        translation=None,
+        weights=None
+    )
+
+
+def instance_siblings(nodes, node_objects, linked_nodes, report):
+    '''Returns the list of sibling nodes with the instanceable groups replaced by an instancing node'''
+    groups = {}
+    for node in nodes:
+        if isinstance(node, gltf2_io.Node):
+            key = get_instance_key(node, node_objects.get(id(node)), linked_nodes)
+            if key is not None:
+                groups.setdefault(key, []).append(node)
+
+    replaced = {}
+    for group in groups.values():
+        if len(group) > 1:
+            instancing_node = create_instancing_node(group)
+            report.add_group(group)
+            for node in group:
+                replaced[id(node)] = instancing_node
+
+    result = []
+    added = set()
+    for node in nodes:
+        node = replaced.get(id(node), node)
+        if id(node) not in added:
+            added.add(id(node))
+            result.append(node)
+    return result
+
+
+@profiled("gpu_instancing")
+def instance_scene_nodes(gltf2_scene, export_settings):
+    '''Replaces the groups of instanceable sibling nodes of the scene by instancing nodes.  Needs the export vtree to
+    map the nodes to their objects so it only runs in Blender 3.2+.  Returns the report of the replaced nodes.'''
+    report = GPUInstancingReport()
+    if 'vtree' not in export_settings or export_settings.get('gltf_gpu_instances'):
+        return report
+
+    node_objects = {}
+    for vnode in export_settings['vtree'].nodes.values():
+        node = getattr(vnode, "node", None)
+        if node is not None and getattr(vnode, "blender_bone", None) is None:
+            node_objects[id(node)] = vnode.blender_object
+
+    linked_nodes = get_linked_nodes(gltf2_scene)
+    gltf2_scene.nodes = instance_siblings(gltf2_scene.nodes, node_objects, linked_nodes, report)
+    for node in list(iter_nodes(gltf2_scene.nodes)):
+        if node.children:
+            node.children = instance_siblings(node.children, node_objects, linked_nodes, report)
+    return report
@@ -0,0 +1,186 @@
+import bpy
+import hashlib
+import os
+import tempfile
+from concurrent.futures import Future
+from ..preferences import get_addon_pref
+from .image_encoder import get_image_encoder, can_encode_in_parallel
+from ..utils import get_prefs_dir_path
+
+# Persistent cache of encoded export images, shared between exports and Blender sessions.
+# Entries are keyed by the image content and the settings that affect the encoding, and evicted in LRU order.
+
+IMAGE_CACHE_DIR_NAME = "image_cache"
+# Bump this when the encoding changes in a way that invalidates the cached entries
+IMAGE_CACHE_VERSION = 2
+
+
+def get_image_cache_dir_path():
+    return os.path.join(get_prefs_dir_path(), IMAGE_CACHE_DIR_NAME)
+
+
+def get_image_cache_max_size():
+    '''Returns the maximum size of the cache in bytes, 0 if the cache is disabled'''
+    try:
+        return get_addon_pref(bpy.context).image_cache_size * 1024 * 1024
+    except Exception:
+        return 0
+
+
+def hash_image_content(blender_image, hasher):
+    if blender_image.packed_file is not None:
+        hasher.update(blender_image.packed_file.data)
+        return
+
+    src_path = bpy.path.abspath(blender_image.filepath_raw)
+    if blender_image.source == 'FILE' and not blender_image.is_dirty and os.path.isfile(src_path):
+        with open(src_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hasher.update(chunk)
+        return
+
+    import numpy as np
+    width, height = blender_image.size
+    pixels = np.empty(width * height * blender_image.channels, dtype=np.float32)
+    blender_image.pixels.foreach_get(pixels)
+    hasher.update(pixels.tobytes())
+
+
+def get_image_cache_key(blender_image, mime_type, export_settings, max_size=0):
+    hasher = hashlib.sha256()
+    hash_image_content(blender_image, hasher)
+    settings = (
+        IMAGE_CACHE_VERSION,
+        bpy.app.version,
+        mime_type,
+        tuple(blender_image.size),
+        blender_image.channels,
+        blender_image.file_format,
+        blender_image.alpha_mode,
+        blender_image.colorspace_settings.name,
+        export_settings.get('gltf_image_format'),
+        export_settings.get('gltf_image_quality'),
+        export_settings.get('gltf_jpeg_quality'),
+        # The parallel encoder output differs from Blender's so keep their entries apart
+        get_image_encoder(export_settings) is not None and can_encode_in_parallel(blender_image, mime_type),
+        # The resolution cap of the export texture profile, 0 if the image isn't resized
+        max_size,
+    )
+    hasher.update(repr(settings).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def get_image_cache_entry_path(key):
+    return os.path.join(get_image_cache_dir_path(), key + ".bin")
+
+
+def load_cached_image(key):
+    entry_path = get_image_cache_entry_path(key)
+    try:
+        with open(entry_path, 'rb') as f:
+            data = f.read()
+        # Touch the entry so it's considered recently used
+        os.utime(entry_path)
+        return data
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        print(f"Warning: Couldn't read the cached image {entry_path}: {err}")
+        return None
+
+
+def store_cached_image(key, data):
+    '''Stores an encoded image, it can be called from the encoder pool threads'''
+    cache_dir = get_image_cache_dir_path()
+    entry_path = get_image_cache_entry_path(key)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a unique temporary file first so other threads and Blender instances never read partial entries
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=key + ".", dir=cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, entry_path)
+    except Exception as err:
+        print(f"Warning: Couldn't write the cached image {entry_path}: {err}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def evict_cached_images(max_size):
+    '''Removes the least recently used entries until the cache fits in max_size bytes'''
+    cache_dir = get_image_cache_dir_path()
+    entries = []
+    total_size = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".bin"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # The entry was removed in the meantime
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+def evict_image_cache(export_settings):
+    '''Evicts the least recently used entries once per export, if it stored images.  Must be called once the encoder
+    pool has been shut down, so every image has been stored.'''
+    if not export_settings.pop('hubs_image_cache_stored', False):
+        return
+    max_size = get_image_cache_max_size()
+    if not max_size:
+        return
+    try:
+        evict_cached_images(max_size)
+    except OSError as err:
+        print(f"Warning: Couldn't evict the cached images: {err}")
+
+
+def clear_image_cache():
+    cache_dir = get_image_cache_dir_path()
+    if os.path.isdir(cache_dir):
+        import shutil
+        shutil.rmtree(cache_dir)
+
+
+def encode_image_cached(blender_image, mime_type, export_settings, encode, key=None):
+    '''Returns the encoded image data from the cache if available, otherwise encodes it and stores it in the cache.
+    The encode function can return a future, in that case the data is stored when the future is done.
+    The cache key can be passed if it has already been computed.'''
+    max_size = get_image_cache_max_size()
+    if not max_size:
+        return encode()
+
+    if key is None:
+        try:
+            key = get_image_cache_key(blender_image, mime_type, export_settings)
+        except Exception as err:
+            print(f"Warning: Couldn't compute the cache key for image {blender_image.name}: {err}")
+            return encode()
+
+    data = load_cached_image(key)
+    if data is None:
+        data = encode()
+        export_settings['hubs_image_cache_stored'] = True
+        if isinstance(data, Future):
+            # Store the image once the parallel encoder is done with it
+            def store_encoded_image(future):
+                if future.exception() is None:
+                    store_cached_image(key, future.result())
+            data.add_done_callback(store_encoded_image)
+        else:
+            store_cached_image(key, data)
+
+    return data
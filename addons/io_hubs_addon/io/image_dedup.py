@@ -0,0 +1,158 @@
+import hashlib
+
+# Export scoped image deduplication, enabled by the Deduplicate Images export option.  Images with the same content are
+# collapsed to a single glTF image in two steps:
+# - The images gathered by the add-on (lightmaps and component image/texture properties) are keyed by their source
+#   content and encoding settings before they're encoded, so duplicated datablocks are only encoded once and share
+#   the same glTF image and texture.
+# - Once everything is gathered, right before the glTF exporter assembles the buffers, the encoded bytes of the source
+#   images of every texture, including the material textures gathered by the glTF exporter, are hashed and textures
+#   with identical images are pointed to the same glTF image.  The images encoded in the background are only waited
+#   for then, as the buffers need their data anyway.
+
+
+class ImageDedup:
+    def __init__(self):
+        # content key -> glTF image
+        self.images_by_key = {}
+        # content key -> pointers of the image datablocks gathered with it
+        self.datablocks_by_key = {}
+        # (id(glTF image), is_hdr) -> glTF texture
+        self.textures_by_image = {}
+        # Textures whose source image can be replaced, in gather order
+        self.textures = []
+        self.texture_ids = set()
+        # Images that are linked directly from the components, so they can't be replaced
+        self.pinned_images = {}
+        # encoded data hash -> glTF image
+        self.images_by_hash = {}
+        self.image_hashes = {}
+        # Images that were deduplicated by content key, their size is added once their data is available
+        self.content_duplicates = []
+        self.replaced_image_ids = set()
+        self.saved_bytes = 0
+        self.removed_images = 0
+
+    def get_image(self, content_key, blender_image):
+        image = self.images_by_key.get(content_key)
+        if image is not None:
+            # The same datablock gathered for another usage isn't a duplicate
+            datablocks = self.datablocks_by_key[content_key]
+            if blender_image.as_pointer() not in datablocks:
+                datablocks.add(blender_image.as_pointer())
+                self.content_duplicates.append(image)
+        return image
+
+    def add_image(self, content_key, image, blender_image):
+        self.images_by_key[content_key] = image
+        self.datablocks_by_key[content_key] = {blender_image.as_pointer()}
+
+    def get_texture(self, image, is_hdr):
+        return self.textures_by_image.get((id(image), is_hdr))
+
+    def add_texture(self, texture, image=None, is_hdr=False):
+        if image is not None:
+            self.textures_by_image.setdefault((id(image), is_hdr), texture)
+        if id(texture) not in self.texture_ids:
+            self.texture_ids.add(id(texture))
+            self.textures.append(texture)
+
+    def pin_image(self, image):
+        self.pinned_images[id(image)] = image
+
+    def get_image_hash(self, image):
+        '''Returns the hash and size of the encoded image, None if its data isn't available'''
+        if id(image) not in self.image_hashes:
+            data = get_image_data(image)
+            if data is None:
+                return None
+            hasher = hashlib.sha256(str(image.mime_type).encode('utf-8'))
+            hasher.update(data)
+            # Keep a reference to the image so its id isn't reused
+            self.image_hashes[id(image)] = (hasher.hexdigest(), len(data), image)
+        return self.image_hashes[id(image)][:2]
+
+    def get_canonical_image(self, image):
+        image_hash = self.get_image_hash(image)
+        if image_hash is None:
+            return image
+        return self.images_by_hash.setdefault(image_hash[0], image)
+
+    def deduplicate(self):
+        '''Points the gathered textures with identical source images to the same glTF image.
+        Must be called after every texture has been gathered and before the glTF images are written.'''
+        for image in self.content_duplicates:
+            data = get_image_data(image)
+            if data is not None:
+                self.saved_bytes += len(data)
+                self.removed_images += 1
+        self.content_duplicates.clear()
+
+        # The images linked from components must be kept so make them the canonical ones
+        for image in self.pinned_images.values():
+            self.get_canonical_image(image)
+
+        for texture in self.textures:
+            source_owner, source_key = get_texture_source(texture)
+            if source_owner is None:
+                continue
+            image = get_source(source_owner, source_key)
+            if not is_unwritten_image(image):
+                continue
+            canonical_image = self.get_canonical_image(image)
+            if canonical_image is image:
+                continue
+            set_source(source_owner, source_key, canonical_image)
+            if id(image) not in self.replaced_image_ids and id(image) not in self.pinned_images:
+                self.replaced_image_ids.add(id(image))
+                self.saved_bytes += self.get_image_hash(image)[1]
+                self.removed_images += 1
+
+    def report(self):
+        '''Prints and returns the summary of the deduplication, None if no image was removed'''
+        if not self.removed_images:
+            return None
+        message = f"Image deduplication removed {self.removed_images} duplicated images, saving {self.saved_bytes} bytes"
+        print(message)
+        return message
+
+
+def is_unwritten_image(image):
+    # Images that have already been written are replaced by their index
+    return image is not None and not isinstance(image, int)
+
+
+def get_image_data(image):
+    from .image_encoder import resolve_data
+    if image.buffer_view is not None and not isinstance(image.buffer_view, int):
+        return resolve_data(image.buffer_view.data)
+    if image.uri is not None and hasattr(image.uri, "data"):
+        return resolve_data(image.uri.data)
+    return None
+
+
+def get_texture_source(texture):
+    '''Returns the object holding the source image of the texture and its key'''
+    extensions = texture.extensions or {}
+    rgbe = extensions.get("MOZ_texture_rgbe")
+    if rgbe is not None:
+        return rgbe.extension, "source"
+    if texture.source is not None:
+        return texture, "source"
+    return None, None
+
+
+def get_source(owner, key):
+    return owner[key] if isinstance(owner, dict) else getattr(owner, key)
+
+
+def set_source(owner, key, value):
+    if isinstance(owner, dict):
+        owner[key] = value
+    else:
+        setattr(owner, key, value)
+
+
+def get_image_dedup(export_settings):
+    '''Returns the export scoped image deduplication, None if it is disabled'''
+    return export_settings.get('hubs_image_dedup')
@@ -0,0 +1,181 @@
+import bpy
+import os
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from ..preferences import get_addon_pref
+
+# Parallel image encoding stage.  Blender data can only be accessed from the main thread so the pixels are
+# snapshotted there and only the encoding (which mostly runs in numpy/zlib and releases the GIL) is done in the pool.
+# The pool is opt-in: without workers the images are encoded by HubsExportImage.encode like any other export.  The PNG
+# encoder picks the filter of every scanline like libpng does, so its output is on par in size with Blender's.
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+PNG_COMPRESSION_LEVEL = 6
+# Scanline filter types: None, Sub, Up, Average and Paeth
+PNG_FILTER_COUNT = 5
+# Number of scanlines filtered at once, it bounds the memory used by the candidate filters
+PNG_FILTER_BLOCK_ROWS = 256
+
+
+def get_image_encode_workers():
+    try:
+        return get_addon_pref(bpy.context).image_encode_workers
+    except Exception:
+        return 0
+
+
+def get_image_encoder(export_settings):
+    '''Returns the export scoped encoder pool, None if parallel encoding is disabled'''
+    if 'hubs_image_encoder' not in export_settings:
+        workers = get_image_encode_workers()
+        export_settings['hubs_image_encoder'] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="hubs_image_encoder") if workers > 0 else None
+    return export_settings['hubs_image_encoder']
+
+
+def shutdown_image_encoder(export_settings):
+    encoder = export_settings.pop('hubs_image_encoder', None)
+    if encoder:
+        encoder.shutdown(wait=True)
+
+
+def is_hdr_passthrough(blender_image):
+    '''Saved and unmodified .hdr images are exported as they are'''
+    if blender_image.file_format != "HDR" or blender_image.source != 'FILE' or blender_image.is_dirty:
+        return False
+    if blender_image.packed_file is not None:
+        return True
+    return os.path.isfile(bpy.path.abspath(blender_image.filepath_raw))
+
+
+def read_image_file_header(blender_image, size=12):
+    '''Returns the first bytes of the file of a saved and unmodified image, None for the other images'''
+    if blender_image.source not in {'FILE', 'SEQUENCE'} or blender_image.is_dirty:
+        return None
+    if blender_image.packed_file is not None:
+        return blender_image.packed_file.data[:size]
+    try:
+        with open(bpy.path.abspath(blender_image.filepath_raw), 'rb') as f:
+            return f.read(size)
+    except OSError:
+        return None
+
+
+def is_file_passthrough(blender_image, mime_type):
+    '''Saved and unmodified PNG, JPEG and WebP files are copied as they are by the glTF exporter when they are exported
+    in their own format, it checks their magic number'''
+    header = read_image_file_header(blender_image)
+    if not header:
+        return False
+    if mime_type == "image/png":
+        return header.startswith(b'\x89PNG')
+    if mime_type == "image/jpeg":
+        return header.startswith(b'\xff\xd8\xff')
+    if mime_type == "image/webp":
+        return header[8:12] == b'WEBP'
+    return False
+
+
+def can_encode_in_parallel(blender_image, mime_type):
+    '''Supports 8 bit images that would be re-encoded as PNG and HDR images that need to be encoded from their pixels.
+    Unmodified PNG files are already copied as they are by the glTF exporter.'''
+    if mime_type == "image/vnd.radiance":
+        return blender_image.size[0] > 0 and not is_hdr_passthrough(blender_image)
+    if mime_type != "image/png" or blender_image.is_float:
+        return False
+    if blender_image.channels not in PNG_COLOR_TYPES:
+        return False
+    width, height = blender_image.size
+    if width == 0 or height == 0:
+        return False
+    return not (blender_image.source == 'FILE' and blender_image.file_format == 'PNG' and not blender_image.is_dirty)
+
+
+def snapshot_pixels(blender_image):
+    import numpy as np
+    width, height = blender_image.size
+    channels = blender_image.channels
+    pixels = np.empty(width * height * channels, dtype=np.float32)
+    blender_image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, channels)
+
+
+def png_chunk(tag, payload):
+    return struct.pack('>I', len(payload)) + tag + payload + struct.pack('>I', zlib.crc32(tag + payload) & 0xffffffff)
+
+
+def filter_scanlines(rows, previous_row, bpp):
+    '''Filters a block of scanlines with, for each of them, the filter type whose output has the lowest sum of absolute
+    values as signed bytes, the heuristic libpng uses.  Returns the scanlines prefixed with their filter type.'''
+    import numpy as np
+    rows = rows.astype(np.int16)
+    left = np.zeros_like(rows)
+    left[:, bpp:] = rows[:, :-bpp]
+    up = np.empty_like(rows)
+    up[0] = previous_row
+    up[1:] = rows[:-1]
+    up_left = np.zeros_like(rows)
+    up_left[:, bpp:] = up[:, :-bpp]
+
+    estimate = left + up - up_left
+    distance_left = np.abs(estimate - left)
+    distance_up = np.abs(estimate - up)
+    distance_up_left = np.abs(estimate - up_left)
+    paeth = np.where((distance_left <= distance_up) & (distance_left <= distance_up_left), left,
+                     np.where(distance_up <= distance_up_left, up, up_left))
+
+    predictions = (0, left, up, (left + up) >> 1, paeth)
+    filtered = np.stack([(rows - prediction).astype(np.uint8) for prediction in predictions])
+    costs = np.abs(filtered.view(np.int8).astype(np.int32)).sum(axis=2)
+    filter_types = np.argmin(costs, axis=0)
+
+    scanlines = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+    scanlines[:, 0] = filter_types
+    scanlines[:, 1:] = filtered[filter_types, np.arange(rows.shape[0])]
+    return scanlines
+
+
+def encode_png(pixels):
+    '''Encodes a (height, width, channels) array of normalized 8 bit pixel values, stored bottom-up like Blender does, as a PNG'''
+    import numpy as np
+    height, width, channels = pixels.shape
+    rows = np.clip(np.rint(pixels[::-1] * 255.0), 0, 255).astype(np.uint8).reshape(height, width * channels)
+
+    compressor = zlib.compressobj(PNG_COMPRESSION_LEVEL)
+    compressed = []
+    previous_row = np.zeros(width * channels, dtype=np.uint8)
+    for start in range(0, height, PNG_FILTER_BLOCK_ROWS):
+        block = rows[start:start + PNG_FILTER_BLOCK_ROWS]
+        compressed.append(compressor.compress(filter_scanlines(block, previous_row, channels).tobytes()))
+        previous_row = block[-1]
+    compressed.append(compressor.flush())
+
+    header = struct.pack('>IIBBBBB', width, height, 8, PNG_COLOR_TYPES[channels], 0, 0, 0)
+    return b''.join((
+        PNG_SIGNATURE,
+        png_chunk(b'IHDR', header),
+        png_chunk(b'IDAT', b''.join(compressed)),
+        png_chunk(b'IEND', b''),
+    ))
+
+
+def encode_image_async(blender_image, mime_type, export_settings):
+    '''Submits the image to the encoder pool and returns a future with the encoded data.
+    Returns None if the pool is disabled or the image can't be encoded in parallel, it is then encoded by
+    HubsExportImage.encode.'''
+    encoder = get_image_encoder(export_settings)
+    if not encoder or not can_encode_in_parallel(blender_image, mime_type):
+        return None
+
+    if mime_type == "image/vnd.radiance":
+        from .rgbe import encode_rgbe
+        return encoder.submit(encode_rgbe, snapshot_pixels(blender_image))
+    return encoder.submit(encode_png, snapshot_pixels(blender_image))
+
+
+def resolve_data(data):
+    if isinstance(data, Future):
+        return data.result()
+    return data
@@ -0,0 +1,260 @@
+import bpy
+import math
+from io_scene_gltf2.io.com import gltf2_io
+from io_scene_gltf2.io.com import gltf2_io_extensions
+from ..nodes.lightmap import MozLightmapNode
+from .profiler import profiled
+from .texture_profiles import USAGE_LIGHTMAP, get_texture_size_cap
+
+# Export time lightmap atlases.  The lightmaps of the exported materials are packed in a few atlases, grouped by
+# format, and the materials reference their region of the atlas with a KHR_texture_transform offset/scale.
+# Blender images are stored bottom-up and so are the atlases until they are encoded.
+
+
+def next_power_of_two(value):
+    return 1 << max(0, math.ceil(math.log2(max(1, value))))
+
+
+def pack_rectangles(sizes, max_size):
+    '''Packs (width, height) rectangles in as few max_size atlases as possible with a shelf packer: the rectangles
+    are sorted by height and placed left to right on shelves that are stacked on top of each other.
+    Returns the (atlas index, x, y) of every rectangle and the (width, height) of every atlas.'''
+    if not sizes:
+        return [], []
+
+    total_area = sum(width * height for width, height in sizes)
+    max_width = max(width for width, _ in sizes)
+    atlas_width = min(max_size, max(next_power_of_two(max_width), next_power_of_two(math.isqrt(total_area))))
+
+    # Every atlas is a list of shelves [y, height, used width] and its used height
+    atlases = []
+    placements = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    for i in order:
+        width, height = sizes[i]
+        placement = None
+        for atlas_index, (shelves, used_height) in enumerate(atlases):
+            for shelf in shelves:
+                if shelf[1] >= height and atlas_width - shelf[2] >= width:
+                    placement = (atlas_index, shelf[2], shelf[0])
+                    shelf[2] += width
+                    break
+            if placement:
+                break
+            if max_size - used_height >= height:
+                shelves.append([used_height, height, width])
+                atlases[atlas_index] = (shelves, used_height + height)
+                placement = (atlas_index, 0, used_height)
+                break
+        if not placement:
+            atlases.append(([[0, height, width]], height))
+            placement = (len(atlases) - 1, 0, 0)
+        placements[i] = placement
+
+    atlas_sizes = [(atlas_width, next_power_of_two(used_height)) for _, used_height in atlases]
+    return placements, atlas_sizes
+
+
+def get_lightmap_node(blender_material):
+    if not blender_material.node_tree or not blender_material.use_nodes:
+        return None
+    return next((n for n in blender_material.node_tree.nodes if isinstance(n, MozLightmapNode)), None)
+
+
+def get_lightmap_image(lightmap_node):
+    texture_socket = lightmap_node.inputs.get("Lightmap")
+    if not texture_socket or not texture_socket.links:
+        return None
+    # This assumes a single image directly connected to the socket, like the MOZ_lightmap export
+    return getattr(texture_socket.links[0].from_node, "image", None)
+
+
+def get_exported_materials(export_settings):
+    from .utils import get_vtree_index
+    if 'vtree' in export_settings:
+        objects = get_vtree_index(export_settings)[0].keys()
+    else:
+        objects = bpy.context.scene.objects
+
+    materials = {}
+    for ob in objects:
+        for slot in getattr(ob, "material_slots", []):
+            if slot.material:
+                materials.setdefault(slot.material, None)
+    return list(materials.keys())
+
+
+def to_rgb(pixels):
+    import numpy as np
+    channels = pixels.shape[2]
+    if channels >= 3:
+        return pixels[..., :3]
+    return np.repeat(pixels[..., :1], 3, axis=2)
+
+
+def compose_atlas(width, height, placements, pixel_arrays, padding):
+    '''Copies the lightmaps in the atlas, the padding around them repeats their edge pixels to avoid bleeding'''
+    import numpy as np
+    atlas = np.zeros((height, width, 3), dtype=np.float32)
+    for (x, y), pixels in zip(placements, pixel_arrays):
+        rgb = to_rgb(pixels)
+        if padding:
+            rgb = np.pad(rgb, ((padding, padding), (padding, padding), (0, 0)), mode='edge')
+        atlas[y:y + rgb.shape[0], x:x + rgb.shape[1]] = rgb
+    return atlas
+
+
+def encode_atlas(width, height, placements, pixel_arrays, padding, is_hdr):
+    from .image_encoder import encode_png
+    from .rgbe import encode_rgbe
+    atlas = compose_atlas(width, height, placements, pixel_arrays, padding)
+    return encode_rgbe(atlas) if is_hdr else encode_png(atlas)
+
+
+class LightmapAtlas:
+    def __init__(self, width, height, is_hdr):
+        self.width = width
+        self.height = height
+        self.is_hdr = is_hdr
+        # [(blender image, x, y)], the position of the padded lightmap in the atlas
+        self.entries = []
+        self.texture = None
+
+    def get_transform(self, blender_image, x, y, padding):
+        '''KHR_texture_transform mapping the lightmap UVs to its region of the atlas.
+        glTF UVs start at the top of the image while the atlas rows are stored bottom-up.'''
+        width, height = blender_image.size
+        left = x + padding
+        top = self.height - (y + padding + height)
+        return {
+            "offset": [left / self.width, top / self.height],
+            "scale": [width / self.width, height / self.height],
+        }
+
+    def gather_texture(self, index, padding, export_settings):
+        if self.texture is not None:
+            return self.texture
+
+        from .image_encoder import get_image_encoder, snapshot_pixels
+        from .utils import HubsBinaryData, HubsImageData
+        pixel_arrays = [snapshot_pixels(blender_image) for blender_image, _, _ in self.entries]
+        placements = [(x, y) for _, x, y in self.entries]
+        args = (self.width, self.height, placements, pixel_arrays, padding, self.is_hdr)
+        encoder = get_image_encoder(export_settings)
+        data = encoder.submit(encode_atlas, *args) if encoder else encode_atlas(*args)
+
+        name = f"lightmap_atlas_{index}"
+        mime_type = "image/vnd.radiance" if self.is_hdr else "image/png"
+        if export_settings['gltf_format'] == 'GLTF_SEPARATE':
+            uri = HubsImageData(data=data, mime_type=mime_type, name=name)
+            buffer_view = None
+        else:
+            uri = None
+            buffer_view = HubsBinaryData(data)
+        image = gltf2_io.Image(
+            buffer_view=buffer_view,
+            extensions=None,
+            extras=None,
+            mime_type=mime_type,
+            name=name,
+            uri=uri
+        )
+
+        texture_extensions = {}
+        if self.is_hdr:
+            texture_extensions["MOZ_texture_rgbe"] = gltf2_io_extensions.Extension(
+                name="MOZ_texture_rgbe",
+                extension={
+                    "source": image
+                },
+                required=False
+            )
+        self.texture = gltf2_io.Texture(
+            extensions=texture_extensions,
+            extras=None,
+            name=None,
+            sampler=None,
+            source=None if self.is_hdr else image
+        )
+        return self.texture
+
+
+class LightmapAtlasPlan:
+    def __init__(self, padding):
+        self.padding = padding
+        self.atlases = []
+        # blender image -> (atlas index, x, y)
+        self.placements = {}
+
+    def get_texture_and_transform(self, blender_image, export_settings):
+        '''Returns the atlas texture of the lightmap and the transform to its region, None if it isn't in an atlas'''
+        placement = self.placements.get(blender_image)
+        if placement is None:
+            return None
+        atlas_index, x, y = placement
+        atlas = self.atlases[atlas_index]
+        texture = atlas.gather_texture(atlas_index, self.padding, export_settings)
+        return texture, atlas.get_transform(blender_image, x, y, self.padding)
+
+
+def can_pack_lightmap(blender_image, lightmap_node, export_settings):
+    '''Lightmaps with a texture transform are exported as they are, composing the transforms isn't supported.
+    Float lightmaps that aren't HDR (e.g. 16 bit PNGs) hold linear values that the 8 bit atlases can't store.'''
+    from .utils import gather_lightmap_transform_and_tex_coord, is_hdr_image
+    if blender_image.is_float and not is_hdr_image(blender_image):
+        return False
+    tex_transform, _ = gather_lightmap_transform_and_tex_coord(lightmap_node.inputs.get("Lightmap"), export_settings)
+    return tex_transform is None
+
+
+@profiled("plan_lightmap_atlases")
+def plan_lightmap_atlases(export_settings, max_size, padding):
+    from .utils import is_hdr_image
+    groups = {}
+    excluded = set()
+    for blender_material in get_exported_materials(export_settings):
+        lightmap_node = get_lightmap_node(blender_material)
+        if not lightmap_node:
+            continue
+        blender_image = get_lightmap_image(lightmap_node)
+        if not blender_image:
+            continue
+
+        width, height = blender_image.size
+        if (width == 0 or height == 0 or max(width, height) + 2 * padding > max_size or
+                not can_pack_lightmap(blender_image, lightmap_node, export_settings)):
+            excluded.add(blender_image)
+            continue
+
+        # Lightmaps in different formats and color spaces can't share an atlas
+        group_key = (is_hdr_image(blender_image), blender_image.colorspace_settings.name)
+        groups.setdefault(group_key, {})[blender_image] = None
+
+    plan = LightmapAtlasPlan(padding)
+    for (is_hdr, _), group_images in groups.items():
+        blender_images = [blender_image for blender_image in group_images if blender_image not in excluded]
+        # A single lightmap doesn't need an atlas
+        if len(blender_images) < 2:
+            continue
+
+        sizes = [(image.size[0] + 2 * padding, image.size[1] + 2 * padding) for image in blender_images]
+        placements, atlas_sizes = pack_rectangles(sizes, max_size)
+        first_atlas = len(plan.atlases)
+        plan.atlases.extend(LightmapAtlas(width, height, is_hdr) for width, height in atlas_sizes)
+        for blender_image, (atlas_index, x, y) in zip(blender_images, placements):
+            plan.atlases[first_atlas + atlas_index].entries.append((blender_image, x, y))
+            plan.placements[blender_image] = (first_atlas + atlas_index, x, y)
+
+    return plan
+
+
+def get_lightmap_atlas_plan(export_settings):
+    '''Returns the export scoped atlas plan, None if lightmap atlases are disabled.  The plan is made the first time
+    it's requested, when the materials are gathered, so the exported objects are known.'''
+    if 'hubs_lightmap_atlas' not in export_settings:
+        props = bpy.context.scene.HubsComponentsExtensionProperties
+        # The atlases can't be larger than the lightmap resolution cap of the texture profile
+        max_size = min(filter(None, [int(props.lightmap_atlas_size), get_texture_size_cap(USAGE_LIGHTMAP)]))
+        export_settings['hubs_lightmap_atlas'] = plan_lightmap_atlases(
+            export_settings, max_size, props.lightmap_atlas_padding) if props.lightmap_atlas else None
+    return export_settings['hubs_lightmap_atlas']
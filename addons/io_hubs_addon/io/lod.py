@@ -0,0 +1,295 @@
+import bpy
+import hashlib
+import math
+from io_scene_gltf2.io.com import gltf2_io
+from io_scene_gltf2.io.com import gltf2_io_constants
+from io_scene_gltf2.io.com import gltf2_io_extensions
+from .profiler import profiled
+from .static_batching import create_accessor, create_index_accessor
+
+# Export time LOD chains.  The decimated levels of the objects with a lod component are built at the glTF level once
+# the scene is gathered: every level becomes a new mesh node that is referenced from the MSFT_lod extension of the
+# object node.  The levels are decimated with a Decimate modifier on a temporary object in a temporary scene, both
+# removed as soon as the level is read, so the user's data is never modified and nothing is left behind if the export
+# fails.  The decimated geometry is kept between exports as numpy arrays, keyed by the hash of the source mesh and the
+# decimation ratio, so it is only generated again when the source mesh changes.
+
+LOD_TEMP_NAME = "##hubs-export:lod##"
+# Number of decimated levels kept between exports
+LOD_CACHE_SIZE = 32
+# Vertical field of view used to convert the LOD distances to screen coverages, the one of the Hubs camera
+LOD_CAMERA_FOV = math.radians(80.0)
+
+# (source mesh hash, ratio) -> decimated level, least recently used first
+__lod_cache = {}
+
+
+def get_mesh_hash(mesh):
+    '''Hash of the geometry, UVs and materials of a mesh'''
+    import numpy as np
+    hasher = hashlib.sha256()
+
+    def update(collection, attribute, dtype, size=1):
+        data = np.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attribute, data)
+        hasher.update(data.tobytes())
+
+    update(mesh.vertices, "co", np.float32, 3)
+    update(mesh.loops, "vertex_index", np.int32)
+    update(mesh.polygons, "loop_total", np.int32)
+    update(mesh.polygons, "material_index", np.int32)
+    update(mesh.polygons, "use_smooth", np.bool_)
+    for uv_layer in mesh.uv_layers:
+        hasher.update(uv_layer.name.encode('utf-8'))
+        update(uv_layer.data, "uv", np.float32, 2)
+    for material in mesh.materials:
+        hasher.update((material.name if material else "").encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def get_used_material_indices(mesh):
+    '''The material indices of the faces, sorted like the primitives the exporter makes for them'''
+    import numpy as np
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    return np.unique(material_indices).tolist()
+
+
+def get_corner_normals(mesh):
+    import numpy as np
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if bpy.app.version < (4, 1, 0):
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    else:
+        mesh.corner_normals.foreach_get("vector", normals)
+    return normals.reshape(-1, 3)
+
+
+def read_level(mesh):
+    '''Reads the triangles of a mesh as numpy arrays: one vertex per unique corner and the indices per material index'''
+    import numpy as np
+    mesh.calc_loop_triangles()
+    triangle_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", triangle_loops)
+    triangle_materials = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("material_index", triangle_materials)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_indices)
+
+    columns = [co.reshape(-1, 3)[vertex_indices], get_corner_normals(mesh)]
+    for uv_layer in mesh.uv_layers:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        columns.append(uvs.reshape(-1, 2))
+
+    corners, corner_indices = np.unique(np.hstack(columns)[triangle_loops], axis=0, return_inverse=True)
+    triangles = corner_indices.reshape(-1, 3).astype(np.uint32)
+    return {
+        'positions': np.ascontiguousarray(corners[:, 0:3]),
+        'normals': np.ascontiguousarray(corners[:, 3:6]),
+        'uvs': [np.ascontiguousarray(corners[:, 6 + i * 2:8 + i * 2]) for i in range(len(mesh.uv_layers))],
+        'indices': {material_index: triangles[triangle_materials == material_index].ravel()
+                    for material_index in np.unique(triangle_materials).tolist()}
+    }
+
+
+def decimate_mesh(source_mesh, ratio):
+    '''Returns the level of the mesh decimated with a Decimate modifier, on a temporary object in a temporary scene'''
+    temp_scene = bpy.data.scenes.new(LOD_TEMP_NAME)
+    temp_object = None
+    try:
+        temp_object = bpy.data.objects.new(LOD_TEMP_NAME, source_mesh)
+        temp_scene.collection.objects.link(temp_object)
+        modifier = temp_object.modifiers.new("Decimate", 'DECIMATE')
+        modifier.decimate_type = 'COLLAPSE'
+        modifier.ratio = ratio
+        view_layer = temp_scene.view_layers[0]
+        view_layer.update()
+        evaluated_object = temp_object.evaluated_get(view_layer.depsgraph)
+        try:
+            return read_level(evaluated_object.to_mesh())
+        finally:
+            evaluated_object.to_mesh_clear()
+    finally:
+        if temp_object is not None:
+            bpy.data.objects.remove(temp_object)
+        bpy.data.scenes.remove(temp_scene)
+
+
+def get_cached_level(mesh_hash, ratio):
+    global __lod_cache
+    level = __lod_cache.pop((mesh_hash, ratio), None)
+    if level is not None:
+        __lod_cache[(mesh_hash, ratio)] = level
+    return level
+
+
+def cache_level(mesh_hash, ratio, level):
+    global __lod_cache
+    __lod_cache[(mesh_hash, ratio)] = level
+    while len(__lod_cache) > LOD_CACHE_SIZE:
+        del __lod_cache[next(iter(__lod_cache))]
+
+
+@profiled("generate_lod_meshes")
+def get_lod_levels(ob, ratios, export_settings):
+    '''Returns the decimated levels of the object for every ratio and the material indices of the source mesh.
+    The source mesh has the modifiers applied if the export applies them.'''
+    is_temporary = bool(export_settings.get('gltf_apply'))
+    if is_temporary:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        source_mesh = bpy.data.meshes.new_from_object(ob.evaluated_get(depsgraph))
+    else:
+        source_mesh = ob.data
+    try:
+        mesh_hash = get_mesh_hash(source_mesh)
+        levels = []
+        for ratio in ratios:
+            level = get_cached_level(mesh_hash, ratio)
+            if level is None:
+                level = decimate_mesh(source_mesh, ratio)
+                cache_level(mesh_hash, ratio, level)
+            levels.append(level)
+        return levels, get_used_material_indices(source_mesh)
+    finally:
+        if is_temporary:
+            bpy.data.meshes.remove(source_mesh)
+
+
+def to_gltf_space(values, export_settings):
+    '''Converts the positions and normals to the glTF axes, like the exporter does'''
+    import numpy as np
+    if export_settings.get('gltf_yup'):
+        values = np.stack((values[:, 0], values[:, 2], -values[:, 1]), axis=1)
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+def get_level_attribute(name, level, export_settings):
+    import numpy as np
+    if name == "POSITION":
+        return to_gltf_space(level['positions'], export_settings)
+    if name == "NORMAL":
+        return to_gltf_space(level['normals'], export_settings)
+    if name.startswith("TEXCOORD_"):
+        uv_index = int(name[len("TEXCOORD_"):])
+        if uv_index < len(level['uvs']):
+            uvs = level['uvs'][uv_index]
+            return np.ascontiguousarray(np.stack((uvs[:, 0], 1.0 - uvs[:, 1]), axis=1), dtype=np.float32)
+    return None
+
+
+def create_level_attributes(level, template_primitive, export_settings):
+    '''Creates the attributes of the level that the primitive of the source mesh has, the vertex colors, tangents,
+    skinning and morph targets aren't decimated'''
+    attributes = {}
+    for name, template in template_primitive.attributes.items():
+        if template.component_type != gltf2_io_constants.ComponentType.Float:
+            continue
+        values = get_level_attribute(name, level, export_settings)
+        if values is not None:
+            attributes[name] = create_accessor(values, template, gltf2_io_constants.BufferViewTarget.ARRAY_BUFFER,
+                                               bounds=name == "POSITION")
+    return attributes
+
+
+def create_lod_mesh(name, level, mesh, material_indices, export_settings):
+    '''Creates the glTF mesh of a level, its primitives use the materials of the matching primitives of the mesh'''
+    attributes = None
+    primitives = []
+    for material_index, template_primitive in zip(material_indices, mesh.primitives):
+        indices = level['indices'].get(material_index)
+        if indices is None or len(indices) == 0:
+            continue
+        if attributes is None:
+            attributes = create_level_attributes(level, template_primitive, export_settings)
+        primitives.append(gltf2_io.MeshPrimitive(
+            attributes=attributes,
+            extensions=None,
+            extras=None,
+            indices=create_index_accessor(indices, len(level['positions'])),
+            material=template_primitive.material,
+            mode=template_primitive.mode,
+            targets=None
+        ))
+
+    if not primitives:
+        return None
+    return gltf2_io.Mesh(
+        extensions=None,
+        extras=None,
+        name=name,
+        primitives=primitives,
+        weights=None
+    )
+
+
+def create_lod_node(name, mesh, node):
+    '''The levels are drawn in place of the node'''
+    return gltf2_io.Node(
+        camera=None,
+        children=[],
+        extensions=None,
+        extras=None,
+        matrix=node.matrix,
+        mesh=mesh,
+        name=name,
+        rotation=node.rotation,
+        scale=node.scale,
+        skin=None,
+        translation=node.translation,
+        weights=None
+    )
+
+
+def get_screen_coverage(radius, distance):
+    '''Approximate fraction of the screen covered by a sphere at the given distance'''
+    if distance <= 0:
+        return 1.0
+    return min(1.0, (radius / (distance * math.tan(LOD_CAMERA_FOV / 2))) ** 2)
+
+
+def get_screen_coverages(ob, distances):
+    '''MSFT_screencoverage hints: the minimum coverage of every level, the last one is 0 so the object is never culled'''
+    radius = ob.dimensions.length / 2
+    return [get_screen_coverage(radius, distance) for distance in distances] + [0.0]
+
+
+def gather_lod_extension(export_settings, ob, distances, ratios):
+    '''Adds the decimated levels of the object to the MSFT_lod extension of its node.  Must be called once every node
+    is gathered.'''
+    from .utils import gather_object_node
+    node = gather_object_node(export_settings, ob)
+    if node is None or node.mesh is None:
+        return
+
+    levels, material_indices = get_lod_levels(ob, ratios, export_settings)
+    if len(material_indices) != len(node.mesh.primitives):
+        print(f"Warning: The LOD levels of \"{ob.name}\" can't be exported, "
+              "its materials don't match the primitives of its mesh")
+        return
+
+    lod_nodes = []
+    lod_distances = []
+    for index, (level, distance) in enumerate(zip(levels, distances)):
+        name = f"{ob.name}_LOD{index + 1}"
+        mesh = create_lod_mesh(name, level, node.mesh, material_indices, export_settings)
+        if mesh is not None:
+            lod_nodes.append(create_lod_node(name, mesh, node))
+            lod_distances.append(distance)
+    if not lod_nodes:
+        return
+
+    if node.extensions is None:
+        node.extensions = {}
+    node.extensions["MSFT_lod"] = gltf2_io_extensions.Extension(
+        name="MSFT_lod",
+        extension={"ids": lod_nodes},
+        required=False
+    )
+    if node.extras is None:
+        node.extras = {}
+    node.extras["MSFT_screencoverage"] = get_screen_coverages(ob, lod_distances)
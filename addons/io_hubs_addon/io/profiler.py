@@ -0,0 +1,164 @@
+import bpy
+import json
+import os
+import time
+from concurrent.futures import Future
+from functools import wraps
+
+# Export profiler.  It's only active while exporting with profiling enabled, otherwise the instrumented functions
+# just check that there is no active profiler and call through.
+
+PROFILE_FILE_SUFFIX = ".profile.json"
+PROFILE_TABLE_COLUMNS = ["Name", "Calls", "Total (ms)", "Max (ms)", "Bytes"]
+
+
+class ExportProfiler:
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.total_time = 0.0
+        # name -> [calls, total time, max time, bytes]
+        self.stats = {}
+
+    def record(self, name, elapsed, byte_count=0):
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = [0, 0.0, 0.0, 0]
+        stat[0] += 1
+        stat[1] += elapsed
+        if elapsed > stat[2]:
+            stat[2] = elapsed
+        stat[3] += byte_count
+
+    def add_bytes(self, name, data):
+        '''Adds the size of the produced data to the entry.  Futures are measured once they are done.'''
+        if isinstance(data, Future):
+            def add_encoded_bytes(future):
+                if future.exception() is None:
+                    self.add_bytes(name, future.result())
+            data.add_done_callback(add_encoded_bytes)
+            return
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = [0, 0.0, 0.0, 0]
+        stat[3] += len(data)
+
+    def call(self, name, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self.start_time
+
+    def to_dict(self):
+        return {
+            "total_ms": self.total_time * 1000,
+            "entries": [
+                {
+                    "name": name,
+                    "calls": calls,
+                    "total_ms": total * 1000,
+                    "max_ms": max_time * 1000,
+                    "bytes": byte_count
+                }
+                for name, (calls, total, max_time, byte_count) in sorted(
+                    self.stats.items(), key=lambda item: item[1][1], reverse=True)
+            ]
+        }
+
+
+__profiler = None
+
+
+def get_export_profiler():
+    return __profiler
+
+
+def start_export_profiler():
+    global __profiler
+    __profiler = ExportProfiler()
+    return __profiler
+
+
+def stop_export_profiler():
+    global __profiler
+    profiler = __profiler
+    __profiler = None
+    if profiler:
+        profiler.finish()
+    return profiler
+
+
+def profiled(name):
+    '''Decorator that records the calls to the decorated function in the active export profiler'''
+    def decorator(func):
+        @wraps(func)
+        def wrapper_profiled(*args, **kwargs):
+            profiler = __profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+            return profiler.call(name, func, *args, **kwargs)
+        return wrapper_profiled
+    return decorator
+
+
+def get_json_size(data):
+    '''Approximate size of gathered component data once serialized, glTF references are counted as nulls'''
+    return len(json.dumps(data, default=lambda value: None))
+
+
+def write_export_profile(profile, export_settings):
+    filepath = export_settings.get('gltf_filepath')
+    if not filepath:
+        return None
+    profile_path = os.path.splitext(filepath)[0] + PROFILE_FILE_SUFFIX
+    with open(profile_path, "w") as f:
+        json.dump(profile, f, indent=2)
+    return profile_path
+
+
+def get_export_profile_table(profile):
+    rows = [
+        [entry["name"], entry["calls"], round(entry["total_ms"], 3), round(entry["max_ms"], 3), entry["bytes"]]
+        for entry in profile["entries"]
+    ]
+    # Sorted by total time, slowest first
+    return {"columns": PROFILE_TABLE_COLUMNS, "rows": rows, "sort_column": 2, "sort_descending": True}
+
+
+def show_export_profile(profile, profile_path=None):
+    messages = [f"Total export time: {profile['total_ms']:.1f} ms"]
+    if profile_path:
+        messages.append(f"Profile saved to {profile_path}")
+    for entry in profile["entries"]:
+        messages.append(
+            f"{entry['name']}: {entry['calls']} calls, {entry['total_ms']:.3f} ms total, {entry['max_ms']:.3f} ms max, {entry['bytes']} bytes")
+
+    if bpy.app.background:
+        print("\n".join(messages))
+        return
+
+    table_string = json.dumps(get_export_profile_table(profile))
+
+    def report_profile():
+        bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Hubs Export Profile",
+                                      report_string='\n\n'.join(messages), table_string=table_string)
+    bpy.app.timers.register(report_profile)
+
+
+def finish_export_profile(export_settings, write_json=False):
+    profiler = stop_export_profiler()
+    if not profiler:
+        return
+
+    profile = profiler.to_dict()
+    profile_path = None
+    if write_json:
+        try:
+            profile_path = write_export_profile(profile, export_settings)
+        except Exception as err:
+            print(f"Error: Couldn't write the export profile: {err}")
+
+    show_export_profile(profile, profile_path)
@@ -0,0 +1,109 @@
+import numpy as np
+
+# Radiance RGBE (.hdr) encoder for float pixel buffers.  Everything is computed array wide, including the run length
+# encoding of the scanlines, so large environment maps can be encoded without a Python loop per pixel.
+
+RGBE_MIN_RUN = 4
+RGBE_MAX_RUN = 127
+RGBE_MAX_DUMP = 128
+RGBE_MIN_RLE_WIDTH = 8
+RGBE_MAX_RLE_WIDTH = 0x7fff
+
+
+def float_to_rgbe(pixels):
+    '''Converts a (height, width, channels) float array to planar (height, 4, width) uint8 RGBE scanlines'''
+    height, width, channels = pixels.shape
+    rgb = [pixels[..., min(c, channels - 1)] for c in range(3)]
+
+    # fmax also replaces NaNs with 0
+    brightest = np.fmax(np.fmax(np.fmax(rgb[0], rgb[1]), rgb[2]), 0).astype(np.float32)
+    np.minimum(brightest, np.finfo(np.float32).max, out=brightest)
+    mantissa, exponent = np.frexp(brightest)
+    visible = brightest > 1e-32
+    scale = np.divide(mantissa * np.float32(256.0), brightest, out=np.zeros_like(brightest), where=visible)
+
+    rgbe = np.empty((height, 4, width), dtype=np.uint8)
+    channel = np.empty_like(brightest)
+    for c in range(3):
+        np.multiply(np.fmax(rgb[c], 0), scale, out=channel)
+        np.minimum(channel, 255, out=channel)
+        rgbe[:, c, :] = channel
+    rgbe[:, 3, :] = np.where(visible, exponent + 128, 0)
+    return rgbe
+
+
+def rle_encode_scanlines(rgbe):
+    '''Encodes planar (height, 4, width) RGBE scanlines with the new style run length encoding.
+    Each scanline is stored as a 4 byte header followed by its four channels, each of them run length encoded separately.'''
+    height, _, width = rgbe.shape
+    # One row per scanline channel, in file order
+    data = rgbe.reshape(-1)
+
+    # Find the stretches of at least RGBE_MIN_RUN equal values, they can't cross rows
+    same = np.zeros(data.size + 1, dtype=np.int8)
+    np.equal(data[1:], data[:-1], out=same[1:-1].view(bool))
+    same[width::width] = 0
+    edges = np.flatnonzero(np.diff(same))
+    run_starts = edges[::2]
+    run_lengths = edges[1::2] - run_starts + 1
+    long_runs = run_lengths >= RGBE_MIN_RUN
+    run_starts = run_starts[long_runs]
+    run_lengths = run_lengths[long_runs]
+
+    # Everything between runs and row boundaries is stored as literal dumps
+    is_boundary = np.zeros(data.size + 1, dtype=bool)
+    is_boundary[::width] = True
+    is_boundary[run_starts + run_lengths] = True
+    is_run_start = np.zeros(data.size + 1, dtype=bool)
+    is_run_start[run_starts] = True
+    is_boundary |= is_run_start
+    boundaries = np.flatnonzero(is_boundary)
+    group_starts = boundaries[:-1]
+    group_lengths = np.diff(boundaries)
+    group_is_run = is_run_start[group_starts]
+
+    # Runs and dumps have a maximum length so split the groups in pieces
+    group_caps = np.where(group_is_run, RGBE_MAX_RUN, RGBE_MAX_DUMP)
+    group_pieces = -(-group_lengths // group_caps)
+    piece_group = np.repeat(np.arange(group_starts.size), group_pieces)
+    piece_index = np.arange(piece_group.size) - np.repeat(np.cumsum(group_pieces) - group_pieces, group_pieces)
+    piece_caps = group_caps[piece_group]
+    piece_starts = group_starts[piece_group] + piece_index * piece_caps
+    piece_lengths = np.minimum(piece_caps, group_lengths[piece_group] - piece_index * piece_caps)
+    piece_is_run = group_is_run[piece_group]
+
+    # Runs are stored as (count + 128, value) and dumps as (count, values...).  Every scanline has a 4 byte header.
+    piece_sizes = np.where(piece_is_run, 2, piece_lengths + 1)
+    piece_scanlines = piece_starts // (width * 4)
+    piece_offsets = np.cumsum(piece_sizes) - piece_sizes + (piece_scanlines + 1) * 4
+    out = np.empty(int(piece_sizes.sum()) + height * 4, dtype=np.uint8)
+    # Positions in the output that are filled with the dumped values
+    dump_mask = np.ones(out.size, dtype=bool)
+
+    header_offsets = piece_offsets[np.searchsorted(piece_starts, np.arange(height) * width * 4)] - 4
+    for i, value in enumerate((2, 2, width >> 8, width & 0xff)):
+        out[header_offsets + i] = value
+        dump_mask[header_offsets + i] = False
+
+    out[piece_offsets] = np.where(piece_is_run, piece_lengths + 128, piece_lengths)
+    dump_mask[piece_offsets] = False
+    run_offsets = piece_offsets[piece_is_run] + 1
+    out[run_offsets] = data[piece_starts[piece_is_run]]
+    dump_mask[run_offsets] = False
+
+    out[dump_mask] = data[np.repeat(~group_is_run, group_lengths)]
+
+    return out.tobytes()
+
+
+def encode_rgbe(pixels):
+    '''Encodes a (height, width, channels) float array, stored bottom-up like Blender does, as a Radiance .hdr file'''
+    height, width = pixels.shape[:2]
+    rgbe = float_to_rgbe(pixels[::-1])
+
+    header = f"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n-Y {height} +X {width}\n".encode('ascii')
+    if RGBE_MIN_RLE_WIDTH <= width <= RGBE_MAX_RLE_WIDTH and height > 0:
+        return header + rle_encode_scanlines(rgbe)
+
+    # Run length encoding isn't supported for these widths, store flat pixels
+    return header + np.ascontiguousarray(rgbe.transpose(0, 2, 1)).tobytes()
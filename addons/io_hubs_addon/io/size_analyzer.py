@@ -0,0 +1,305 @@
+import json
+import os
+import struct
+
+# GLB/glTF size analysis.  Attributes the bytes of an exported file to its images, meshes, animations, skins and
+# Hubs components and checks them against size budgets.  This module doesn't depend on bpy so it can also be used
+# outside of Blender, see scripts/analyze_glb.py.
+
+GLB_MAGIC = 0x46546C67
+GLB_CHUNK_JSON = 0x4E4F534A
+GLB_CHUNK_BIN = 0x004E4942
+
+COMPONENT_TYPE_SIZES = {5120: 1, 5121: 1, 5122: 2, 5123: 2, 5125: 4, 5126: 4}
+TYPE_COMPONENT_COUNTS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+
+HUBS_EXTENSION_NAME = "MOZ_hubs_components"
+MATERIAL_TEXTURE_KEYS = ["normalTexture", "occlusionTexture", "emissiveTexture"]
+PBR_TEXTURE_KEYS = ["baseColorTexture", "metallicRoughnessTexture"]
+
+# Budgets in bytes, 0 disables a budget.  "image", "mesh" and "animation" apply to every item of that category,
+# "components" to the whole components JSON and "total" to the file size.
+DEFAULT_BUDGETS = {
+    "total": 16 * 1024 * 1024,
+    "image": 4 * 1024 * 1024,
+    "mesh": 4 * 1024 * 1024,
+    "animation": 2 * 1024 * 1024,
+    "components": 1024 * 1024,
+}
+ITEM_BUDGET_CATEGORIES = ["image", "mesh", "animation"]
+
+
+def read_glb(path):
+    '''Returns the JSON document and the length of the binary chunk of a GLB file'''
+    with open(path, 'rb') as f:
+        magic, _version, _length = struct.unpack('<III', f.read(12))
+        if magic != GLB_MAGIC:
+            raise Exception(f"{path} is not a GLB file")
+
+        document = None
+        bin_length = 0
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_length, chunk_type = struct.unpack('<II', chunk_header)
+            if chunk_type == GLB_CHUNK_JSON:
+                document = json.loads(f.read(chunk_length).decode('utf-8'))
+            else:
+                if chunk_type == GLB_CHUNK_BIN:
+                    bin_length = chunk_length
+                f.seek(chunk_length, os.SEEK_CUR)
+
+    if document is None:
+        raise Exception(f"{path} doesn't have a JSON chunk")
+    return document, bin_length
+
+
+def get_accessor_size(document, accessor):
+    buffer_view_index = accessor.get("bufferView")
+    if buffer_view_index is None:
+        return 0
+    buffer_view = document["bufferViews"][buffer_view_index]
+    element_size = COMPONENT_TYPE_SIZES[accessor["componentType"]] * TYPE_COMPONENT_COUNTS[accessor["type"]]
+    stride = buffer_view.get("byteStride", element_size)
+    return min(accessor["count"] * stride, buffer_view["byteLength"])
+
+
+def find_component_texture_indices(value, indices):
+    '''Collects the textures and images linked from component data'''
+    if isinstance(value, dict):
+        link_type = value.get("__mhc_link_type")
+        if link_type in {"texture", "image"} and isinstance(value.get("index"), int):
+            indices.add((link_type, value["index"]))
+        for child in value.values():
+            find_component_texture_indices(child, indices)
+    elif isinstance(value, list):
+        for child in value:
+            find_component_texture_indices(child, indices)
+
+
+def get_hubs_components(document):
+    '''Yields the component data of every host in the document'''
+    hosts = document.get("scenes", []) + document.get("nodes", []) + document.get("materials", [])
+    for host in hosts:
+        components = host.get("extensions", {}).get(HUBS_EXTENSION_NAME)
+        if components:
+            yield components
+
+
+def get_image_roles(document):
+    '''Returns a role for every image: lightmap, environment map (RGBE textures, used by skyboxes and reflection
+    probes), component (other component images) or texture (material textures)'''
+    textures = document.get("textures", [])
+    texture_roles = {}
+
+    def set_texture_role(texture_index, role):
+        if texture_index is not None and 0 <= texture_index < len(textures):
+            texture_roles.setdefault(texture_index, role)
+
+    for material in document.get("materials", []):
+        lightmap = material.get("extensions", {}).get("MOZ_lightmap")
+        if lightmap:
+            set_texture_role(lightmap.get("index"), "lightmap")
+        texture_infos = [material.get(key) for key in MATERIAL_TEXTURE_KEYS]
+        pbr = material.get("pbrMetallicRoughness", {})
+        texture_infos += [pbr.get(key) for key in PBR_TEXTURE_KEYS]
+        for texture_info in texture_infos:
+            if texture_info:
+                set_texture_role(texture_info.get("index"), "texture")
+
+    linked = set()
+    for components in get_hubs_components(document):
+        find_component_texture_indices(components, linked)
+
+    image_roles = {}
+    for link_type, index in linked:
+        if link_type == "image":
+            image_roles.setdefault(index, "component")
+        else:
+            set_texture_role(index, "component")
+
+    for texture_index, texture in enumerate(textures):
+        rgbe = texture.get("extensions", {}).get("MOZ_texture_rgbe")
+        if rgbe and rgbe.get("source") is not None:
+            # HDR lightmaps and material textures keep their role, the ones linked from components are environment maps
+            role = texture_roles.get(texture_index, "component")
+            image_roles.setdefault(rgbe["source"], "environment map" if role == "component" else role)
+        elif texture.get("source") is not None:
+            image_roles.setdefault(texture["source"], texture_roles.get(texture_index, "texture"))
+
+    return image_roles
+
+
+def analyze_gltf_document(document, bin_length, file_size, base_dir=None):
+    items = []
+    attributed = 0
+    counted_accessors = set()
+
+    def accessors_size(accessor_indices):
+        size = 0
+        for accessor_index in accessor_indices:
+            if accessor_index is None or accessor_index in counted_accessors:
+                continue
+            counted_accessors.add(accessor_index)
+            size += get_accessor_size(document, document["accessors"][accessor_index])
+        return size
+
+    image_roles = get_image_roles(document)
+    for index, image in enumerate(document.get("images", [])):
+        if "bufferView" in image:
+            size = document["bufferViews"][image["bufferView"]]["byteLength"]
+            attributed += size
+        elif base_dir and image.get("uri") and not image["uri"].startswith("data:"):
+            image_path = os.path.join(base_dir, image["uri"])
+            size = os.path.getsize(image_path) if os.path.isfile(image_path) else 0
+        else:
+            size = 0
+        items.append({
+            "category": "image",
+            "name": image.get("name") or f"image {index}",
+            "detail": image_roles.get(index, "unused"),
+            "bytes": size,
+        })
+
+    for index, mesh in enumerate(document.get("meshes", [])):
+        accessor_indices = []
+        for primitive in mesh.get("primitives", []):
+            accessor_indices += primitive.get("attributes", {}).values()
+            accessor_indices.append(primitive.get("indices"))
+            for target in primitive.get("targets", []):
+                accessor_indices += target.values()
+        size = accessors_size(accessor_indices)
+        attributed += size
+        items.append({
+            "category": "mesh",
+            "name": mesh.get("name") or f"mesh {index}",
+            "detail": f"{len(mesh.get('primitives', []))} primitives",
+            "bytes": size,
+        })
+
+    for index, animation in enumerate(document.get("animations", [])):
+        accessor_indices = []
+        for sampler in animation.get("samplers", []):
+            accessor_indices += [sampler.get("input"), sampler.get("output")]
+        size = accessors_size(accessor_indices)
+        attributed += size
+        items.append({
+            "category": "animation",
+            "name": animation.get("name") or f"animation {index}",
+            "detail": f"{len(animation.get('channels', []))} channels",
+            "bytes": size,
+        })
+
+    for index, skin in enumerate(document.get("skins", [])):
+        size = accessors_size([skin.get("inverseBindMatrices")])
+        attributed += size
+        items.append({
+            "category": "skin",
+            "name": skin.get("name") or f"skin {index}",
+            "detail": f"{len(skin.get('joints', []))} joints",
+            "bytes": size,
+        })
+
+    # Components are stored in the JSON chunk, they are attributed per component type
+    component_sizes = {}
+    component_counts = {}
+    for components in get_hubs_components(document):
+        for component_name, component_data in components.items():
+            size = len(json.dumps({component_name: component_data}, separators=(',', ':')))
+            component_sizes[component_name] = component_sizes.get(component_name, 0) + size
+            component_counts[component_name] = component_counts.get(component_name, 0) + 1
+    for component_name, size in component_sizes.items():
+        items.append({
+            "category": "components",
+            "name": component_name,
+            "detail": f"{component_counts[component_name]} hosts",
+            "bytes": size,
+        })
+
+    if bin_length > attributed:
+        items.append({
+            "category": "other",
+            "name": "unattributed binary data",
+            "detail": "",
+            "bytes": bin_length - attributed,
+        })
+
+    totals = {}
+    for item in items:
+        totals[item["category"]] = totals.get(item["category"], 0) + item["bytes"]
+
+    return {
+        "file_size": file_size,
+        "bin_size": bin_length,
+        "totals": totals,
+        "items": sorted(items, key=lambda item: item["bytes"], reverse=True),
+    }
+
+
+def analyze_gltf_file(path):
+    '''Analyzes a .glb file, or a .gltf file along with its external buffers and images'''
+    file_size = os.path.getsize(path)
+    base_dir = os.path.dirname(path)
+    if os.path.splitext(path)[1].lower() == ".glb":
+        document, bin_length = read_glb(path)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        bin_length = 0
+        for buffer in document.get("buffers", []):
+            uri = buffer.get("uri")
+            if uri and not uri.startswith("data:") and os.path.isfile(os.path.join(base_dir, uri)):
+                buffer_size = os.path.getsize(os.path.join(base_dir, uri))
+                bin_length += buffer_size
+                file_size += buffer_size
+        for image in document.get("images", []):
+            uri = image.get("uri")
+            if uri and not uri.startswith("data:") and os.path.isfile(os.path.join(base_dir, uri)):
+                file_size += os.path.getsize(os.path.join(base_dir, uri))
+
+    analysis = analyze_gltf_document(document, bin_length, file_size, base_dir)
+    analysis["path"] = path
+    return analysis
+
+
+def check_size_budgets(analysis, budgets=None):
+    '''Returns the budget violations of an analysis as a list of messages'''
+    budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+    violations = []
+
+    if budgets["total"] and analysis["file_size"] > budgets["total"]:
+        violations.append(
+            f"The file is {format_size(analysis['file_size'])}, over the {format_size(budgets['total'])} budget")
+
+    components_size = analysis["totals"].get("components", 0)
+    if budgets["components"] and components_size > budgets["components"]:
+        violations.append(
+            f"The components are {format_size(components_size)}, over the {format_size(budgets['components'])} budget")
+
+    for item in analysis["items"]:
+        budget = budgets.get(item["category"]) if item["category"] in ITEM_BUDGET_CATEGORIES else 0
+        if budget and item["bytes"] > budget:
+            violations.append(
+                f"The {item['category']} \"{item['name']}\" ({item['detail']}) is {format_size(item['bytes'])}, over the {format_size(budget)} budget")
+
+    return violations
+
+
+def format_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+def get_size_report(analysis, budgets=None):
+    '''Returns the machine readable report of an analysis, including the budget violations'''
+    violations = check_size_budgets(analysis, budgets)
+    return {
+        **analysis,
+        "budgets": {**DEFAULT_BUDGETS, **(budgets or {})},
+        "violations": violations,
+        "passed": not violations,
+    }
@@ -0,0 +1,228 @@
+import bpy
+import json
+import os
+from bpy.props import BoolProperty, FloatProperty, StringProperty
+from bpy_extras.io_utils import ImportHelper
+from .size_analyzer import analyze_gltf_file, get_size_report, format_size
+
+SIZE_REPORT_FILE_SUFFIX = ".size.json"
+SIZE_REPORT_TABLE_COLUMNS = ["Name", "Category", "Detail", "Bytes"]
+
+
+class HubsSizeBudgetProperties(bpy.types.PropertyGroup):
+    analyze_after_export: BoolProperty(
+        name="Analyze After Export",
+        description="Analyze the size of the exported file and check it against the budgets after every export",
+        default=False)
+    save_report: BoolProperty(
+        name="Save Report",
+        description="Save the size report as a JSON file next to the analyzed file",
+        default=False)
+    total_budget: FloatProperty(
+        name="File", description="Maximum size of the whole file in MB, 0 disables the budget",
+        default=16.0, min=0.0)
+    image_budget: FloatProperty(
+        name="Image", description="Maximum size of every image in MB, 0 disables the budget",
+        default=4.0, min=0.0)
+    mesh_budget: FloatProperty(
+        name="Mesh", description="Maximum size of every mesh in MB, 0 disables the budget",
+        default=4.0, min=0.0)
+    animation_budget: FloatProperty(
+        name="Animation", description="Maximum size of every animation in MB, 0 disables the budget",
+        default=2.0, min=0.0)
+    components_budget: FloatProperty(
+        name="Components", description="Maximum size of the Hubs components JSON in MB, 0 disables the budget",
+        default=1.0, min=0.0)
+
+
+def get_scene_budgets(scene):
+    props = scene.hubs_size_budget
+    return {
+        "total": int(props.total_budget * 1024 * 1024),
+        "image": int(props.image_budget * 1024 * 1024),
+        "mesh": int(props.mesh_budget * 1024 * 1024),
+        "animation": int(props.animation_budget * 1024 * 1024),
+        "components": int(props.components_budget * 1024 * 1024),
+    }
+
+
+__last_report = (None, None)
+# (file path, scene, export messages) of the files exported in background mode that haven't been analyzed yet
+__pending_analyses = []
+
+
+def get_last_size_report(context):
+    '''Returns the latest size report, parsed only once since it's drawn in the panel'''
+    global __last_report
+    report_string = context.window_manager.hubs_size_report
+    if not report_string:
+        return None
+    if __last_report[0] != report_string:
+        __last_report = (report_string, json.loads(report_string))
+    return __last_report[1]
+
+
+def show_size_report(report, export_messages=()):
+    messages = [f"{os.path.basename(report['path'])}: {format_size(report['file_size'])}"]
+    messages.extend(export_messages)
+    messages.extend(f"Warning: {violation}" for violation in report["violations"])
+    for category, size in sorted(report["totals"].items(), key=lambda item: item[1], reverse=True):
+        messages.append(f"{category}: {format_size(size)}")
+
+    table = {
+        "columns": SIZE_REPORT_TABLE_COLUMNS,
+        "rows": [[item["name"], item["category"], item["detail"], item["bytes"]] for item in report["items"]],
+        "sort_column": 3,
+        "sort_descending": True
+    }
+    title = "Size Report" if report["passed"] else f"Size Report: {len(report['violations'])} Over Budget"
+    bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title=title,
+                                  report_string='\n\n'.join(messages), table_string=json.dumps(table))
+
+
+def analyze_size(filepath, scene, display_report=True, export_messages=()):
+    report = get_size_report(analyze_gltf_file(filepath), get_scene_budgets(scene))
+    bpy.context.window_manager.hubs_size_report = json.dumps(report)
+
+    if scene.hubs_size_budget.save_report:
+        report_path = os.path.splitext(filepath)[0] + SIZE_REPORT_FILE_SUFFIX
+        try:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
+        except Exception as err:
+            print(f"Warning: Couldn't write the size report {report_path}: {err}")
+
+    for violation in report["violations"]:
+        print(f"Warning: {violation}")
+
+    if display_report and not bpy.app.background:
+        show_size_report(report, export_messages)
+
+    return report
+
+
+def analyze_exported_file(filepath, scene, export_messages=()):
+    if not os.path.isfile(filepath):
+        print(f"Warning: Couldn't find the exported file {filepath} to analyze")
+        return None
+    try:
+        return analyze_size(filepath, scene, export_messages=export_messages)
+    except Exception as err:
+        print(f"Warning: Couldn't analyze the exported file {filepath}: {err}")
+        return None
+
+
+def analyze_size_after_export(filepath, export_messages=()):
+    '''The exported file is written after the post export callbacks, so it's analyzed once the export is done.
+    The export messages are shown along with the size report.  Timers never run in background mode, there the analysis
+    is queued until run_pending_size_analyses is called once the export operator has returned.'''
+    global __pending_analyses
+    scene = bpy.context.scene
+    if bpy.app.background:
+        __pending_analyses.append((filepath, scene, tuple(export_messages)))
+        print(f"The size analysis of {filepath} runs when run_pending_size_analyses() is called after the export, "
+              "scripts/batch_export.py does it. It can also be run on the file with scripts/analyze_glb.py.")
+        return
+
+    def analyze_exported_file_later():
+        analyze_exported_file(filepath, scene, export_messages)
+    bpy.app.timers.register(analyze_exported_file_later)
+
+
+def run_pending_size_analyses():
+    '''Analyzes the files exported in background mode since the last call, returns their size reports'''
+    global __pending_analyses
+    pending_analyses, __pending_analyses = __pending_analyses, []
+    reports = [analyze_exported_file(*pending_analysis) for pending_analysis in pending_analyses]
+    return [report for report in reports if report is not None]
+
+
+class AnalyzeGLTFSize(bpy.types.Operator, ImportHelper):
+    bl_idname = "wm.hubs_analyze_gltf_size"
+    bl_label = "Analyze GLB Size"
+    bl_description = "Break down the size of an exported GLB/glTF file and check it against the scene budgets"
+
+    filter_glob: StringProperty(
+        default='*.glb;*.gltf',
+        options={'HIDDEN'}
+    )
+
+    def execute(self, context):
+        try:
+            analyze_size(self.filepath, context.scene)
+        except Exception as err:
+            self.report({'ERROR'}, f"Couldn't analyze {self.filepath}: {err}")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
+class ViewLastSizeReport(bpy.types.Operator):
+    bl_idname = "wm.hubs_view_last_size_report"
+    bl_label = "View Size Report"
+    bl_description = "Show the latest size report"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.window_manager.hubs_size_report)
+
+    def execute(self, context):
+        show_size_report(get_last_size_report(context))
+        return {'FINISHED'}
+
+
+class HubsSizeBudgetPanel(bpy.types.Panel):
+    bl_label = "Size Budget"
+    bl_idname = "SCENE_PT_hubs_size_budget"
+    bl_parent_id = "SCENE_PT_hubs"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = 'scene'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        props = context.scene.hubs_size_budget
+
+        col = layout.column(heading="Budgets (MB)")
+        col.prop(props, "total_budget")
+        col.prop(props, "image_budget")
+        col.prop(props, "mesh_budget")
+        col.prop(props, "animation_budget")
+        col.prop(props, "components_budget")
+
+        col = layout.column()
+        col.prop(props, "analyze_after_export")
+        col.prop(props, "save_report")
+
+        row = layout.row()
+        row.operator(AnalyzeGLTFSize.bl_idname, icon='FILE_BLANK')
+        row.operator(ViewLastSizeReport.bl_idname, icon='TEXT')
+
+        report = get_last_size_report(context)
+        if report:
+            box = layout.box()
+            box.label(text=f"{os.path.basename(report['path'])}: {format_size(report['file_size'])}",
+                      icon='CHECKMARK' if report["passed"] else 'ERROR')
+            for category, size in sorted(report["totals"].items(), key=lambda item: item[1], reverse=True):
+                box.label(text=f"{category}: {format_size(size)}")
+            if not report["passed"]:
+                box.label(text=f"{len(report['violations'])} items over budget")
+
+
+def register():
+    bpy.utils.register_class(HubsSizeBudgetProperties)
+    bpy.utils.register_class(AnalyzeGLTFSize)
+    bpy.utils.register_class(ViewLastSizeReport)
+    bpy.utils.register_class(HubsSizeBudgetPanel)
+    bpy.types.Scene.hubs_size_budget = bpy.props.PointerProperty(type=HubsSizeBudgetProperties)
+    bpy.types.WindowManager.hubs_size_report = StringProperty()
+
+
+def unregister():
+    del bpy.types.WindowManager.hubs_size_report
+    del bpy.types.Scene.hubs_size_budget
+    bpy.utils.unregister_class(HubsSizeBudgetPanel)
+    bpy.utils.unregister_class(ViewLastSizeReport)
+    bpy.utils.unregister_class(AnalyzeGLTFSize)
+    bpy.utils.unregister_class(HubsSizeBudgetProperties)
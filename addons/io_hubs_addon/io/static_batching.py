@@ -0,0 +1,371 @@
+import bpy
+from io_scene_gltf2.io.com import gltf2_io
+from io_scene_gltf2.io.com import gltf2_io_constants
+from io_scene_gltf2.io.exp import gltf2_io_binary_data
+from .gpu_instancing import is_animated, get_linked_nodes, iter_nodes
+from .profiler import profiled
+
+# Export time static batching.  Static scenery, meshes without Hubs components or animation, is merged into a few
+# combined meshes per material once the scene has been gathered.  The batches are built from the gathered glTF nodes:
+# the primitives of the batched nodes are transformed to the scene space and concatenated into the primitives of new
+# root nodes, which replace them.  The Blender data is never modified, so there is nothing to restore after the export,
+# whether it succeeds or fails.
+
+BATCH_NAME_PREFIX = "StaticBatch"
+# Primitive modes whose vertices can simply be concatenated: points, lines and triangles
+BATCHABLE_MODES = {0, 1, 4}
+TRIANGLES_MODE = 4
+
+
+class StaticBatchingState:
+    def __init__(self, max_vertices):
+        self.max_vertices = max_vertices
+        # id(glTF node) -> (glTF node, Blender object), recorded while the nodes are gathered
+        self.node_objects = {}
+        self.batch_nodes = 0
+        self.batched_objects = 0
+
+    def add_node(self, node, blender_object):
+        self.node_objects[id(node)] = (node, blender_object)
+
+    def get_object(self, node):
+        entry = self.node_objects.get(id(node))
+        return entry[1] if entry is not None else None
+
+    def report(self):
+        if self.batch_nodes:
+            print(f"Static batching merged {self.batched_objects} objects into {self.batch_nodes} batches")
+
+
+def find_linked_objects(value, linked_objects, visited=None):
+    '''Collects the objects that are linked from the pointer properties of a component, including nested property groups'''
+    visited = set() if visited is None else visited
+    if value.as_pointer() in visited:
+        return
+    visited.add(value.as_pointer())
+    for prop in value.bl_rna.properties:
+        if prop.type == 'POINTER':
+            prop_value = getattr(value, prop.identifier)
+            if isinstance(prop_value, bpy.types.Object):
+                linked_objects.add(prop_value)
+            elif isinstance(prop_value, bpy.types.PropertyGroup):
+                find_linked_objects(prop_value, linked_objects, visited)
+        elif prop.type == 'COLLECTION':
+            for item in getattr(value, prop.identifier):
+                if isinstance(item, bpy.types.PropertyGroup):
+                    find_linked_objects(item, linked_objects, visited)
+
+
+def get_linked_objects(host_index):
+    '''Returns the objects linked from the components of every host, they are exported as node links'''
+    linked_objects = set()
+    for _, _, host_components in host_index.entries:
+        for _, component_class, component in host_components:
+            if component_class and component:
+                find_linked_objects(component, linked_objects)
+    return linked_objects
+
+
+def is_static(ob, linked_objects):
+    '''Static objects and their parents carry no components, aren't animated and aren't linked from components'''
+    while ob is not None:
+        if ob.hubs_component_list.items or is_animated(ob) or ob in linked_objects:
+            return False
+        ob = ob.parent
+    return True
+
+
+def get_local_matrix(node):
+    import numpy as np
+    if node.matrix:
+        # glTF matrices are stored in column major order
+        return np.array(node.matrix, dtype=np.float64).reshape(4, 4).T
+    x, y, z, w = node.rotation or [0.0, 0.0, 0.0, 1.0]
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+    matrix = np.identity(4)
+    matrix[:3, :3] = rotation * np.array(node.scale or [1.0, 1.0, 1.0])
+    matrix[:3, 3] = node.translation or [0.0, 0.0, 0.0]
+    return matrix
+
+
+def iter_node_matrices(nodes, parent_matrix):
+    '''Yields the nodes of the hierarchy with their scene space matrix, depth first'''
+    for node in nodes:
+        if isinstance(node, gltf2_io.Node):
+            matrix = parent_matrix @ get_local_matrix(node)
+            yield node, matrix
+            yield from iter_node_matrices(node.children or [], matrix)
+
+
+def has_binary_data(accessor):
+    return (isinstance(accessor, gltf2_io.Accessor) and accessor.sparse is None and
+            isinstance(accessor.buffer_view, gltf2_io_binary_data.BinaryData))
+
+
+def get_primitive_key(primitive):
+    '''Returns the key of the primitives that can be merged with the primitive, None if it can't be merged'''
+    mode = TRIANGLES_MODE if primitive.mode is None else primitive.mode
+    if mode not in BATCHABLE_MODES or primitive.targets or primitive.extensions or primitive.extras is not None:
+        return None
+    if primitive.indices is not None and not has_binary_data(primitive.indices):
+        return None
+    if "POSITION" not in primitive.attributes:
+        return None
+
+    attributes = []
+    for name, accessor in primitive.attributes.items():
+        if not has_binary_data(accessor):
+            return None
+        # Quantized positions, normals and tangents can't be transformed in place
+        if name in ("POSITION", "NORMAL", "TANGENT") and accessor.component_type != gltf2_io_constants.ComponentType.Float:
+            return None
+        attributes.append((name, int(accessor.component_type), accessor.type, bool(accessor.normalized)))
+    return (id(primitive.material), mode, tuple(sorted(attributes)))
+
+
+def get_node_batch_key(node, blender_object, linked_nodes, linked_objects, mesh_users):
+    '''Returns the key of the nodes that can be merged with the node, None if it can't be batched'''
+    if (not isinstance(node.mesh, gltf2_io.Mesh) or node.children or node.skin is not None or node.camera is not None or
+            node.weights or node.extensions or node.extras or id(node) in linked_nodes):
+        return None
+    # Meshes used by several nodes are better exported as instances
+    if mesh_users[id(node.mesh)] > 1 or node.mesh.weights or node.mesh.extensions or node.mesh.extras is not None:
+        return None
+    if blender_object is None or not is_static(blender_object, linked_objects):
+        return None
+
+    primitive_keys = []
+    for primitive in node.mesh.primitives:
+        primitive_key = get_primitive_key(primitive)
+        if primitive_key is None:
+            return None
+        primitive_keys.append(primitive_key)
+    return tuple(sorted(primitive_keys))
+
+
+def get_vertex_count(node):
+    return sum(primitive.attributes["POSITION"].count for primitive in node.mesh.primitives)
+
+
+@profiled("plan_static_batches")
+def plan_static_batches(gltf2_scene, state, linked_objects):
+    '''Returns the lists of (node, scene matrix) that will be merged, every list has at most max_vertices vertices'''
+    import numpy as np
+    node_matrices = list(iter_node_matrices(gltf2_scene.nodes, np.identity(4)))
+    mesh_users = {}
+    for node, _ in node_matrices:
+        if isinstance(node.mesh, gltf2_io.Mesh):
+            mesh_users[id(node.mesh)] = mesh_users.get(id(node.mesh), 0) + 1
+    linked_nodes = get_linked_nodes(gltf2_scene)
+
+    groups = {}
+    for node, matrix in node_matrices:
+        key = get_node_batch_key(node, state.get_object(node), linked_nodes, linked_objects, mesh_users)
+        if key is None:
+            continue
+        vertex_count = get_vertex_count(node)
+        if vertex_count == 0 or vertex_count > state.max_vertices:
+            continue
+        groups.setdefault(key, []).append((node, matrix, vertex_count))
+
+    batches = []
+    for group in groups.values():
+        batch = []
+        batch_vertices = 0
+        for node, matrix, vertex_count in group:
+            if batch and batch_vertices + vertex_count > state.max_vertices:
+                batches.append(batch)
+                batch = []
+                batch_vertices = 0
+            batch.append((node, matrix))
+            batch_vertices += vertex_count
+        batches.append(batch)
+
+    return [batch for batch in batches if len(batch) > 1]
+
+
+def read_accessor(accessor):
+    '''Returns the accessor data as a (count, components) array'''
+    import numpy as np
+    dtype = gltf2_io_constants.ComponentType.to_numpy_dtype(accessor.component_type)
+    components = gltf2_io_constants.DataType.num_elements(accessor.type)
+    data = np.frombuffer(accessor.buffer_view.data, dtype=dtype, count=accessor.count * components,
+                         offset=accessor.byte_offset or 0)
+    return data.reshape(accessor.count, components)
+
+
+def normalize_rows(values):
+    import numpy as np
+    lengths = np.linalg.norm(values, axis=1, keepdims=True)
+    return np.divide(values, lengths, out=np.zeros_like(values), where=lengths > 0)
+
+
+def transform_attribute(name, values, matrix):
+    '''Transforms the positions, normals and tangents to the scene space, the other attributes are kept as they are'''
+    import numpy as np
+    linear = matrix[:3, :3]
+    if name == "POSITION":
+        return (values @ linear.T + matrix[:3, 3]).astype(np.float32)
+    if name == "NORMAL":
+        return normalize_rows(values @ np.linalg.inv(linear)).astype(np.float32)
+    if name == "TANGENT":
+        tangents = np.empty(values.shape, dtype=np.float32)
+        tangents[:, :3] = normalize_rows(values[:, :3] @ linear.T)
+        # Mirroring flips the handedness of the tangent space
+        tangents[:, 3] = values[:, 3] * np.sign(np.linalg.det(linear))
+        return tangents
+    return values
+
+
+def read_indices(primitive, matrix):
+    import numpy as np
+    vertex_count = primitive.attributes["POSITION"].count
+    if primitive.indices is None:
+        indices = np.arange(vertex_count, dtype=np.uint32)
+    else:
+        indices = read_accessor(primitive.indices).ravel().astype(np.uint32)
+    mode = TRIANGLES_MODE if primitive.mode is None else primitive.mode
+    if mode == TRIANGLES_MODE and np.linalg.det(matrix[:3, :3]) < 0:
+        # Mirrored triangles would face the other way once the transform is applied
+        indices = indices.reshape(-1, 3)[:, [0, 2, 1]].ravel()
+    return indices
+
+
+def create_accessor(values, template, target, bounds=False):
+    from .utils import HubsBinaryData
+    binary_data = HubsBinaryData(values.tobytes())
+    binary_data.bufferViewTarget = target
+    return gltf2_io.Accessor(
+        buffer_view=binary_data,
+        byte_offset=None,
+        component_type=template.component_type,
+        count=len(values),
+        extensions=None,
+        extras=None,
+        max=values.max(axis=0).tolist() if bounds else None,
+        min=values.min(axis=0).tolist() if bounds else None,
+        name=None,
+        normalized=template.normalized,
+        sparse=None,
+        type=template.type
+    )
+
+
+def create_index_accessor(indices, vertex_count):
+    from .utils import HubsBinaryData
+    import numpy as np
+    if vertex_count < 65535:
+        indices = indices.astype(np.uint16)
+        component_type = gltf2_io_constants.ComponentType.UnsignedShort
+    else:
+        component_type = gltf2_io_constants.ComponentType.UnsignedInt
+    binary_data = HubsBinaryData(indices.tobytes())
+    binary_data.bufferViewTarget = gltf2_io_constants.BufferViewTarget.ELEMENT_ARRAY_BUFFER
+    return gltf2_io.Accessor(
+        buffer_view=binary_data,
+        byte_offset=None,
+        component_type=component_type,
+        count=len(indices),
+        extensions=None,
+        extras=None,
+        max=None,
+        min=None,
+        name=None,
+        normalized=None,
+        sparse=None,
+        type=gltf2_io_constants.DataType.Scalar
+    )
+
+
+def merge_primitives(primitives):
+    '''Merges a list of (primitive, scene matrix) that share the same material, mode and attribute layout'''
+    import numpy as np
+    first_primitive = primitives[0][0]
+    attributes = {}
+    for name, template in first_primitive.attributes.items():
+        values = np.concatenate([transform_attribute(name, read_accessor(primitive.attributes[name]), matrix)
+                                 for primitive, matrix in primitives])
+        attributes[name] = create_accessor(values, template, gltf2_io_constants.BufferViewTarget.ARRAY_BUFFER,
+                                           bounds=name == "POSITION")
+
+    indices = []
+    vertex_offset = 0
+    for primitive, matrix in primitives:
+        indices.append(read_indices(primitive, matrix) + vertex_offset)
+        vertex_offset += primitive.attributes["POSITION"].count
+
+    return gltf2_io.MeshPrimitive(
+        attributes=attributes,
+        extensions=None,
+        extras=None,
+        indices=create_index_accessor(np.concatenate(indices), vertex_offset),
+        material=first_primitive.material,
+        mode=first_primitive.mode,
+        targets=None
+    )
+
+
+def create_batch_node(batch, index):
+    primitive_groups = {}
+    for node, matrix in batch:
+        for primitive in node.mesh.primitives:
+            primitive_groups.setdefault(get_primitive_key(primitive), []).append((primitive, matrix))
+
+    name = f"{BATCH_NAME_PREFIX}_{index}"
+    mesh = gltf2_io.Mesh(
+        extensions=None,
+        extras=None,
+        name=name,
+        primitives=[merge_primitives(primitives) for primitives in primitive_groups.values()],
+        weights=None
+    )
+    return gltf2_io.Node(
+        camera=None,
+        children=[],
+        extensions=None,
+        extras=None,
+        matrix=None,
+        mesh=mesh,
+        name=name,
+        rotation=None,
+        scale=None,
+        skin=None,
+        translation=None,
+        weights=None
+    )
+
+
+def remove_nodes(nodes, removed_nodes):
+    return [node for node in nodes if not isinstance(node, gltf2_io.Node) or id(node) not in removed_nodes]
+
+
+@profiled("static_batching")
+def batch_scene_nodes(gltf2_scene, export_settings):
+    '''Replaces the static mesh nodes of the gathered scene by their batches.  Must be called after the scene has been
+    gathered, and before the nodes are instanced.  The scene is only modified once every batch has been built.'''
+    from .gltf_exporter import get_host_index
+    state = get_static_batching(export_settings)
+    if state is None:
+        return None
+
+    batches = plan_static_batches(gltf2_scene, state, get_linked_objects(get_host_index(export_settings)))
+    batch_nodes = [create_batch_node(batch, state.batch_nodes + index) for index, batch in enumerate(batches)]
+
+    removed_nodes = {id(node) for batch in batches for node, _ in batch}
+    for node in list(iter_nodes(gltf2_scene.nodes)):
+        if node.children:
+            node.children = remove_nodes(node.children, removed_nodes)
+    gltf2_scene.nodes = remove_nodes(gltf2_scene.nodes, removed_nodes) + batch_nodes
+
+    state.batch_nodes += len(batch_nodes)
+    state.batched_objects += len(removed_nodes)
+    return state
+
+
+def get_static_batching(export_settings):
+    '''Returns the export scoped static batching state, None if static batching is disabled'''
+    return export_settings.get('hubs_static_batching')
@@ -0,0 +1,159 @@
+import bpy
+
+# Export time texture downscaling.  An export profile caps the resolution of the images gathered by the add-on per
+# usage class.  Images over the cap are resampled like a mip chain: halved with a box filter until they are less than
+# twice the target size, then linearly interpolated to it.  HDR images are filtered as linear floats before they are
+# encoded as RGBE and sRGB images are filtered in linear space.  Non HDR images keep the export image format: PNG, or
+# JPEG when the export writes JPEG images.
+
+USAGE_ENVIRONMENT = "environment"
+USAGE_REFLECTION_PROBE = "reflection_probe"
+USAGE_LIGHTMAP = "lightmap"
+USAGE_COMPONENT = "component"
+
+# Maximum width and height per usage class, 0 keeps the authoring resolution
+TEXTURE_PROFILES = {
+    "ORIGINAL": {},
+    "DESKTOP": {
+        USAGE_ENVIRONMENT: 4096,
+        USAGE_REFLECTION_PROBE: 1024,
+        USAGE_LIGHTMAP: 4096,
+        USAGE_COMPONENT: 4096,
+    },
+    "MOBILE": {
+        USAGE_ENVIRONMENT: 2048,
+        USAGE_REFLECTION_PROBE: 512,
+        USAGE_LIGHTMAP: 1024,
+        USAGE_COMPONENT: 1024,
+    },
+}
+
+TEXTURE_PROFILE_ITEMS = [
+    ("ORIGINAL", "Original", "Export the images at their authoring resolution"),
+    ("DESKTOP", "Desktop", "Environment maps and lightmaps up to 4096, reflection probes up to 1024 and other component images up to 4096 pixels"),
+    ("MOBILE", "Mobile", "Environment maps up to 2048, lightmaps up to 1024, reflection probes up to 512 and other component images up to 1024 pixels"),
+]
+
+
+def get_texture_size_cap(usage):
+    '''Returns the maximum width and height of the images of a usage class in the export profile, 0 if there is none'''
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    return TEXTURE_PROFILES.get(props.texture_profile, {}).get(usage, 0)
+
+
+def get_target_size(width, height, max_size):
+    '''Returns the size of the image scaled down to fit max_size, None if it already fits'''
+    if not max_size or max(width, height) <= max_size:
+        return None
+    scale = max_size / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def can_resize_image(blender_image, is_hdr):
+    '''Float images that aren't HDR would need a color transform to be saved as PNG, so they are left as they are'''
+    width, height = blender_image.size
+    return width > 0 and height > 0 and (is_hdr or not blender_image.is_float)
+
+
+def srgb_to_linear(values):
+    import numpy as np
+    return np.where(values <= 0.04045, values / 12.92, np.power((np.maximum(values, 0.04045) + 0.055) / 1.055, 2.4))
+
+
+def linear_to_srgb(values):
+    import numpy as np
+    return np.where(values <= 0.0031308, values * 12.92, 1.055 * np.power(np.maximum(values, 0.0031308), 1.0 / 2.4) - 0.055)
+
+
+def halve_axis(pixels, axis):
+    '''Box filters pairs of pixels along an axis, odd sizes repeat their last pixel'''
+    import numpy as np
+    if pixels.shape[axis] % 2:
+        pad = [(0, 0)] * pixels.ndim
+        pad[axis] = (0, 1)
+        pixels = np.pad(pixels, pad, mode='edge')
+    shape = list(pixels.shape)
+    shape[axis: axis + 1] = [shape[axis] // 2, 2]
+    return pixels.reshape(shape).mean(axis=axis + 1, dtype=np.float32)
+
+
+def interpolate_axis(pixels, size, axis):
+    '''Linearly resamples an axis to size, sampling at the pixel centers'''
+    import numpy as np
+    source_size = pixels.shape[axis]
+    positions = np.clip((np.arange(size, dtype=np.float32) + 0.5) * (source_size / size) - 0.5, 0, source_size - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, source_size - 1)
+    weights_shape = [1] * pixels.ndim
+    weights_shape[axis] = size
+    weights = (positions - lower).astype(np.float32).reshape(weights_shape)
+    return np.take(pixels, lower, axis=axis) * (1 - weights) + np.take(pixels, upper, axis=axis) * weights
+
+
+def resize_pixels(pixels, width, height):
+    '''Resizes a (height, width, channels) float array'''
+    for axis, size in [(0, height), (1, width)]:
+        while pixels.shape[axis] >= 2 * size:
+            pixels = halve_axis(pixels, axis)
+        if pixels.shape[axis] != size:
+            pixels = interpolate_axis(pixels, size, axis)
+    return pixels
+
+
+def resize_image_pixels(pixels, width, height, is_hdr, is_srgb):
+    '''Resizes a pixel snapshot, filtering sRGB images in linear space.  Non HDR images are clamped to [0, 1].'''
+    import numpy as np
+    if is_hdr:
+        return resize_pixels(pixels, width, height)
+
+    if is_srgb:
+        pixels = pixels.copy()
+        pixels[..., :3] = srgb_to_linear(pixels[..., :3])
+    resized = resize_pixels(pixels, width, height)
+    if is_srgb:
+        resized[..., :3] = linear_to_srgb(resized[..., :3])
+    return np.clip(resized, 0.0, 1.0)
+
+
+def encode_resized(pixels, width, height, is_hdr, is_srgb):
+    '''Resizes and encodes a pixel snapshot, HDR images as RGBE and the rest as PNG.  Runs in the encoder pool.'''
+    from .image_encoder import encode_png
+    from .rgbe import encode_rgbe
+    resized = resize_image_pixels(pixels, width, height, is_hdr, is_srgb)
+    return encode_rgbe(resized) if is_hdr else encode_png(resized)
+
+
+def encode_jpeg_resized(blender_image, pixels, width, height, is_srgb, export_settings):
+    '''Resizes a pixel snapshot and encodes it as JPEG with the glTF exporter, through a temporary image'''
+    import numpy as np
+    from .utils import HubsExportImage
+    resized = resize_image_pixels(pixels, width, height, False, is_srgb)
+    rgba = np.ones((height, width, 4), dtype=np.float32)
+    channels = resized.shape[2]
+    if channels < 3:
+        rgba[..., :3] = resized[..., :1]
+    else:
+        rgba[..., :channels] = resized
+
+    tmp_image = bpy.data.images.new("##hubs-export:tmp-image##", width, height)
+    try:
+        tmp_image.colorspace_settings.name = blender_image.colorspace_settings.name
+        tmp_image.pixels.foreach_set(rgba.ravel())
+        data = HubsExportImage.from_blender_image(tmp_image).encode("image/jpeg", export_settings)
+    finally:
+        bpy.data.images.remove(tmp_image)
+    return data[0] if isinstance(data, tuple) else data
+
+
+def encode_image_resized(blender_image, width, height, is_hdr, mime_type, export_settings):
+    '''Returns the encoded resized image, a future if the parallel encoder is enabled.  Images exported as JPEG keep
+    that format and are encoded by Blender, on the main thread.'''
+    from .image_encoder import get_image_encoder, snapshot_pixels
+    is_srgb = not blender_image.is_float and blender_image.colorspace_settings.name == 'sRGB'
+    pixels = snapshot_pixels(blender_image)
+    if mime_type == "image/jpeg" and not is_hdr:
+        return encode_jpeg_resized(blender_image, pixels, width, height, is_srgb, export_settings)
+
+    args = (pixels, width, height, is_hdr, is_srgb)
+    encoder = get_image_encoder(export_settings)
+    return encoder.submit(encode_resized, *args) if encoder else encode_resized(*args)
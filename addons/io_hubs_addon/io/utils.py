@@ -1,5 +1,8 @@
 import os
+import mmap
+import operator
 import bpy
+from contextlib import contextmanager
 from io_scene_gltf2.blender.com import gltf2_blender_extras
 if bpy.app.version >= (3, 6, 0):
     from io_scene_gltf2.blender.exp import gltf2_blender_gather_nodes, gltf2_blender_gather_joints
@@ -16,11 +19,31 @@ from io_scene_gltf2.io.exp import gltf2_io_binary_data
 from io_scene_gltf2.io.exp import gltf2_io_image_data
 from typing import Optional, Tuple, Union
 from ..nodes.lightmap import MozLightmapNode
+from ..components.components_registry import get_gather_plan
+from ..components.types import GatherKind
+from .image_cache import encode_image_cached, get_image_cache_key
+from .image_dedup import get_image_dedup
+from .image_encoder import encode_image_async, resolve_data, snapshot_pixels, is_hdr_passthrough, is_file_passthrough
+from .rgbe import encode_rgbe
+from .profiler import profiled, get_export_profiler
+from .texture_profiles import USAGE_COMPONENT, USAGE_LIGHTMAP, get_texture_size_cap, get_target_size, can_resize_image, encode_image_resized
 
 # gather_texture/image with HDR support via MOZ_texture_rgbe
 
+HDR_FILE_FORMATS = {'HDR', 'OPEN_EXR', 'OPEN_EXR_MULTILAYER'}
+
 
 class HubsImageData(gltf2_io_image_data.ImageData):
+    # The data can be a memory mapped file or a future from the parallel encoder, it's resolved when it's first accessed while writing the file
+    @property
+    def _data(self):
+        self.__data = resolve_data(self.__data)
+        return self.__data
+
+    @_data.setter
+    def _data(self, value):
+        self.__data = value
+
     @property
     def file_extension(self):
         if self._mime_type == "image/vnd.radiance":
@@ -28,6 +51,22 @@ class HubsImageData(gltf2_io_image_data.ImageData):
         return super().file_extension
 
 
+class HubsBinaryData(gltf2_io_binary_data.BinaryData):
+    # The data can be a memory mapped file or a future from the parallel encoder, it's resolved when the binary buffer is assembled
+    def __init__(self, data):
+        super().__init__(b'')
+        self.data = data
+
+    @property
+    def data(self):
+        self.__data = resolve_data(self.__data)
+        return self.__data
+
+    @data.setter
+    def data(self, value):
+        self.__data = value
+
+
 class HubsExportImage(gltf2_blender_image.ExportImage):
     @staticmethod
     def from_blender_image(image: bpy.types.Image):
@@ -38,57 +77,154 @@ class HubsExportImage(gltf2_blender_image.ExportImage):
 
     def encode(self, mime_type: Optional[str], export_settings) -> Union[Tuple[bytes, bool], bytes]:
         if mime_type == "image/vnd.radiance":
-            return self.encode_from_image_hdr(self.blender_image())
+            if bpy.app.version < (4, 1, 0):
+                return self.encode_from_image_hdr(self.blender_image(), export_settings)
+            else:
+                return self.encode_from_image_hdr(self.blender_image(export_settings), export_settings)
         if bpy.app.version < (3, 5, 0):
             return super().encode(mime_type)
         else:
             return super().encode(mime_type, export_settings)
 
-    # TODO this should allow conversion from other HDR formats (namely EXR),
-    # in memory images, and combining separate channels like SDR images
-    def encode_from_image_hdr(self, image: bpy.types.Image) -> Union[Tuple[bytes, bool], bytes]:
-        if image.file_format == "HDR" and image.source == 'FILE' and not image.is_dirty:
+    # TODO this should allow combining separate channels like SDR images
+    def encode_from_image_hdr(self, image: bpy.types.Image, export_settings=None) -> Union[Tuple[bytes, bool], bytes, mmap.mmap]:
+        if is_hdr_passthrough(image):
             if image.packed_file is not None:
                 return image.packed_file.data
             else:
                 src_path = bpy.path.abspath(image.filepath_raw)
                 if os.path.isfile(src_path):
+                    if export_settings is not None:
+                        mapped_file = map_export_file(src_path, export_settings)
+                        if mapped_file is not None:
+                            return mapped_file
                     with open(src_path, 'rb') as f:
                         return f.read()
 
+        # Other HDR formats (namely EXR), in memory and generated images are encoded from their pixels
+        if image.size[0] > 0:
+            return encode_rgbe(snapshot_pixels(image))
+
         raise Exception(
-            "HDR images must be saved as a .hdr file before exporting")
+            f"HDR image {image.name} has no pixel data to export")
+
+
+def is_hdr_image(blender_image):
+    return blender_image.file_format in HDR_FILE_FORMATS
+
+
+def map_export_file(path, export_settings):
+    '''Memory maps a file so its contents can be copied into the output buffer without being read into memory first.
+    The mapping stays open until the export finishes.'''
+    try:
+        with open(path, 'rb') as f:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty files can't be mapped
+        return None
+
+    export_settings.setdefault('hubs_mapped_files', []).append(mapped_file)
+    return mapped_file
+
+
+def close_export_files(export_settings):
+    for mapped_file in export_settings.pop('hubs_mapped_files', []):
+        try:
+            mapped_file.close()
+        except BufferError:
+            # Something still holds a view of the mapping, it will be closed when it's garbage collected
+            pass
+
+
+@contextmanager
+def image_buffers_released(blender_image):
+    '''Reading some image properties (e.g. file_format or channels) makes Blender load the whole image buffer, which is
+    kept in memory until the file is closed. For large HDR images that are passed through as they are, those buffers
+    weigh far more than the exported data, so free them once the image has been gathered unless they were already
+    loaded before.'''
+    was_loaded = blender_image is None or blender_image.has_data
+    try:
+        yield
+    finally:
+        if not was_loaded and not blender_image.is_dirty:
+            blender_image.buffers_free()
+
+
+def gather_image(blender_image, export_settings, usage=USAGE_COMPONENT):
+    '''Gathers the image with the resolution cap of its usage class in the export texture profile'''
+    with image_buffers_released(blender_image):
+        return gather_image_for_usage(blender_image, usage, export_settings)
 
 
 @cached
-def gather_image(blender_image, export_settings):
+@profiled("gather_image")
+def gather_image_for_usage(blender_image, usage, export_settings):
     if not blender_image:
         return None
 
     name, _extension = os.path.splitext(
         os.path.basename(blender_image.filepath))
 
+    is_hdr = is_hdr_image(blender_image)
     if export_settings["gltf_image_format"] == "AUTO":
-        if blender_image.file_format == "HDR":
+        if is_hdr:
             mime_type = "image/vnd.radiance"
         else:
             mime_type = "image/png"
     else:
         mime_type = "image/jpeg"
 
-    data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
+    max_size = get_texture_size_cap(usage)
+    target_size = get_target_size(*blender_image.size, max_size) if can_resize_image(blender_image, is_hdr) else None
+    if not target_size:
+        max_size = 0
+
+    def encode():
+        if target_size:
+            return encode_image_resized(blender_image, *target_size, is_hdr, mime_type, export_settings)
+
+        data = encode_image_async(blender_image, mime_type, export_settings)
+        if data is not None:
+            return data
+
+        data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
+        if type(data) == tuple:
+            data = data[0]
+        return data
+
+    # Datablocks with the same content share the same glTF image.  The content key is also the image cache key.
+    image_dedup = get_image_dedup(export_settings)
+    content_key = None
+    if image_dedup is not None:
+        try:
+            content_key = get_image_cache_key(blender_image, mime_type, export_settings, max_size)
+        except Exception as err:
+            print(f"Warning: Couldn't compute the content key for image {blender_image.name}: {err}")
+        if content_key is not None:
+            image = image_dedup.get_image(content_key, blender_image)
+            if image is not None:
+                return image
+
+    # Saved images that are copied as they are, HDR files and the unmodified files in the export format, have nothing
+    # to cache
+    if not target_size and ((mime_type == "image/vnd.radiance" and is_hdr_passthrough(blender_image)) or
+                            is_file_passthrough(blender_image, mime_type)):
+        data = encode()
+    else:
+        data = encode_image_cached(blender_image, mime_type, export_settings, encode, key=content_key)
 
-    if type(data) == tuple:
-        data = data[0]
+    profiler = get_export_profiler()
+    if profiler:
+        profiler.add_bytes("gather_image", data)
 
     if export_settings['gltf_format'] == 'GLTF_SEPARATE':
         uri = HubsImageData(data=data, mime_type=mime_type, name=name)
         buffer_view = None
     else:
         uri = None
-        buffer_view = gltf2_io_binary_data.BinaryData(data=data)
+        buffer_view = HubsBinaryData(data)
 
-    return gltf2_io.Image(
+    image = gltf2_io.Image(
         buffer_view=buffer_view,
         extensions=None,
         extras=None,
@@ -96,21 +232,38 @@ def gather_image(blender_image, export_settings):
         name=name,
         uri=uri
     )
+    if content_key is not None:
+        image_dedup.add_image(content_key, image, blender_image)
+    return image
 
     # export_user_extensions('gather_image_hook', export_settings, image, blender_shader_sockets)
 
     return None
 
 
+def gather_texture(blender_image, export_settings, usage=USAGE_COMPONENT):
+    '''Gathers the texture with the resolution cap of its usage class in the export texture profile'''
+    with image_buffers_released(blender_image):
+        return gather_texture_for_usage(blender_image, usage, export_settings)
+
+
 @cached
-def gather_texture(blender_image, export_settings):
-    image = gather_image(blender_image, export_settings)
+@profiled("gather_texture")
+def gather_texture_for_usage(blender_image, usage, export_settings):
+    # Check the format first so the image buffer it loads is still there when the image is gathered
+    is_hdr = blender_image and is_hdr_image(blender_image)
+    image = gather_image(blender_image, export_settings, usage)
 
     if not image:
         return None
 
+    image_dedup = get_image_dedup(export_settings)
+    if image_dedup is not None:
+        texture = image_dedup.get_texture(image, is_hdr)
+        if texture is not None:
+            return texture
+
     texture_extensions = {}
-    is_hdr = blender_image and blender_image.file_format == "HDR"
 
     if is_hdr:
         ext_name = "MOZ_texture_rgbe"
@@ -124,21 +277,23 @@ def gather_texture(blender_image, export_settings):
 
     # export_user_extensions('gather_texture_hook', export_settings, texture, blender_shader_sockets)
 
-    return gltf2_io.Texture(
+    texture = gltf2_io.Texture(
         extensions=texture_extensions,
         extras=None,
         name=None,
         sampler=None,
         source=None if is_hdr else image
     )
+    if image_dedup is not None:
+        image_dedup.add_texture(texture, image, is_hdr)
+    return texture
 
 
 def gather_properties(export_settings, object, component):
     value = {}
 
-    for key in component.get_properties():
-        value[key] = gather_property(
-            export_settings, object, component, key)
+    for key, extractor in get_bound_gather_plan(component.__class__):
+        value[key] = extractor(export_settings, object, component, key)
 
     if value:
         return value
@@ -171,6 +326,146 @@ def gather_property(export_settings, blender_object, target, property_name):
     return gltf2_blender_extras.__to_json_compatible(property_value)
 
 
+def gather_scalar_property(export_settings, blender_object, target, property_name):
+    return getattr(target, property_name)
+
+
+def gather_json_property(export_settings, blender_object, target, property_name):
+    return gltf2_blender_extras.__to_json_compatible(getattr(target, property_name))
+
+
+def gather_pointer_property(blender_type, gather_link):
+    # Pointers only use the link gather if the value type matches exactly, otherwise fall back to the json conversion like gather_property
+    def gather_pointer(export_settings, blender_object, target, property_name):
+        if type(getattr(target, property_name)) == blender_type:
+            return gather_link(export_settings, blender_object, target, property_name)
+        return gather_json_property(export_settings, blender_object, target, property_name)
+    return gather_pointer
+
+
+def gather_vec_array_property(export_settings, blender_object, target, property_name):
+    return list(getattr(target, property_name))
+
+
+def gather_vec_xyz_property(export_settings, blender_object, target, property_name):
+    return vec_to_xyz(getattr(target, property_name))
+
+
+def vec_to_xyz(vec):
+    out = {
+        "x": vec[0],
+        "y": vec[1],
+    }
+
+    if len(vec) > 2:
+        out["z"] = vec[2]
+    if len(vec) > 3:
+        out["w"] = vec[3]
+
+    return out
+
+
+def gather_linear_color_property(export_settings, blender_object, target, property_name):
+    return gather_color_property(export_settings, blender_object, target, property_name, "COLOR")
+
+
+def gather_gamma_color_property(export_settings, blender_object, target, property_name):
+    return gather_color_property(export_settings, blender_object, target, property_name, "COLOR_GAMMA")
+
+
+__bound_gather_plans = {}
+
+
+def get_bound_gather_plan(component_class):
+    '''Returns the component gather plan as a list of (property name, extractor) pairs.
+    The bound plan is rebuilt whenever the registry compiles a new plan for the class, ie. when it is registered again.'''
+    plan = get_gather_plan(component_class)
+    bound_plan = __bound_gather_plans.get(component_class)
+    if bound_plan is None or bound_plan[0] is not plan:
+        extractors = get_gather_plan_extractors()
+        bound_plan = (plan, [(key, extractors[kind]) for key, kind in plan])
+        __bound_gather_plans[component_class] = bound_plan
+    return bound_plan[1]
+
+
+def get_gather_plan_extractors():
+    return {
+        GatherKind.SCALAR: gather_scalar_property,
+        GatherKind.JSON: gather_json_property,
+        GatherKind.VEC_ARRAY: gather_vec_array_property,
+        GatherKind.VEC_XYZ: gather_vec_xyz_property,
+        GatherKind.COLOR_LINEAR: gather_linear_color_property,
+        GatherKind.COLOR_GAMMA: gather_gamma_color_property,
+        GatherKind.NODE: gather_pointer_property(bpy.types.Object, gather_node_property),
+        GatherKind.MATERIAL: gather_pointer_property(bpy.types.Material, gather_material_property),
+        GatherKind.IMAGE: gather_pointer_property(bpy.types.Image, gather_image_property),
+        GatherKind.TEXTURE: gather_pointer_property(bpy.types.Texture, gather_texture_property),
+    }
+
+
+BATCHED_GATHER_KINDS = {
+    GatherKind.SCALAR,
+    GatherKind.VEC_ARRAY,
+    GatherKind.VEC_XYZ,
+    GatherKind.COLOR_LINEAR,
+    GatherKind.COLOR_GAMMA,
+}
+
+
+def can_batch_gather(component_class):
+    '''Components can be gathered in batches if they use the default gather and only have plain value properties'''
+    from ..components.hubs_component import HubsComponent
+    if component_class.gather is not HubsComponent.gather:
+        return False
+    return all(kind in BATCHED_GATHER_KINDS for _, kind in get_gather_plan(component_class))
+
+
+def gather_properties_batch(export_settings, component_class, components):
+    '''Gathers the properties of many instances of the same component class at once.
+    Returns a list with the same output gather_properties would return for each of the components.'''
+    plan = get_gather_plan(component_class)
+    if not plan:
+        return [{"__empty_component_dummy": None} for _ in components]
+
+    get_values = operator.attrgetter(*[key for key, _ in plan])
+    if len(plan) == 1:
+        columns = [[get_values(component) for component in components]]
+    else:
+        columns = list(zip(*[get_values(component) for component in components]))
+
+    gathered_columns = []
+    for (_, kind), column in zip(plan, columns):
+        if kind == GatherKind.VEC_ARRAY:
+            column = [list(vec) for vec in column]
+        elif kind == GatherKind.VEC_XYZ:
+            column = [vec_to_xyz(vec) for vec in column]
+        elif kind == GatherKind.COLOR_LINEAR or kind == GatherKind.COLOR_GAMMA:
+            column = gather_color_column(column, kind == GatherKind.COLOR_LINEAR)
+        gathered_columns.append(column)
+
+    keys = [key for key, _ in plan]
+    return [dict(zip(keys, row)) for row in zip(*gathered_columns)]
+
+
+def lin2srgb_array(lin):
+    import numpy as np
+    return np.where(lin > 0.0031308, 1.055 * np.power(np.maximum(lin, 0.0031308), 1.0 / 2.4) - 0.055, 12.92 * lin)
+
+
+def gather_color_column(colors, is_linear):
+    '''Vectorized version of gather_color_property for a list of colors'''
+    import numpy as np
+    c = np.array([color[:3] for color in colors], dtype=np.float64).reshape(-1, 3)
+
+    # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
+    if is_linear:
+        c = lin2srgb_array(c)
+
+    c = np.clip(np.trunc(c * 256.0), 0, 255).astype(np.int64)
+
+    return ["#{0:02x}{1:02x}{2:02x}".format(r, g, b) for r, g, b in c.tolist()]
+
+
 def gather_array_property(export_settings, blender_object, target, property_name):
     value = []
 
@@ -183,30 +478,52 @@ def gather_array_property(export_settings, blender_object, target, property_name
     return value
 
 
+def get_vtree_index(export_settings):
+    '''Returns the (object -> vnode uuid, (armature, bone name) -> vnode uuid) lookup tables for the export vtree.
+    They are built the first time they are requested and cached in the export settings so they live for a single export.'''
+    vtree_index = export_settings.get('hubs_vtree_index')
+    if vtree_index is None:
+        object_index = {}
+        joint_index = {}
+        for uuid, vnode in export_settings['vtree'].nodes.items():
+            # Keep the first match to preserve the vtree traversal order when a Blender object maps to several nodes
+            if vnode.blender_object is not None:
+                object_index.setdefault(vnode.blender_object, uuid)
+            if vnode.blender_bone is not None:
+                joint_index.setdefault((vnode.blender_bone.id_data, vnode.blender_bone.name), uuid)
+        vtree_index = (object_index, joint_index)
+        export_settings['hubs_vtree_index'] = vtree_index
+
+    return vtree_index
+
+
+def gather_object_node(export_settings, blender_object):
+    '''Returns the glTF node of an exported object, the node is gathered if it hasn't been yet'''
+    if bpy.app.version < (3, 2, 0):
+        return gltf2_blender_gather_nodes.gather_node(
+            blender_object,
+            blender_object.library.name if blender_object.library else None,
+            blender_object.users_scene[0],
+            None,
+            export_settings
+        )
+    else:
+        vtree = export_settings['vtree']
+        object_index, _ = get_vtree_index(export_settings)
+        vnode = vtree.nodes[object_index.get(blender_object)]
+        return vnode.node or gltf2_blender_gather_nodes.gather_node(
+            vnode,
+            export_settings
+        )
+
+
 def gather_node_property(export_settings, blender_object, target, property_name):
     blender_object = getattr(target, property_name)
 
     if blender_object:
-        if bpy.app.version < (3, 2, 0):
-            node = gltf2_blender_gather_nodes.gather_node(
-                blender_object,
-                blender_object.library.name if blender_object.library else None,
-                blender_object.users_scene[0],
-                None,
-                export_settings
-            )
-        else:
-            vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_object == blender_object)), None)]
-            node = vnode.node or gltf2_blender_gather_nodes.gather_node(
-                vnode,
-                export_settings
-            )
-
         return {
             "__mhc_link_type": "node",
-            "index": node
+            "index": gather_object_node(export_settings, blender_object)
         }
     else:
         return None
@@ -227,8 +544,8 @@ def gather_joint_property(export_settings, blender_object, target, property_name
             )
         else:
             vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_bone == joint)), None)]
+            _, joint_index = get_vtree_index(export_settings)
+            vnode = vtree.nodes[joint_index.get((blender_object, joint_name))]
             node = vnode.node or gltf2_blender_gather_joints.gather_joint_vnode(
                 vnode,
                 export_settings
@@ -284,6 +601,10 @@ def gather_image_property(export_settings, blender_object, target, property_name
     blender_image = getattr(target, property_name)
     image = gather_image(blender_image, export_settings)
     if image:
+        # Linked directly so it must be kept when deduplicating the texture images
+        image_dedup = get_image_dedup(export_settings)
+        if image_dedup is not None:
+            image_dedup.pin_image(image)
         return {
             "__mhc_link_type": "image",
             "index": image
@@ -292,9 +613,9 @@ def gather_image_property(export_settings, blender_object, target, property_name
         return None
 
 
-def gather_texture_property(export_settings, blender_object, target, property_name):
+def gather_texture_property(export_settings, blender_object, target, property_name, usage=USAGE_COMPONENT):
     blender_image = getattr(target, property_name)
-    texture = gather_texture(blender_image, export_settings)
+    texture = gather_texture(blender_image, export_settings, usage)
     if texture:
         return {
             "__mhc_link_type": "texture",
@@ -330,6 +651,16 @@ def gather_color_property(export_settings, object, component, property_name, col
 # MOZ_lightmap extension data
 
 
+def gather_lightmap_transform_and_tex_coord(texture_socket, export_settings):
+    if bpy.app.version < (3, 2, 0):
+        return gltf2_blender_gather_texture_info.__gather_texture_transform_and_tex_coord(
+            texture_socket, export_settings)
+
+    tex_transform, tex_coord, _ = gltf2_blender_gather_texture_info.__gather_texture_transform_and_tex_coord(
+        texture_socket, export_settings)
+    return tex_transform, tex_coord
+
+
 def gather_lightmap_texture_info(blender_material, export_settings):
     nodes = blender_material.node_tree.nodes
     lightmap_node = next(
@@ -343,13 +674,16 @@ def gather_lightmap_texture_info(blender_material, export_settings):
 
     # TODO this assumes a single image directly connected to the socket
     blender_image = texture_socket.links[0].from_node.image
-    texture = gather_texture(blender_image, export_settings)
-    if bpy.app.version < (3, 2, 0):
-        tex_transform, tex_coord = gltf2_blender_gather_texture_info.__gather_texture_transform_and_tex_coord(
-            texture_socket, export_settings)
+    tex_transform, tex_coord = gather_lightmap_transform_and_tex_coord(texture_socket, export_settings)
+
+    from .lightmap_atlas import get_lightmap_atlas_plan
+    atlas_plan = get_lightmap_atlas_plan(export_settings)
+    atlas_texture = atlas_plan.get_texture_and_transform(blender_image, export_settings) if atlas_plan else None
+    if atlas_texture:
+        # Lightmaps with a transform are never packed, so the transform only maps the lightmap to its atlas region
+        texture, tex_transform = atlas_texture
     else:
-        tex_transform, tex_coord, _ = gltf2_blender_gather_texture_info.__gather_texture_transform_and_tex_coord(
-            texture_socket, export_settings)
+        texture = gather_texture(blender_image, export_settings, USAGE_LIGHTMAP)
     texture_info = gltf2_io.TextureInfo(
         extensions=gltf2_blender_gather_texture_info.__gather_extensions(
             tex_transform, export_settings),
@@ -165,6 +165,18 @@ class DeleteProfileOperator(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class ClearImageCacheOperator(bpy.types.Operator):
+    bl_idname = "pref.hubs_prefs_clear_image_cache"
+    bl_label = "Clear Image Cache"
+    bl_description = "Delete all the cached export images"
+
+    def execute(self, context):
+        from .io.image_cache import clear_image_cache
+        clear_image_cache()
+
+        return {'FINISHED'}
+
+
 class HubsPreferences(AddonPreferences):
     bl_idname = __package__
 
@@ -181,6 +193,27 @@ class HubsPreferences(AddonPreferences):
         default=get_recast_lib_path()
     )
 
+    image_cache_size: IntProperty(
+        name="Image Cache Size (MB)",
+        description="Maximum disk space used to cache encoded export images between exports. The least recently used images are removed first. Set to 0 to disable the cache",
+        default=0,
+        min=0,
+    )
+
+    image_encode_workers: IntProperty(
+        name="Image Encoding Threads",
+        description="Number of threads used to encode export images in parallel. Set to 0 to encode them one by one in the main thread",
+        default=0,
+        min=0,
+        max=64,
+    )
+
+    lazy_component_loading: BoolProperty(
+        name="Load Components On Demand",
+        description="Register the components from a cached manifest and only load their definitions when they are first used. Takes effect the next time the add-on is enabled",
+        default=True,
+    )
+
     viewer_available: BoolProperty()
 
     browser: EnumProperty(
@@ -208,6 +241,11 @@ class HubsPreferences(AddonPreferences):
 
         box.row().prop(self, "row_length")
         box.row().prop(self, "recast_lib_path")
+        row = box.row()
+        row.prop(self, "image_cache_size")
+        row.operator(ClearImageCacheOperator.bl_idname)
+        box.row().prop(self, "image_encode_workers")
+        box.row().prop(self, "lazy_component_loading")
 
         selenium_available = isModuleAvailable("selenium")
         modules_available = selenium_available
@@ -282,9 +320,11 @@ def register():
     bpy.utils.register_class(InstallDepsOperator)
     bpy.utils.register_class(UninstallDepsOperator)
     bpy.utils.register_class(DeleteProfileOperator)
+    bpy.utils.register_class(ClearImageCacheOperator)
 
 
 def unregister():
+    bpy.utils.unregister_class(ClearImageCacheOperator)
     bpy.utils.unregister_class(DeleteProfileOperator)
     bpy.utils.unregister_class(UninstallDepsOperator)
     bpy.utils.unregister_class(InstallDepsOperator)
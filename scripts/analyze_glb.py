@@ -0,0 +1,56 @@
+# Breaks down the size of exported GLB/glTF files and checks them against size budgets.  Exits with an error if any
+# file is over budget so it can be used to fail CI builds.  Doesn't need Blender.
+#
+# Usage:
+#   python analyze_glb.py <file.glb> [<file.glb> ...] [--budgets budgets.json] [--report report.json]
+#
+# The budgets file is a JSON object with sizes in bytes, 0 disables a budget:
+#   {"total": 16777216, "image": 4194304, "mesh": 4194304, "animation": 2097152, "components": 1048576}
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+
+ANALYZER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "addons", "io_hubs_addon", "io", "size_analyzer.py")
+
+
+def load_size_analyzer():
+    # Load the module directly, importing it through the add-on package requires bpy
+    spec = importlib.util.spec_from_file_location("size_analyzer", ANALYZER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the size of exported Hubs scenes against budgets")
+    parser.add_argument("files", nargs="+", help="GLB or glTF files to analyze")
+    parser.add_argument("--budgets", default=None, help="JSON file with the budgets in bytes")
+    parser.add_argument("--report", default=None, help="Path of the JSON report, defaults to stdout")
+    args = parser.parse_args()
+
+    size_analyzer = load_size_analyzer()
+    budgets = None
+    if args.budgets:
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+
+    reports = [size_analyzer.get_size_report(size_analyzer.analyze_gltf_file(path), budgets) for path in args.files]
+    for report in reports:
+        for violation in report["violations"]:
+            print(f"{report['path']}: {violation}", file=sys.stderr)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(reports, f, indent=2)
+    else:
+        print(json.dumps(reports, indent=2))
+
+    return 0 if all(report["passed"] for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
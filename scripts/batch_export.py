@@ -0,0 +1,209 @@
+# Exports many .blend files with a pool of background Blender workers and writes a JSON report with the timing,
+# output size and errors of every file, and its size report for the files with size analysis after export enabled.
+# Files over their size budget are reported as failed.  The workers stay alive and export several files each, and use the same
+# export arguments as the scene debugger so the output matches the interactive exports.
+#
+# Usage:
+#   python batch_export.py <manifest.json> [--blender blender] [--workers 4] [--timeout 600] [--report report.json]
+#
+# Manifest format:
+#   {
+#     "output_dir": "out",          (optional, used for the files without an output path, defaults to the manifest dir)
+#     "format": "glb",              (optional, glb or gltf)
+#     "options": {"export_lights": true},   (optional, debugger room export options applied to every file)
+#     "files": [
+#       "rooms/lobby.blend",
+#       {"blend": "rooms/hall.blend", "output": "out/hall.glb", "options": {"use_visible": true}}
+#     ]
+#   }
+# Relative paths are resolved against the manifest directory.  The add-on is loaded from this repository unless
+# BLENDER_USER_SCRIPTS is already set.
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+# Must match io_hubs_addon.io.batch_export.BATCH_RESULT_PREFIX
+BATCH_RESULT_PREFIX = "HUBS_BATCH_RESULT "
+WORKER_EXPRESSION = "from io_hubs_addon.io.batch_export import run_batch_export_worker; run_batch_export_worker()"
+REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_manifest(manifest_path):
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    output_dir = os.path.join(base_dir, manifest.get("output_dir", ""))
+    extension = "." + manifest.get("format", "glb")
+    global_options = manifest.get("options", {})
+
+    jobs = []
+    for entry in manifest["files"]:
+        if isinstance(entry, str):
+            entry = {"blend": entry}
+        blend_path = os.path.join(base_dir, entry["blend"])
+        output_path = entry.get("output")
+        if output_path:
+            output_path = os.path.join(base_dir, output_path)
+        else:
+            output_path = os.path.join(output_dir, os.path.splitext(os.path.basename(blend_path))[0] + extension)
+        jobs.append({
+            "blend": blend_path,
+            "output": output_path,
+            "options": {**global_options, **entry.get("options", {})},
+        })
+
+    return jobs
+
+
+class BatchExportWorker:
+    def __init__(self, blender_path):
+        self.blender_path = blender_path
+        self.process = None
+        self.lines = None
+
+    def start(self):
+        env = dict(os.environ)
+        env.setdefault("BLENDER_USER_SCRIPTS", REPO_PATH)
+        self.process = subprocess.Popen(
+            [self.blender_path, "-b", "--factory-startup", "--addons", "io_hubs_addon", "-noaudio",
+             "--python-expr", WORKER_EXPRESSION],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env,
+            text=True, bufsize=1)
+        # Read the output in a thread so the jobs can time out
+        self.lines = queue.Queue()
+
+        def read_output(process, lines):
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+        threading.Thread(target=read_output, args=(self.process, self.lines), daemon=True).start()
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.write("\n")
+            self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except Exception:
+            self.process.kill()
+        self.process = None
+
+    def kill(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process = None
+
+    def export(self, job, timeout):
+        '''Sends the job to the worker and waits for its result.  The worker is restarted if it dies or times out.'''
+        if self.process is None:
+            self.start()
+
+        start = time.perf_counter()
+        log = []
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            while True:
+                remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty()
+                line = self.lines.get(timeout=remaining)
+                if line is None:
+                    raise BrokenPipeError()
+                if line.startswith(BATCH_RESULT_PREFIX):
+                    result = json.loads(line[len(BATCH_RESULT_PREFIX):])
+                    break
+                log.append(line)
+        except queue.Empty:
+            self.kill()
+            result = self.get_failed_result(job, f"Timed out after {timeout} seconds", log)
+        except (BrokenPipeError, OSError):
+            self.kill()
+            result = self.get_failed_result(job, "The Blender worker exited unexpectedly", log)
+
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def get_failed_result(self, job, error, log):
+        return {
+            "blend": job["blend"],
+            "output": job["output"],
+            "ok": False,
+            "error": error + "\n" + "".join(log[-50:]),
+            "load_seconds": 0.0,
+            "export_seconds": 0.0,
+            "size": 0,
+        }
+
+
+def run_batch_export(jobs, blender_path, workers, timeout):
+    pending_jobs = queue.Queue()
+    for index, job in enumerate(jobs):
+        pending_jobs.put((index, job))
+    results = [None] * len(jobs)
+
+    def run_worker():
+        worker = BatchExportWorker(blender_path)
+        try:
+            while True:
+                try:
+                    index, job = pending_jobs.get_nowait()
+                except queue.Empty:
+                    break
+                results[index] = worker.export(job, timeout)
+                status = "OK" if results[index]["ok"] else "FAILED"
+                print(f"{status} {job['blend']} ({results[index]['seconds']:.1f}s)", flush=True)
+        finally:
+            worker.stop()
+
+    threads = [threading.Thread(target=run_worker) for _ in range(min(workers, len(jobs)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export many .blend files with the Hubs add-on")
+    parser.add_argument("manifest", help="JSON manifest with the files to export")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of Blender worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="Maximum time in seconds per file")
+    parser.add_argument("--report", default=None, help="Path of the JSON report, defaults to stdout")
+    args = parser.parse_args()
+
+    jobs = load_manifest(args.manifest)
+    start = time.perf_counter()
+    results = run_batch_export(jobs, args.blender, max(1, args.workers), args.timeout)
+    failed = [result for result in results if not result["ok"]]
+
+    report = {
+        "workers": max(1, args.workers),
+        "total_seconds": time.perf_counter() - start,
+        "exported": len(results) - len(failed),
+        "failed": len(failed),
+        "total_size": sum(result["size"] for result in results),
+        "files": results,
+    }
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
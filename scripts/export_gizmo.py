@@ -1,9 +1,11 @@
-# Blender utility script to export a mesh in the Gizmo format.
+# Blender utility script to export a mesh in the Gizmo format: the world space vertices of its triangles packed as
+# little endian float32 (x, y, z) values, saved as addons/io_hubs_addon/components/models/<name>.bin
 # Usage:
 # Run Blender from the terminal.
 # Create a new script file, copy this script in the new file and run.
 
 import bpy
+import numpy as np
 
 from bpy.props import StringProperty
 from bpy_extras.io_utils import ImportHelper
@@ -11,20 +13,25 @@ from bpy.types import Operator
 
 
 def convert(objects):
-    '''Prints the model vertices in gizmo format and world space'''
-    out = 'SHAPE = ('
+    '''Returns the model triangle vertices in gizmo format and world space'''
+    shapes = []
     for ob in objects:
         if ob.type == 'MESH':
             mesh = ob.data
-            mat = ob.matrix_world
             mesh.calc_loop_triangles()
-            for tri in mesh.loop_triangles:
-                for i in range(3):
-                    v_index = tri.vertices[i]
-                    v = mat @ mesh.vertices[v_index].co
-                    out += '(%f, %f, %f),' % (v.x, v.y, v.z)
-    out += ')'
-    return out
+
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            mat = np.array(ob.matrix_world, dtype=np.float32)
+            co = co.reshape(-1, 3) @ mat[:3, :3].T + mat[:3, 3]
+
+            indices = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", indices)
+            shapes.append(co[indices])
+
+    if not shapes:
+        return np.empty((0, 3), dtype='<f4')
+    return np.concatenate(shapes).astype('<f4')
 
 
 class SaveGizmoOperator(Operator, ImportHelper):
@@ -33,17 +40,14 @@ class SaveGizmoOperator(Operator, ImportHelper):
     bl_label = "Save Gizmo"
 
     filter_glob: StringProperty(
-        default='*.py;',
+        default='*.bin;',
         options={'HIDDEN'}
     )
 
     def execute(self, context):
         """Save gizmo outout to a file."""
         gizmo = convert(context.selected_objects)
-
-        f = open(self.filepath, "w")
-        f.write(gizmo)
-        f.close()
+        gizmo.tofile(self.filepath)
 
         return {'FINISHED'}
 
@@ -0,0 +1,59 @@
+import bpy
+import sys
+import time
+
+# Measures the time it takes to register the components when the add-on is enabled, with and without the on demand
+# loading of the component definitions, and the time it takes to load the remaining definitions afterwards.  The
+# definition modules are removed from the module cache before every run so they are imported again.
+#
+# Usage: blender -b --factory-startup -noaudio --python addon_startup.py -- [runs]
+
+start = time.perf_counter()
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+print(f"First add-on enable (writes the component manifest): {time.perf_counter() - start:.3f} seconds")
+
+from io_hubs_addon.components import components_registry  # noqa: E402
+from io_hubs_addon.preferences import get_addon_pref  # noqa: E402
+
+DEFINITIONS_PACKAGE = "io_hubs_addon.components.definitions."
+
+
+def purge_definition_modules():
+    for module_name in list(sys.modules):
+        if module_name.startswith(DEFINITIONS_PACKAGE):
+            del sys.modules[module_name]
+
+
+def load_components(lazy):
+    get_addon_pref(bpy.context).lazy_component_loading = lazy
+    components_registry.unload_components_registry()
+    purge_definition_modules()
+
+    start = time.perf_counter()
+    components_registry.load_components_registry()
+    registration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    components_registry.get_components_registry()
+    deferred = time.perf_counter() - start
+    return registration, deferred
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    runs = int(argv[0]) if argv else 5
+
+    print("lazy\tregistration seconds\tdeferred loading seconds")
+    for lazy in [False, True]:
+        timings = [load_components(lazy) for _ in range(runs)]
+        registration = min(registration for registration, _ in timings)
+        deferred = min(deferred for _, deferred in timings)
+        print(f"{lazy}\t{registration:.4f}\t{deferred:.4f}")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
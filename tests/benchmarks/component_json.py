@@ -0,0 +1,73 @@
+import bpy
+import os
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Measures the peak Python memory and the JSON chunk size of the export of scenes with many identical components
+# (visible and shadow), with and without the compact components encoding.  The JSON chunk should be the same size
+# in both modes while the peak memory should be lower with the compact encoding.
+#
+# Usage: blender -b --factory-startup --addons io_hubs_addon -noaudio --python component_json.py -- [count ...]
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+from io_hubs_addon.components.utils import add_component  # noqa: E402
+
+
+def build_scene(count):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    for i in range(count):
+        ob = bpy.data.objects.new(f"object_{i}", None)
+        scene.collection.objects.link(ob)
+        add_component(ob, "visible")
+        add_component(ob, "shadow")
+
+
+def get_json_chunk_size(filepath):
+    with open(filepath, 'rb') as f:
+        f.seek(12)
+        chunk_length, _ = struct.unpack('<II', f.read(8))
+    return chunk_length
+
+
+def export_scene(filepath, compact):
+    bpy.context.scene.HubsComponentsExtensionProperties.compact_components = compact
+    args = {
+        'export_format': 'GLB',
+        'filepath': filepath,
+    }
+    if bpy.app.version >= (3, 2, 0):
+        args['use_active_scene'] = True
+    tracemalloc.start()
+    start = time.perf_counter()
+    bpy.ops.export_scene.gltf(**args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, get_json_chunk_size(filepath)
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    counts = [int(arg) for arg in argv] or [1000, 5000, 10000]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        print("components\tcompact\tseconds\tpeak MB\tJSON bytes")
+        for count in counts:
+            build_scene(count)
+            for compact in [False, True]:
+                filepath = os.path.join(output_dir, f"component_json_{count}_{compact}.glb")
+                elapsed, peak, json_size = export_scene(filepath, compact)
+                print(f"{count}\t{compact}\t{elapsed:.3f}\t{peak / (1024 * 1024):.2f}\t{json_size}")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,92 @@
+import bpy
+import os
+import resource
+import sys
+import tempfile
+import time
+
+# Measures the peak memory used while exporting a scene with many large HDR reflection probe environment maps.
+# The HDR files are generated in a separate Blender process so the export peak RSS isn't polluted by the generation.
+#
+# Usage:
+#   blender -b --factory-startup --addons io_hubs_addon -noaudio --python hdr_memory.py -- generate <dir> [count] [width]
+#   blender -b --factory-startup --addons io_hubs_addon -noaudio --python hdr_memory.py -- export <dir> [--materialize]
+#
+# --materialize reads the whole HDR files into memory like the exporter used to do, to compare against.
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+from io_hubs_addon.components.utils import add_component  # noqa: E402
+from io_hubs_addon.io.utils import HubsExportImage  # noqa: E402
+
+
+def generate(output_dir, count, width):
+    import numpy as np
+    height = width // 2
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        image = bpy.data.images.new(f"env_{i}", width, height, float_buffer=True)
+        # Noise doesn't compress with RLE so the files end up close to their uncompressed size
+        image.pixels.foreach_set(rng.random(width * height * 4, dtype=np.float32) * 4.0)
+        image.filepath_raw = os.path.join(output_dir, f"env_{i}.hdr")
+        image.file_format = 'HDR'
+        image.save()
+        bpy.data.images.remove(image)
+
+
+def materialize_hdr(self, image, export_settings=None):
+    with open(bpy.path.abspath(image.filepath_raw), 'rb') as f:
+        return f.read()
+
+
+def export(input_dir, materialize):
+    if materialize:
+        HubsExportImage.encode_from_image_hdr = materialize_hdr
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    probe_type = 'SPHERE' if bpy.app.version >= (4, 1, 0) else 'CUBE'
+    for i, file_name in enumerate(sorted(f for f in os.listdir(input_dir) if f.endswith(".hdr"))):
+        probe = bpy.data.objects.new(f"probe_{i}", bpy.data.lightprobes.new(f"probe_{i}", probe_type))
+        scene.collection.objects.link(probe)
+        add_component(probe, "reflection-probe")
+        probe.hubs_component_reflection_probe.envMapTexture = bpy.data.images.load(os.path.join(input_dir, file_name))
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        args = {
+            'export_format': 'GLB',
+            'filepath': os.path.join(output_dir, "hdr_memory.glb"),
+        }
+        if bpy.app.version >= (3, 2, 0):
+            args['use_active_scene'] = True
+        start = time.perf_counter()
+        bpy.ops.export_scene.gltf(**args)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(args['filepath'])
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_mb = max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+    print(f"mode: {'materialized' if materialize else 'mapped'}")
+    print(f"export time: {elapsed:.3f}s")
+    print(f"glb size: {size / (1024 * 1024):.1f}MB")
+    print(f"peak rss: {max_rss_mb:.1f}MB")
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    if argv[0] == "generate":
+        os.makedirs(argv[1], exist_ok=True)
+        generate(argv[1], int(argv[2]) if len(argv) > 2 else 8, int(argv[3]) if len(argv) > 3 else 4096)
+    elif argv[0] == "export":
+        export(argv[1], '--materialize' in argv)
+    else:
+        raise Exception(f"Unknown mode {argv[0]}")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,60 @@
+import bpy
+import os
+import sys
+import tempfile
+import time
+
+# Measures the export time of scenes with a growing number of node pointer components (audio-target).
+# The time per component should stay roughly constant as the number of components grows.
+#
+# Usage: blender -b --factory-startup --addons io_hubs_addon -noaudio --python node_pointers.py -- [count ...]
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+from io_hubs_addon.components.utils import add_component  # noqa: E402
+
+
+def build_scene(count):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    for i in range(count):
+        source = bpy.data.objects.new(f"source_{i}", None)
+        scene.collection.objects.link(source)
+        add_component(source, "audio-source")
+
+        target = bpy.data.objects.new(f"target_{i}", None)
+        scene.collection.objects.link(target)
+        add_component(target, "audio-target")
+        target.hubs_component_audio_target.srcNode = source
+
+
+def export_scene(filepath):
+    args = {
+        'export_format': 'GLB',
+        'filepath': filepath,
+    }
+    if bpy.app.version >= (3, 2, 0):
+        args['use_active_scene'] = True
+    start = time.perf_counter()
+    bpy.ops.export_scene.gltf(**args)
+    return time.perf_counter() - start
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    counts = [int(arg) for arg in argv] or [250, 500, 1000, 2000]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        print("components\tseconds\tms/component")
+        for count in counts:
+            build_scene(count)
+            elapsed = export_scene(os.path.join(output_dir, f"node_pointers_{count}.glb"))
+            print(f"{count}\t{elapsed:.3f}\t{elapsed * 1000 / count:.3f}")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
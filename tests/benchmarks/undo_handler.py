@@ -0,0 +1,56 @@
+import bpy
+import sys
+import time
+
+# Measures the cost per depsgraph update of the undo stack handler when the undo stack hasn't changed (e.g. while
+# moving objects around), against the cost of dumping the undo stack on every update like it used to do.
+#
+# Usage: blender -b --factory-startup --addons io_hubs_addon -noaudio --python undo_handler.py -- [objects] [steps] [updates]
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+from io_hubs_addon.components import handlers  # noqa: E402
+
+
+def build_scene(object_count, step_count):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    for i in range(object_count):
+        ob = bpy.data.objects.new(f"object_{i}", None)
+        scene.collection.objects.link(ob)
+    for i in range(step_count):
+        bpy.context.scene.frame_current = i
+        bpy.ops.ed.undo_push(message=f"Step {i}")
+
+
+def time_updates(function, update_count):
+    start = time.perf_counter()
+    for _ in range(update_count):
+        function()
+    return (time.perf_counter() - start) / update_count
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    object_count = int(argv[0]) if len(argv) > 0 else 10000
+    step_count = int(argv[1]) if len(argv) > 1 else 32
+    update_count = int(argv[2]) if len(argv) > 2 else 1000
+
+    build_scene(object_count, step_count)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    handlers.file_loading = False
+    handlers.previous_undo_stack_fingerprint = handlers.get_undo_stack_fingerprint(bpy.context)
+
+    unchanged = time_updates(lambda: handlers.undo_stack_handler(None, depsgraph), update_count)
+    dump = time_updates(lambda: handlers.dump_undo_steps(bpy.context), update_count)
+
+    print("objects\tundo steps\tunchanged stack us/update\tundo stack dump us/update")
+    print(f"{object_count}\t{step_count}\t{unchanged * 1e6:.1f}\t{dump * 1e6:.1f}")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
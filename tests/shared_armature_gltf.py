@@ -0,0 +1,47 @@
+import bpy
+import os
+import sys
+
+# Builds a scene with two armature objects sharing the same armature data, with a networked component on its bone,
+# and exports it.  The scene is built here instead of being stored in a .blend file so it can be read by every
+# supported Blender version.
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+from io_hubs_addon.components.utils import add_component  # noqa: E402
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    output_dir = argv[0]
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    scene = bpy.context.scene
+    for ob in list(scene.objects):
+        bpy.data.objects.remove(ob)
+
+    armature = bpy.data.armatures.new("Armature")
+    armature_objects = []
+    for name in ["First", "Second"]:
+        ob = bpy.data.objects.new(name, armature)
+        scene.collection.objects.link(ob)
+        armature_objects.append(ob)
+    armature_objects[1].location = (2, 0, 0)
+
+    bpy.context.view_layer.objects.active = armature_objects[0]
+    bpy.ops.object.mode_set(mode='EDIT')
+    bone = armature.edit_bones.new("Bone")
+    bone.tail = (0, 0, 1)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    add_component(armature.bones["Bone"], "networked")
+
+    bpy.ops.export_scene.gltf(export_format='GLTF_SEPARATE', filepath=os.path.join(output_dir, "shared-armature.gltf"))
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
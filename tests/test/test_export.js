@@ -973,6 +973,74 @@ describe('Exporter', function () {
         assert.deepStrictEqual(ext['image'], { "controls": true, src: 'https://hubs.mozilla.com' });
         assert.strictEqual(utils.UUID_REGEX.test(ext['networked']['id']), true);
       });
+
+      it('can export lod', function () {
+        let gltfPath = path.resolve(outDirPath, 'lod.gltf');
+        const asset = JSON.parse(fs.readFileSync(gltfPath));
+
+        assert.strictEqual(asset.extensionsUsed.includes('MOZ_hubs_components'), true);
+        assert.strictEqual(asset.extensionsUsed.includes('MSFT_lod'), true);
+        assert.strictEqual(utils.checkExtensionAdded(asset, 'MOZ_hubs_components'), true);
+
+        const { node } = utils.nodeWithName(asset, 'Sphere');
+        assert.strictEqual(utils.checkExtensionAdded(node, 'MOZ_hubs_components'), true);
+        assert.strictEqual(utils.checkExtensionAdded(node, 'MSFT_lod'), true);
+
+        const ext = node.extensions['MOZ_hubs_components'];
+        assert.deepStrictEqual(ext['lod'], { distances: [10, 25] });
+
+        const ids = node.extensions['MSFT_lod']['ids'];
+        assert.strictEqual(ids.length, 2);
+        assert.deepStrictEqual(ids.map(id => asset.nodes[id].name), ['Sphere_LOD1', 'Sphere_LOD2']);
+        assert.strictEqual(node.extras['MSFT_screencoverage'].length, ids.length + 1);
+
+        ids.forEach(id => {
+          const lodNode = asset.nodes[id];
+          assert.strictEqual(lodNode.mesh !== undefined, true);
+          assert.notStrictEqual(lodNode.mesh, node.mesh);
+          assert.strictEqual(asset.meshes[lodNode.mesh].primitives.length > 0, true);
+        });
+      });
+    });
+
+    describe(blenderVersion + '_export_determinism', function () {
+      it('exports the same bytes twice', function (done) {
+        const scene = 'link';
+        const blenderPath = `scenes/${scene}.blend`;
+        const outDirPaths = ['first', 'second'].map(name => path.resolve(OUT_PREFIX, 'determinism', name));
+        utils.blenderFileToGltf(blenderVersion, blenderPath, outDirPaths[0], (error) => {
+          if (error)
+            return done(error);
+
+          utils.blenderFileToGltf(blenderVersion, blenderPath, outDirPaths[1], (error) => {
+            if (error)
+              return done(error);
+
+            const [first, second] = outDirPaths.map(outDirPath => fs.readFileSync(path.resolve(outDirPath, `${scene}.glb`)));
+            assert.strictEqual(Buffer.compare(first, second), 0);
+            done();
+          }, '--glb');
+        }, '--glb');
+      });
+
+      it('gives the bones of armature objects sharing their armature different ids', function (done) {
+        const outDirPath = path.resolve(OUT_PREFIX, 'determinism', 'shared-armature');
+        utils.blenderScriptToGltf(blenderVersion, 'shared_armature_gltf.py', outDirPath, (error) => {
+          if (error)
+            return done(error);
+
+          const asset = JSON.parse(fs.readFileSync(path.resolve(outDirPath, 'shared-armature.gltf')));
+          const ids = asset.nodes.filter(node => node.name === 'Bone').map(node => {
+            assert.strictEqual(utils.checkExtensionAdded(node, 'MOZ_hubs_components'), true);
+            const id = node.extensions['MOZ_hubs_components']['networked']['id'];
+            assert.strictEqual(utils.UUID_REGEX.test(id), true);
+            return id;
+          });
+          assert.strictEqual(ids.length, 2);
+          assert.notStrictEqual(ids[0], ids[1]);
+          done();
+        });
+      });
     });
   });
 });
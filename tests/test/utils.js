@@ -33,6 +33,21 @@ function blenderRoundtripGltf(blenderVersion, gltfPath, outDirName, done, option
   });
 }
 
+function blenderScriptToGltf(blenderVersion, scriptPath, outDirName, done, options = '') {
+  const { exec } = require('child_process');
+  const cmd = `${blenderVersion} -b --factory-startup --addons io_hubs_addon -noaudio --python ${scriptPath} -- ${outDirName} ${options}`;
+  var prc = exec(cmd, (error, stdout, stderr) => {
+    //if (stderr) process.stderr.write(stderr);
+
+    if (error) {
+      console.log(stdout);
+      done(error);
+      return;
+    }
+    done();
+  });
+}
+
 function validateGltf(gltfPath, done) {
   const asset = fs.readFileSync(gltfPath);
   validator.validateBytes(new Uint8Array(asset), {
@@ -93,6 +108,7 @@ exports.utils = {
   UUID_REGEX,
   blenderFileToGltf,
   blenderRoundtripGltf,
+  blenderScriptToGltf,
   validateGltf,
   checkExtensionAdded,
   nodeWithName,